@@ -0,0 +1,66 @@
+# 📊 벤치마크: AsyncGPTNewsSummarizer 지연 시간(p50/p95)과 처리량 (로컬 가짜 OpenAI 서버 대상)
+# 실행: python -m benchmarks.bench_async_summarizer
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from benchmarks.fake_servers import FakeOpenAIServer
+from benchmarks.stats import percentile
+from summaries.async_summarizer import AsyncGPTNewsSummarizer
+from utils.http_transport import AsyncHTTPTransport, HTTPTransportConfig
+
+ARTICLE = "정부가 내년부터 전세사기 피해자 지원을 위한 특별법을 시행한다. " * 20
+
+async def run(requests: int, concurrency: int, stream: bool, latency: float) -> None:
+    latencies: List[float] = []
+    first_partials: List[float] = []
+
+    async with FakeOpenAIServer(latency=latency) as server:
+        config = HTTPTransportConfig(connections_per_host=concurrency, total_connections=concurrency)
+        async with AsyncHTTPTransport(config) as transport:
+            summarizer = AsyncGPTNewsSummarizer(
+                api_key="bench",
+                base_url=server.api_base,
+                transport=transport,
+                max_concurrency=concurrency,
+                stream=stream
+            )
+
+            async def one() -> None:
+                started = time.perf_counter()
+                first: Optional[float] = None
+
+                def on_partial(partial) -> None:
+                    nonlocal first
+                    if first is None and partial.summary:
+                        first = time.perf_counter() - started
+
+                await summarizer.asummarize(ARTICLE, on_partial=on_partial)
+                latencies.append(time.perf_counter() - started)
+                if first is not None:
+                    first_partials.append(first)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+
+    line = (
+        f"{'stream' if stream else 'block ':6} | 동시성 {concurrency:>3} | "
+        f"p50 {percentile(latencies, 50) * 1000:7.1f}ms | p95 {percentile(latencies, 95) * 1000:7.1f}ms | "
+        f"{requests / elapsed:7.1f} req/s"
+    )
+    if first_partials:
+        line += f" | 첫 요약 p50 {percentile(first_partials, 50) * 1000:7.1f}ms"
+    print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    for stream in (False, True):
+        for concurrency in (1, 4, 16, 64):
+            asyncio.run(run(args.requests, concurrency, stream, args.latency))
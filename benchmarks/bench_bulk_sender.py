@@ -0,0 +1,48 @@
+# 📊 벤치마크: KakaoBulkSender 처리량 (로컬 가짜 카카오 서버 대상)
+# 실행: python -m benchmarks.bench_bulk_sender
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.fake_servers import FakeKakaoServer
+from messenger.bulk_sender import KakaoBulkSender
+from messenger.message_formatter import FormattedMessage
+from utils.http_transport import AsyncHTTPTransport, HTTPTransportConfig
+
+async def run(recipients: int, concurrency: int, rate: float, server_limit: float, latency: float) -> None:
+    message = FormattedMessage(title="벤치마크", content="대량 발송 벤치마크 메시지입니다.")
+    uuids = [f"uuid-{i}" for i in range(recipients)]
+
+    async with FakeKakaoServer(latency=latency, rate_limit_per_second=server_limit) as server:
+        config = HTTPTransportConfig(connections_per_host=concurrency)
+        async with AsyncHTTPTransport(config) as transport:
+            sender = KakaoBulkSender(
+                api_key="bench",
+                base_url=server.send_url,
+                transport=transport,
+                concurrency=concurrency,
+                rate_per_second=rate,
+                backoff_base=0.05
+            )
+            started = time.perf_counter()
+            results = await sender.send_bulk(message, uuids)
+            elapsed = time.perf_counter() - started
+
+    succeeded = sum(result.success for result in results)
+    retried = sum(result.attempts > 1 for result in results)
+    print(
+        f"수신자 {recipients:>6} | 동시성 {concurrency:>3} | 속도 제한 {rate:>6.0f}/s | "
+        f"{elapsed:6.2f}s | {succeeded / elapsed:8.0f} 명/s | "
+        f"성공 {succeeded} | 재시도 수신자 {retried} | 요청 {server.requests} (429: {server.rejected})"
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipients", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--server-limit", type=float, default=500)
+    args = parser.parse_args()
+
+    for concurrency, rate in [(1, 1000), (8, 1000), (32, 1000), (32, 400), (64, 2000)]:
+        asyncio.run(run(args.recipients, concurrency, rate, args.server_limit, args.latency))
@@ -0,0 +1,157 @@
+# 📊 벤치마크: 일주일치 기사 + 요약을 메모리에 들고 있을 때의 크기와 직렬화 비용
+# - 기존 모델(인스턴스 __dict__, 기사마다 새 키워드 리스트), slots 모델, Compact*(frozen + intern) 비교
+# - 직렬화: pickle, JSON(summary_cache 형식), utils.compact_models.pack
+# 실행: python -m benchmarks.bench_compact_models --articles 20000
+
+import argparse
+import gc
+import json
+import pickle
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+from crawler.naver_ranking_crawler import NewsArticle
+from summaries.news_summarizer import KeywordDetail, SummaryResult
+from utils.compact_models import CompactArticle, CompactSummary, pack, unpack
+
+CATEGORIES = ["경제", "사회", "정치", "국제", "IT/과학", "생활/문화"]
+KEYWORDS = [f"용어{i}" for i in range(400)]
+
+# 변경 전 모델 (비교용)
+@dataclass
+class LegacyNewsArticle:
+    title: str
+    link: str
+    category: str = "일반"
+    summary: str = ""
+    keywords: List[str] = None
+
+    def __post_init__(self):
+        if self.keywords is None:
+            self.keywords = []
+
+@dataclass
+class LegacyKeywordDetail:
+    explanation: str
+    example: str
+
+@dataclass
+class LegacySummaryResult:
+    summary: str
+    keywords: List[str]
+    keyword_details: Dict[str, LegacyKeywordDetail]
+
+def make_records(count: int, seed: int = 0) -> List[dict]:
+    # 크롤링/JSON에서 읽은 것처럼 매번 새 문자열 객체를 만듦
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        keywords = rng.sample(KEYWORDS, 3)
+        records.append({
+            "title": f"기사 제목 {i} " + "가나다라" * rng.randint(2, 6),
+            "link": f"https://n.news.naver.com/article/052/{2000000 + i:010d}",
+            "category": "".join(rng.choice(CATEGORIES)),
+            "summary": f"요약 {i} " + "전세 사기 피해 대책 " * rng.randint(3, 8),
+            "keywords": ["".join(keyword) for keyword in keywords],
+            "details": {
+                "".join(keyword): (f"{keyword}의 뜻을 쉽게 풀어 쓴 설명", f"{keyword}이(가) 기사에 쓰인 예시 문장")
+                for keyword in keywords
+            },
+        })
+    return records
+
+def build_legacy(records: List[dict]) -> list:
+    return [
+        (
+            LegacyNewsArticle(title=r["title"], link=r["link"], category=r["category"]),
+            LegacySummaryResult(
+                summary=r["summary"],
+                keywords=list(r["keywords"]),
+                keyword_details={k: LegacyKeywordDetail(*v) for k, v in r["details"].items()}
+            ),
+        )
+        for r in records
+    ]
+
+def build_slotted(records: List[dict]) -> list:
+    return [
+        (
+            NewsArticle(title=r["title"], link=r["link"], category=r["category"]),
+            SummaryResult(
+                summary=r["summary"],
+                keywords=list(r["keywords"]),
+                keyword_details={k: KeywordDetail(*v) for k, v in r["details"].items()}
+            ),
+        )
+        for r in records
+    ]
+
+def build_compact(records: List[dict]) -> list:
+    # 용어집처럼 같은 키워드 설명 객체를 공유
+    details: Dict[tuple, KeywordDetail] = {}
+    return [
+        (
+            CompactArticle.from_article(NewsArticle(title=r["title"], link=r["link"], category=r["category"])),
+            CompactSummary.from_result(SummaryResult(
+                summary=r["summary"],
+                keywords=r["keywords"],
+                keyword_details={k: details.setdefault(v, KeywordDetail(*v)) for k, v in r["details"].items()}
+            )),
+        )
+        for r in records
+    ]
+
+def measure_memory(builder: Callable[[List[dict]], list], records: List[dict]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = builder(records)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+def timed(fn: Callable, repeat: int = 3) -> tuple:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def legacy_json_dumps(pairs: list) -> bytes:
+    return json.dumps([[asdict(article), asdict(summary)] for article, summary in pairs], ensure_ascii=False).encode("utf-8")
+
+def flatten(pairs: list) -> list:
+    return [item for pair in pairs for item in pair]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=20000)
+    args = parser.parse_args()
+
+    records = make_records(args.articles)
+    print(f"기사 + 요약 {args.articles}쌍 메모리 (문자열 포함, 입력 레코드 제외)")
+    for label, builder in (("기존 dataclass", build_legacy), ("slots", build_slotted), ("Compact (frozen+intern)", build_compact)):
+        size = measure_memory(builder, records)
+        print(f"  {label:24} {size / 1024 / 1024:7.2f}MB  ({size / args.articles:6.0f} B/쌍)")
+
+    legacy, slotted, compact = build_legacy(records), build_slotted(records), build_compact(records)
+    print("\n직렬화 (최소 시간 / 크기)")
+    cases = (
+        ("pickle 기존", lambda: pickle.dumps(legacy, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("pickle slots", lambda: pickle.dumps(slotted, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("pickle Compact", lambda: pickle.dumps(compact, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("JSON asdict", lambda: legacy_json_dumps(legacy), json.loads),
+        ("pack slots", lambda: pack(flatten(slotted)), unpack),
+        ("pack Compact", lambda: pack(flatten(compact)), unpack),
+    )
+    for label, dump, load in cases:
+        dump_seconds, payload = timed(dump)
+        load_seconds, _ = timed(lambda: load(payload))
+        print(
+            f"  {label:16} 직렬화 {dump_seconds * 1000:7.1f}ms | 역직렬화 {load_seconds * 1000:7.1f}ms | "
+            f"{len(payload) / 1024 / 1024:6.2f}MB"
+        )
@@ -0,0 +1,90 @@
+# 📊 벤치마크: 정각 일괄 발송 vs 시간대 분산 발송 (로컬 가짜 카카오 서버, 초당 요청 한도 있음)
+# - 두 발송 슬롯(지금+1초, 지금+3초)의 구독자에게 보내고 목표 시각 대비 발송 완료 시각 차이(skew)와 429 수 비교
+# 실행: python -m benchmarks.bench_delivery_scheduler --subscribers 4000 --server-limit 100
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.fake_servers import FakeKakaoServer
+from benchmarks.stats import percentile
+from messenger.bulk_sender import KakaoBulkSender
+from messenger.message_formatter import FormattedMessage
+from subscriptions.delivery_scheduler import DeliveryScheduler
+from subscriptions.digest_planner import DigestPlan
+from utils.http_transport import AsyncHTTPTransport, HTTPTransportConfig
+
+CATEGORY_GROUPS = [("경제",), ("사회",), ("경제", "정치"), ("국제", "사회")]
+
+def make_plans(subscribers: int, targets: List[float]) -> Dict[float, List[DigestPlan]]:
+    plans: Dict[float, List[DigestPlan]] = {target: [] for target in targets}
+    for i, categories in enumerate(CATEGORY_GROUPS * len(targets)):
+        target = targets[i % len(targets)]
+        count = subscribers // (len(CATEGORY_GROUPS) * len(targets))
+        plans[target].append(DigestPlan(
+            categories=categories,
+            articles=[],
+            receiver_uuids=[f"uuid-{i}-{n}" for n in range(count)],
+            message=FormattedMessage(title="오늘의 뉴스", content=f"{'·'.join(categories)} 다이제스트")
+        ))
+    return plans
+
+def print_row(label: str, skews: List[float], succeeded: int, server: FakeKakaoServer, elapsed: float) -> None:
+    print(
+        f"{label:10} | 성공 {succeeded:>6} | skew p50 {percentile(skews, 50):6.2f}s p95 {percentile(skews, 95):6.2f}s "
+        f"최대 {max(skews):6.2f}s | 요청 {server.requests:>5} (429: {server.rejected:>5}) | {elapsed:6.2f}s"
+    )
+
+async def burst(subscribers: int, server_limit: float, batch_size: int) -> None:
+    # 기존 방식: 슬롯 시각에 모든 다이제스트를 동시에 발송 (발송기는 서버 한도를 모름)
+    async with FakeKakaoServer(latency=0.02, rate_limit_per_second=server_limit, max_receivers=batch_size) as server:
+        async with AsyncHTTPTransport(HTTPTransportConfig(connections_per_host=32)) as transport:
+            sender = KakaoBulkSender(
+                api_key="bench", base_url=server.send_url, transport=transport,
+                batch_size=batch_size, concurrency=32, rate_per_second=server_limit * 10, backoff_base=0.05
+            )
+            started = time.time()
+            targets = [started + 1, started + 3]
+            plans = make_plans(subscribers, targets)
+            skews: List[float] = []
+            succeeded = 0
+
+            async def slot(target: float) -> None:
+                nonlocal succeeded
+                await asyncio.sleep(max(0.0, target - time.time()))
+                for results in await asyncio.gather(*(sender.send_bulk(plan.message, plan.receiver_uuids) for plan in plans[target])):
+                    succeeded += sum(result.success for result in results)
+                    skews.extend([time.time() - target] * len(results))
+
+            await asyncio.gather(*(slot(target) for target in targets))
+            print_row("정각 일괄", skews, succeeded, server, time.time() - started)
+
+async def scheduled(subscribers: int, server_limit: float, batch_size: int, tick: float, early: float) -> None:
+    async with FakeKakaoServer(latency=0.02, rate_limit_per_second=server_limit, max_receivers=batch_size) as server:
+        async with AsyncHTTPTransport(HTTPTransportConfig(connections_per_host=32)) as transport:
+            sender = KakaoBulkSender(
+                api_key="bench", base_url=server.send_url, transport=transport,
+                batch_size=batch_size, concurrency=32, rate_per_second=server_limit, backoff_base=0.05
+            )
+            scheduler = DeliveryScheduler(
+                rate_per_second=server_limit, batch_size=batch_size, tick_seconds=tick, max_early_seconds=early
+            )
+            started = time.time()
+            # 미리 계획: 발송 창이 열리기 전에 배정까지 끝냄
+            schedule = scheduler.assign(make_plans(subscribers, [started + 1, started + 3]))
+            report = await scheduler.run(schedule, sender)
+            summary = report.summary()
+            print_row(f"분산 e={early:g}s", report.skews, summary["succeeded"], server, time.time() - started)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=4000)
+    parser.add_argument("--server-limit", type=float, default=100)
+    parser.add_argument("--batch-size", type=int, default=5)
+    parser.add_argument("--tick", type=float, default=0.5)
+    args = parser.parse_args()
+
+    asyncio.run(burst(args.subscribers, args.server_limit, args.batch_size))
+    for early in (0.0, 1.0):
+        asyncio.run(scheduled(args.subscribers, args.server_limit, args.batch_size, args.tick, early))
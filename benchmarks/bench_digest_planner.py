@@ -0,0 +1,50 @@
+# 📊 벤치마크: 구독자 10만 명 다이제스트 계획 (선호 조합별 그룹화)
+# 실행: python -m benchmarks.bench_digest_planner
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from crawler.naver_ranking_crawler import NewsArticle
+from subscriptions.digest_planner import DigestPlanner
+from subscriptions.subscription_store import Subscriber, SubscriptionStore
+
+CATEGORIES = ["경제", "사회", "정치", "국제"]
+SLOTS = ["07:00", "07:30", "08:00", "08:30"]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SubscriptionStore(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+
+        started = time.perf_counter()
+        store.upsert_many(
+            Subscriber(
+                kakao_uuid=f"uuid-{i}",
+                categories=rng.sample(CATEGORIES, rng.randint(1, len(CATEGORIES))),
+                send_slot=rng.choice(SLOTS)
+            )
+            for i in range(args.subscribers)
+        )
+        print(f"구독자 {len(store)}명 저장: {time.perf_counter() - started:.2f}s")
+
+        articles = [
+            NewsArticle(title=f"기사 {i}", link=f"https://n.news.naver.com/article/052/{i}", category=CATEGORIES[i % 4])
+            for i in range(40)
+        ]
+        planner = DigestPlanner(store)
+        started = time.perf_counter()
+        plans = [plan for slot in store.send_slots() for plan in planner.plan(slot, articles)]
+        elapsed = time.perf_counter() - started
+        receivers = sum(len(plan.receiver_uuids) for plan in plans)
+        print(
+            f"계획: {elapsed * 1000:.1f}ms | 고유 다이제스트 {len(plans)}개 | 수신자 {receivers}명 | "
+            f"요약할 기사 {len(planner.unique_articles(plans))}건"
+        )
+        store.close()
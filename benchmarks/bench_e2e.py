@@ -0,0 +1,337 @@
+# 📊 벤치마크: 크롤링 → 본문 추출 → 요약(NewsPipeline) → 다이제스트 계획/렌더링 → 대량 발송 전체 흐름 (로컬 가짜 서버 대상)
+# 실행: python -m benchmarks.bench_e2e [--scales 10,1k,1kx100k] [--pages 저장한_HTML_디렉터리] [--baseline 이전_결과.json]
+# - 가짜 네이버/OpenAI/카카오 서버는 별도 프로세스, 규모마다 새 프로세스에서 측정 (최대 RSS가 섞이지 않도록)
+# - 단계별 지연 시간 백분위는 utils.metrics 히스토그램에서 읽음
+# - 결과는 benchmarks/results/<시각>-<커밋>.json 으로 저장하고 직전 결과와 비교
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+CATEGORIES = ["경제", "사회", "정치", "국제"]
+SLOTS = ["07:00", "08:00"]
+# 결과 보고서에 남길 계측 구간 (utils.metrics span 이름)
+REPORTED_STAGES = ["crawl.fetch", "crawl.parse", "pipeline.extract", "extract", "pipeline.summarize", "openai", "format", "send"]
+
+@dataclass
+class BenchOptions:
+    per_page: int = 20
+    naver_latency: float = 0.0
+    openai_latency: float = 0.05
+    kakao_latency: float = 0.005
+    kakao_rate_limit: Optional[float] = None
+    kakao_rate: float = 5000.0
+    crawl_concurrency: int = 8
+    extract_concurrency: int = 16
+    summarize_concurrency: int = 32
+    send_concurrency: int = 64
+    pages: Optional[str] = None
+
+class RewritingHTTPClient:
+    """
+    네이버 호스트로 가는 요청을 가짜 서버로 돌리는 HTTPClient (크롤러/추출기는 실제 URL을 그대로 사용)
+    """
+    def __init__(self, http_client, base_url: str, hosts: Tuple[str, ...] = ("media.naver.com", "n.news.naver.com")):
+        self.http_client = http_client
+        self.target = urlsplit(base_url)
+        self.hosts = hosts
+
+    def _rewrite(self, url: str) -> str:
+        parts = urlsplit(url)
+        if parts.netloc not in self.hosts:
+            return url
+        return urlunsplit((self.target.scheme, self.target.netloc, parts.path, parts.query, parts.fragment))
+
+    def get(self, url: str, headers: dict):
+        return self.http_client.get(self._rewrite(url), headers=headers)
+
+    def stream(self, url: str, headers: dict):
+        return self.http_client.stream(self._rewrite(url), headers=headers)
+
+def parse_scale(text: str) -> Tuple[int, int]:
+    # "1k" → (1000, 1000), "1kx100k" → (기사 1000, 구독자 100000)
+    def number(value: str) -> int:
+        value = value.strip().lower()
+        for suffix, factor in (("k", 1000), ("m", 1000000)):
+            if value.endswith(suffix):
+                return int(float(value[:-1]) * factor)
+        return int(value)
+
+    articles, _, subscribers = text.partition("x")
+    return number(articles), number(subscribers or articles)
+
+def _serve_fakes(conn, options: BenchOptions) -> None:
+    from benchmarks.fake_servers import FakeKakaoServer, FakeNaverServer, FakeOpenAIServer
+    from benchmarks.fixtures import load_pages
+
+    async def main() -> None:
+        recorded = load_pages(options.pages) if options.pages else None
+        naver = FakeNaverServer(latency=options.naver_latency, per_page=options.per_page, recorded=recorded)
+        llm = FakeOpenAIServer(latency=options.openai_latency, token_interval=0)
+        kakao = FakeKakaoServer(latency=options.kakao_latency, rate_limit_per_second=options.kakao_rate_limit)
+        async with naver, llm, kakao:
+            conn.send({"naver": naver.base_url, "openai": llm.api_base, "kakao": kakao.send_url})
+            # 측정 프로세스가 끝났다고 알릴 때까지 대기
+            await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+            conn.send({
+                "naver_requests": naver.requests,
+                "naver_bytes": naver.bytes_sent,
+                "openai_requests": llm.requests,
+                "kakao_requests": kakao.requests,
+                "kakao_rejected": kakao.rejected,
+                "kakao_delivered": kakao.delivered,
+            })
+
+    asyncio.run(main())
+
+def _measure_scale(queue, articles: int, subscribers: int, urls: Dict[str, str], options: BenchOptions) -> None:
+    try:
+        queue.put(asyncio.run(_run_scale(articles, subscribers, urls, options)))
+    except Exception as e:
+        queue.put({"error": repr(e)})
+
+async def _run_scale(articles: int, subscribers: int, urls: Dict[str, str], options: BenchOptions) -> dict:
+    from crawler.crawl_engine import NaverCrawlEngine
+    from messenger.bulk_sender import KakaoBulkSender
+    from pipeline.news_pipeline import NewsPipeline, PipelineConfig
+    from subscriptions.digest_planner import DigestPlanner
+    from subscriptions.subscription_store import Subscriber, SubscriptionStore
+    from summaries.async_summarizer import AsyncGPTNewsSummarizer
+    from utils.article_extractor import extract_article
+    from utils.http_transport import AsyncHTTPTransport, HTTPTransportConfig, PooledHTTPClient
+    from utils.metrics import metrics
+
+    metrics.enabled = True
+    metrics.max_spans = 0
+    metrics.reset()
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    phases: Dict[str, dict] = {}
+
+    def record(name: str, started: float, items: int) -> None:
+        seconds = time.perf_counter() - started
+        phases[name] = {"seconds": round(seconds, 4), "items": items, "per_second": round(items / seconds, 1) if seconds else 0.0}
+
+    connections = max(options.extract_concurrency, options.summarize_concurrency, options.send_concurrency)
+    config = HTTPTransportConfig(total_connections=connections * 2, connections_per_host=connections)
+    with PooledHTTPClient(config) as pooled, tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        async with AsyncHTTPTransport(config) as transport:
+            http_client = RewritingHTTPClient(pooled, urls["naver"])
+            sender = KakaoBulkSender(
+                api_key="bench",
+                base_url=urls["kakao"],
+                transport=transport,
+                concurrency=options.send_concurrency,
+                rate_per_second=options.kakao_rate
+            )
+            # main.py와 같은 NewsPipeline에 가짜 서버만 생성자 인자로 주입 (언론사 하나당 랭킹 기사 per_page개)
+            presses = [f"{i:04d}" for i in range(-(-articles // options.per_page))]
+            pipeline = NewsPipeline(
+                source=NaverCrawlEngine(
+                    http_client,
+                    press_ids=presses,
+                    max_workers=options.crawl_concurrency,
+                    per_list_limit=options.per_page,
+                    host_concurrency=options.crawl_concurrency,
+                    host_min_interval_seconds=0
+                ),
+                summarizer=AsyncGPTNewsSummarizer(
+                    api_key="bench",
+                    base_url=urls["openai"],
+                    transport=transport,
+                    max_concurrency=options.summarize_concurrency
+                ),
+                sender=sender,
+                receiver_uuids=[],
+                extractor=partial(extract_article, http_client=http_client),
+                config=PipelineConfig(
+                    queue_size=connections,
+                    extract_concurrency=options.extract_concurrency,
+                    summarize_concurrency=options.summarize_concurrency,
+                    send_concurrency=options.send_concurrency
+                ),
+                http_client=http_client
+            )
+            total_started = time.perf_counter()
+
+            # 1~3. 크롤링 → 본문 추출 → 요약: 미리 계산 모드처럼 발송 단계 없이 파이프라인 실행 (기사별 로그는 버림)
+            with contextlib.redirect_stdout(devnull):
+                started = time.perf_counter()
+                crawled = await pipeline.crawl(articles)
+                record("crawl", started, len(crawled))
+                started = time.perf_counter()
+                results = await pipeline.process(crawled, send=False)
+            summaries = {item.article.link: item.summary for item in results if not item.error and item.summary}
+            record("extract_summarize", started, len(summaries))
+            pipeline_seconds = time.perf_counter() - total_started
+
+            # 4. 구독자 저장 (측정 준비 단계)
+            rng = random.Random(0)
+            store = SubscriptionStore(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+            started = time.perf_counter()
+            store.upsert_many(
+                Subscriber(
+                    kakao_uuid=f"uuid-{i}",
+                    categories=rng.sample(CATEGORIES, rng.randint(1, len(CATEGORIES))),
+                    send_slot=rng.choice(SLOTS)
+                )
+                for i in range(subscribers)
+            )
+            record("subscribe", started, subscribers)
+
+            # 5. 다이제스트 계획 + 렌더링 (파이프라인의 포맷터 사용)
+            planner = DigestPlanner(store)
+            summarized = [article for article in crawled if article.link in summaries]
+            started = time.perf_counter()
+            plans = [plan for slot in store.send_slots() for plan in planner.plan(slot, summarized)]
+            planner.render(plans, summaries, pipeline.formatter)
+            record("plan_render", started, len(plans))
+
+            # 6. 대량 발송 (처리량 측정용으로 슬롯 시각을 기다리지 않고 바로 발송)
+            started = time.perf_counter()
+            deliveries = await planner.deliver(plans, sender)
+            delivered = sum(1 for result in deliveries if result.success)
+            record("deliver", started, delivered)
+            store.close()
+
+    report = metrics.report()
+    latency = {
+        histogram["labels"]["stage"]: {key: histogram[key] for key in ("count", "p50", "p95", "max")}
+        for histogram in report["histograms"]
+        if histogram["name"].endswith("_stage_seconds") and histogram["labels"].get("stage") in REPORTED_STAGES
+    }
+    return {
+        "articles": articles,
+        "subscribers": subscribers,
+        "crawled": len(crawled),
+        "digests": len(plans),
+        "delivered": delivered,
+        "failed_deliveries": len(deliveries) - delivered,
+        "pipeline_seconds": round(pipeline_seconds, 4),
+        "phases": phases,
+        "latency_seconds": latency,
+        "rss_start_mb": round(rss_start / 1024 / 1024, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 / 1024 / 1024, 1),
+    }
+
+def run_scale(articles: int, subscribers: int, options: BenchOptions) -> dict:
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    server = context.Process(target=_serve_fakes, args=(child_conn, options), daemon=True)
+    server.start()
+    urls = parent_conn.recv()
+
+    queue = context.Queue()
+    worker = context.Process(target=_measure_scale, args=(queue, articles, subscribers, urls, options))
+    worker.start()
+    result = queue.get()
+    worker.join()
+
+    parent_conn.send("stop")
+    result["servers"] = parent_conn.recv()
+    server.join(timeout=10)
+    return result
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def print_scale(result: dict) -> None:
+    if "error" in result:
+        print(f"  실패: {result['error']}")
+        return
+    print(
+        f"기사 {result['articles']} × 구독자 {result['subscribers']} | 파이프라인 {result['pipeline_seconds']:.2f}s | "
+        f"다이제스트 {result['digests']}개 | 발송 {result['delivered']}명 (실패 {result['failed_deliveries']}) | "
+        f"최대 RSS {result['peak_rss_mb']}MB"
+    )
+    for name, phase in result["phases"].items():
+        print(f"  {name:12} {phase['seconds'] * 1000:10.1f}ms | {phase['per_second']:10.1f} 건/s")
+    for stage, latency in result["latency_seconds"].items():
+        print(
+            f"  {stage:12} p50 {latency['p50'] * 1000:8.2f}ms | p95 {latency['p95'] * 1000:8.2f}ms | "
+            f"max {latency['max'] * 1000:8.2f}ms ({latency['count']}회)"
+        )
+
+def compare(current: dict, baseline: dict) -> None:
+    # 같은 규모끼리 단계별 처리량과 최대 RSS 변화율 출력 (+는 빨라짐/메모리 증가)
+    print(f"\n비교 기준: {baseline['commit']} ({baseline['created_at']})")
+    previous = {(scale["articles"], scale["subscribers"]): scale for scale in baseline["scales"] if "phases" in scale}
+    for scale in current["scales"]:
+        before = previous.get((scale.get("articles"), scale.get("subscribers")))
+        if before is None or "phases" not in scale:
+            continue
+        changes = []
+        for name, phase in scale["phases"].items():
+            old = before["phases"].get(name, {}).get("per_second")
+            if old:
+                changes.append(f"{name} {(phase['per_second'] / old - 1) * 100:+.0f}%")
+        rss_change = (scale["peak_rss_mb"] / before["peak_rss_mb"] - 1) * 100 if before["peak_rss_mb"] else 0.0
+        print(f"  {scale['articles']}×{scale['subscribers']}: " + ", ".join(changes) + f" | RSS {rss_change:+.0f}%")
+
+def latest_result(exclude: Path) -> Optional[Path]:
+    candidates = sorted(path for path in RESULTS_DIR.glob("*.json") if path != exclude)
+    return candidates[-1] if candidates else None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", default="10,1k,1kx100k", help="기사x구독자 목록 (예: 10,1k,1kx100k,100k)")
+    parser.add_argument("--pages", default=None, help="저장한 ranking_*.html / article_*.html 디렉터리")
+    parser.add_argument("--openai-latency", type=float, default=BenchOptions.openai_latency)
+    parser.add_argument("--kakao-latency", type=float, default=BenchOptions.kakao_latency)
+    parser.add_argument("--kakao-rate-limit", type=float, default=None, help="가짜 카카오 서버의 초당 허용 요청 수")
+    parser.add_argument("--kakao-rate", type=float, default=BenchOptions.kakao_rate, help="발송기의 초당 요청 수")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    args = parser.parse_args()
+
+    options = BenchOptions(
+        openai_latency=args.openai_latency,
+        kakao_latency=args.kakao_latency,
+        kakao_rate_limit=args.kakao_rate_limit,
+        kakao_rate=args.kakao_rate,
+        pages=args.pages
+    )
+    scales = []
+    for articles, subscribers in (parse_scale(scale) for scale in args.scales.split(",")):
+        result = run_scale(articles, subscribers, options)
+        print_scale(result)
+        scales.append(result)
+
+    commit = git_commit()
+    created_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+    summary = {
+        "commit": commit,
+        "created_at": created_at,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "options": asdict(options),
+        "scales": scales,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    baseline_path = Path(args.baseline) if args.baseline else latest_result(exclude=output)
+    if baseline_path is not None and baseline_path.exists():
+        compare(summary, json.loads(baseline_path.read_text(encoding="utf-8")))
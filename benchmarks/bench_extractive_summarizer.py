@@ -0,0 +1,32 @@
+# 📊 벤치마크: 로컬 추출 요약기로 하루치 기사 요약 (단일 코어)
+# 실행: python -m benchmarks.bench_extractive_summarizer [--articles 300]
+
+import argparse
+import time
+
+from benchmarks.fixtures import article_text
+from benchmarks.stats import percentile
+from summaries.extractive_summarizer import ExtractiveSummarizer
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--paragraphs", type=int, default=12)
+    args = parser.parse_args()
+
+    texts = [article_text(args.paragraphs, seed=i) for i in range(args.articles)]
+    summarizer = ExtractiveSummarizer()
+    summarizer.summarize(texts[0])  # 첫 호출의 import/캐시 비용 제외
+
+    latencies = []
+    started = time.perf_counter()
+    for text in texts:
+        call_started = time.perf_counter()
+        summarizer.summarize(text)
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"기사 {len(texts)}건 | 전체 {elapsed * 1000:.0f}ms | {len(texts) / elapsed:.0f} 건/s | "
+        f"p50 {percentile(latencies, 50):.2f}ms p95 {percentile(latencies, 95):.2f}ms"
+    )
@@ -0,0 +1,57 @@
+# 📊 벤치마크: 원본 HTML 보관소 쓰기/무작위 읽기/순차 재생 속도와 압축률, 보관소 재생으로 본문 추출
+# 실행: python -m benchmarks.bench_html_archive [--pages 저장한_HTML_디렉터리] [--copies 20]
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.fixtures import load_pages
+from crawler.html_archive import ArchiveReplayHTTPClient, HTMLArchive, zstandard
+from utils.article_extractor import extract_article
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", default=None, help="article_*.html 이 있는 디렉터리")
+    parser.add_argument("--count", type=int, default=40)
+    parser.add_argument("--copies", type=int, default=25)
+    parser.add_argument("--segment-mb", type=int, default=8)
+    args = parser.parse_args()
+
+    htmls = [html.encode("utf-8") for html in load_pages(args.pages, count=args.count)["article"]] * args.copies
+    urls = [f"https://n.news.naver.com/article/052/{2000000 + i:010d}?sid=102" for i in range(len(htmls))]
+    raw_bytes = sum(map(len, htmls))
+    print(f"페이지 {len(htmls)}개, 원본 {raw_bytes / 1024 / 1024:.1f}MB, 코덱 {'zstd' if zstandard else 'zlib (zstandard 미설치)'}")
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = HTMLArchive(root, segment_bytes=args.segment_mb * 1024 * 1024)
+        started = time.perf_counter()
+        for i, (url, html) in enumerate(zip(urls, htmls)):
+            archive.put(url, html, fetched_at=1_700_000_000 + i)
+        elapsed = time.perf_counter() - started
+        stored = sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root) if name.endswith(".dat"))
+        segments = sum(1 for name in os.listdir(root) if name.endswith(".dat"))
+        print(
+            f"쓰기       | {len(htmls) / elapsed:8.0f} 페이지/s | {raw_bytes / elapsed / 1024 / 1024:6.1f}MB/s | "
+            f"저장 {stored / 1024 / 1024:.1f}MB (x{raw_bytes / stored:.1f}), 세그먼트 {segments}개"
+        )
+
+        picks = random.Random(0).sample(urls, min(500, len(urls)))
+        started = time.perf_counter()
+        for url in picks:
+            archive.get(url)
+        elapsed = time.perf_counter() - started
+        print(f"무작위 읽기 | {len(picks) / elapsed:8.0f} 페이지/s | 평균 {elapsed / len(picks) * 1000:.2f}ms")
+
+        started = time.perf_counter()
+        replayed = sum(len(page.content) for page in archive.iter_pages())
+        elapsed = time.perf_counter() - started
+        print(f"순차 재생   | {len(htmls) / elapsed:8.0f} 페이지/s | {replayed / elapsed / 1024 / 1024:6.1f}MB/s")
+
+        client = ArchiveReplayHTTPClient(archive)
+        started = time.perf_counter()
+        ok = sum(extract_article(url, http_client=client).ok for url in picks[:200])
+        elapsed = time.perf_counter() - started
+        print(f"재생 추출   | {min(200, len(picks)) / elapsed:8.0f} 기사/s | 성공 {ok}개 (네트워크 없음)")
+        archive.close()
@@ -0,0 +1,66 @@
+# 📊 벤치마크: HTML 파서 백엔드별 페이지당 파싱 시간과 최대 메모리
+# 실행: python -m benchmarks.bench_html_parsers [--pages 저장한_HTML_디렉터리]
+# - 메모리는 백엔드마다 새 프로세스에서 측정 (tracemalloc: 파이썬 힙, RSS: C 라이브러리 포함)
+
+import argparse
+import multiprocessing
+import resource
+import time
+import tracemalloc
+from typing import Dict, List
+
+from benchmarks.fixtures import load_pages
+from crawler.naver_ranking_crawler import RANKING_SCOPE, RANKING_SELECTOR
+from utils.article_extractor import ARTICLE_SCOPE, ARTICLE_SELECTOR
+from utils.html_parser import available_parsers
+
+def _parse_all(parser, pages: Dict[str, List[str]]) -> int:
+    found = 0
+    for html in pages["ranking"]:
+        found += len(parser.select(html, RANKING_SELECTOR, scope=RANKING_SCOPE))
+    for html in pages["article"]:
+        found += parser.select_one(html, ARTICLE_SELECTOR, scope=ARTICLE_SCOPE) is not None
+    return found
+
+def _measure_memory(parser_name: str, pages: Dict[str, List[str]], queue) -> None:
+    parser = next(parser for parser in available_parsers() if parser.name == parser_name)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    _parse_all(parser, pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((peak, (rss_after - rss_before) * 1024))
+
+def run(pages: Dict[str, List[str]], repeat: int) -> None:
+    page_count = len(pages["ranking"]) + len(pages["article"])
+    total_bytes = sum(len(html.encode("utf-8")) for group in pages.values() for html in group)
+    print(f"페이지 {page_count}개, 평균 {total_bytes / page_count / 1024:.0f}KB, 반복 {repeat}회")
+
+    context = multiprocessing.get_context("spawn")
+    for parser in available_parsers():
+        found = _parse_all(parser, pages)  # 워밍업 + 결과 확인
+        started = time.perf_counter()
+        for _ in range(repeat):
+            _parse_all(parser, pages)
+        per_page = (time.perf_counter() - started) / (repeat * page_count)
+
+        queue = context.Queue()
+        process = context.Process(target=_measure_memory, args=(parser.name, pages, queue))
+        process.start()
+        python_peak, rss_delta = queue.get()
+        process.join()
+
+        print(
+            f"{parser.name:24} | {per_page * 1000:7.2f} ms/page | "
+            f"파이썬 힙 최대 {python_peak / 1024 / 1024:6.1f}MB | RSS 증가 {rss_delta / 1024 / 1024:6.1f}MB | "
+            f"찾은 노드 {found}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", help="ranking_*.html / article_*.html 이 저장된 디렉터리")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(load_pages(args.pages, args.count), args.repeat)
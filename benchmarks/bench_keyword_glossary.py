@@ -0,0 +1,80 @@
+# 📊 벤치마크: 키워드 용어집 사용 전후 OpenAI 요청 크기 비교 (로컬 가짜 OpenAI 서버 대상)
+# 실행: python -m benchmarks.bench_keyword_glossary [--days 7 --articles 30]
+# - 기사마다 자주 나오는 용어(환율, 금리 ...) 위주로 키워드 5개를 뽑는 가짜 모델
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import zlib
+
+import openai
+
+from benchmarks.fake_servers import FakeOpenAIServer
+from summaries.keyword_glossary import KeywordGlossary
+from summaries.news_summarizer import GLOSSARY_SYSTEM_PROMPT, GPTNewsSummarizer
+
+COMMON_TERMS = ["환율", "금리", "신탁", "물가", "전세", "보증금", "기준금리", "국채", "채권", "증시"]
+
+class GlossaryFakeOpenAIServer(FakeOpenAIServer):
+    def __init__(self, vocabulary: int, **kwargs):
+        super().__init__(latency=0, **kwargs)
+        self.terms = COMMON_TERMS + [f"용어{i}" for i in range(vocabulary)]
+
+    def reply_for(self, body: dict) -> str:
+        system, user = body["messages"][0]["content"], body["messages"][-1]["content"]
+        if system == GLOSSARY_SYSTEM_PROMPT:
+            keywords = [keyword.strip() for keyword in user.split(":", 1)[1].split(",")]
+            return json.dumps({
+                keyword: {"explanation": f"{keyword}의 뜻을 쉽게 풀어 쓴 설명입니다.", "example": f"{keyword}이(가) 올랐다."}
+                for keyword in keywords
+            }, ensure_ascii=False)
+        # 같은 기사에는 같은 키워드 (앞쪽 용어일수록 자주 등장)
+        rng = random.Random(zlib.crc32(user.encode("utf-8")))
+        keywords = []
+        while len(keywords) < 5:
+            term = self.terms[min(int(rng.paretovariate(1.2)) - 1, len(self.terms) - 1)]
+            if term not in keywords:
+                keywords.append(term)
+        lines = ["요약: 정부가 관련 대책을 발표했다.", f"키워드: [{', '.join(keywords)}]", "단어설명:"]
+        if "단어설명" in user:
+            lines += [f"- {keyword}: 설명: {keyword}의 뜻을 쉽게 풀어 쓴 설명입니다. / 예문: {keyword}이(가) 올랐다." for keyword in keywords]
+        return "\n".join(lines)
+
+def start_in_thread(server: FakeOpenAIServer) -> asyncio.AbstractEventLoop:
+    # 동기 openai 클라이언트에서 부를 수 있도록 서버를 별도 스레드의 이벤트 루프에서 실행
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    return loop
+
+def run(label: str, days: int, articles: int, vocabulary: int, use_glossary: bool) -> None:
+    server = GlossaryFakeOpenAIServer(vocabulary)
+    loop = start_in_thread(server)
+    openai.api_base = server.api_base
+    glossary = KeywordGlossary("sqlite://") if use_glossary else None
+    summarizer = GPTNewsSummarizer(api_key="bench", glossary=glossary)
+    for day in range(days):
+        texts = [f"[{day}일차 기사 {i}] 정부가 관련 대책을 발표했다." for i in range(articles)]
+        summarizer.summarize_many(texts, max_articles=1)
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+    line = (
+        f"{label:8} | 요청 {server.requests:5} | 프롬프트 {server.prompt_chars / 1000:8.1f}k자 | "
+        f"응답 {server.completion_chars / 1000:8.1f}k자"
+    )
+    if glossary is not None:
+        line += f" | 용어집 {len(glossary)}개, 적중률 {glossary.stats.hit_rate:.0%}"
+    print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--vocabulary", type=int, default=200)
+    args = parser.parse_args()
+
+    run("용어집 없음", args.days, args.articles, args.vocabulary, use_glossary=False)
+    run("용어집", args.days, args.articles, args.vocabulary, use_glossary=True)
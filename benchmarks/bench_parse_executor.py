@@ -0,0 +1,65 @@
+# 📊 벤치마크: 기사 본문 파싱 처리량 — 스레드(GIL) vs 프로세스 풀, 워커 수/묶음 크기별
+# 실행: python -m benchmarks.bench_parse_executor [--pages 저장한_HTML_디렉터리] [--copies 20]
+# - 저장한 네이버 기사 페이지(article_*.html)가 없으면 생성한 픽스처 사용
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from benchmarks.fixtures import load_pages
+from utils.article_extractor import RawArticlePage, parse_article_html
+from utils.parse_executor import ParseExecutor
+
+def make_corpus(directory: str, count: int, copies: int) -> List[RawArticlePage]:
+    pages = load_pages(directory, count=count)["article"]
+    return [
+        RawArticlePage(url=f"https://n.news.naver.com/article/052/{i}", content=html.encode("utf-8"))
+        for i, html in enumerate(pages * copies)
+    ]
+
+def report(label: str, pages: List[RawArticlePage], elapsed: float, baseline: float) -> None:
+    rate = len(pages) / elapsed
+    print(f"{label:28} | {elapsed * 1000:8.1f}ms | {rate:8.1f} 페이지/s | x{rate / baseline:5.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", default=None, help="article_*.html 이 있는 디렉터리")
+    parser.add_argument("--count", type=int, default=40)
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--batch-sizes", default="1,8,32")
+    parser.add_argument("--workers", default=None, help="예: 1,2,4,8 (기본: 1, 2, 4, CPU 수 중 CPU 수 이하)")
+    args = parser.parse_args()
+
+    pages = make_corpus(args.pages, args.count, args.copies)
+    total_bytes = sum(len(page.content) for page in pages)
+    cores = os.cpu_count() or 1
+    print(f"페이지 {len(pages)}개, 평균 {total_bytes / len(pages) / 1024:.0f}KB, CPU {cores}개")
+
+    started = time.perf_counter()
+    expected = [parse_article_html(page) for page in pages]
+    serial = time.perf_counter() - started
+    baseline = len(pages) / serial
+    report("직렬 (현재 스레드)", pages, serial, baseline)
+
+    if args.workers:
+        worker_counts = [int(count) for count in args.workers.split(",")]
+    else:
+        worker_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+    for workers in worker_counts:
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            started = time.perf_counter()
+            list(threads.map(parse_article_html, pages))
+            report(f"스레드 {workers}개", pages, time.perf_counter() - started, baseline)
+
+    for workers in worker_counts:
+        for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+            # 워커는 미리 띄워 둔 상태에서 측정 (프로세스 시작 비용 제외)
+            with ParseExecutor(max_workers=workers, batch_size=batch_size, batch_bytes=batch_size * 256 * 1024) as executor:
+                executor.parse_articles(pages[:workers * batch_size])
+                started = time.perf_counter()
+                results = executor.parse_articles(pages)
+                elapsed = time.perf_counter() - started
+            assert [result.text for result in results] == [result.text for result in expected]
+            report(f"프로세스 {workers}개, 묶음 {batch_size}", pages, elapsed, baseline)
@@ -0,0 +1,90 @@
+# 📊 벤치마크: 발송 트리거부터 첫 메시지 발송까지 걸리는 시간 — 그때 계산(cold) vs 미리 계산한 스냅샷(warm)
+# - 가짜 네이버/카카오 서버, 요약은 기사당 --llm-latency초 걸리는 요약기로 흉내
+# - 두 번째 refresh에서 이미 요약한 기사를 재사용하는지도 확인
+# 실행: python -m benchmarks.bench_precompute --articles 20 --llm-latency 0.5
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.bench_e2e import RewritingHTTPClient
+from benchmarks.fake_servers import FakeKakaoServer, FakeNaverServer
+from crawler.crawl_engine import NaverCrawlEngine
+from messenger.kakao_sender import KakaoRestApiSender
+from pipeline.news_pipeline import NewsPipeline
+from pipeline.precompute import DigestSnapshotStore, Precomputer, SnapshotDelivery
+from summaries.dummy_summarizer import DummySummarizer
+from summaries.news_summarizer import SummaryResult
+from utils.article_extractor import extract_article
+from utils.http_transport import AsyncHTTPTransport, PooledHTTPClient
+
+class SlowSummarizer(DummySummarizer):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    def summarize(self, text: str) -> SummaryResult:
+        self.calls += 1
+        time.sleep(self.latency)
+        return super().summarize(text)
+
+async def run(articles: int, llm_latency: float) -> None:
+    async with FakeNaverServer(per_page=articles) as naver, FakeKakaoServer(latency=0.02) as kakao:
+        with PooledHTTPClient() as pooled, tempfile.TemporaryDirectory() as directory:
+            async with AsyncHTTPTransport() as transport:
+                http_client = RewritingHTTPClient(pooled, naver.base_url)
+
+                def build(name: str):
+                    summarizer = SlowSummarizer(llm_latency)
+                    pipeline = NewsPipeline(
+                        source=NaverCrawlEngine(http_client, per_list_limit=articles),
+                        summarizer=summarizer,
+                        sender=KakaoRestApiSender(api_key="bench", base_url=kakao.memo_url, transport=transport),
+                        receiver_uuids=["bench"],
+                        extractor=lambda link: extract_article(link, http_client=http_client),
+                        http_client=http_client
+                    )
+                    precomputer = Precomputer(
+                        pipeline=pipeline,
+                        store=DigestSnapshotStore(f"sqlite:///{os.path.join(directory, name + '.db')}"),
+                        limit=articles
+                    )
+                    return precomputer, SnapshotDelivery(precomputer=precomputer), summarizer
+
+                # cold: 발송 시각에 크롤링부터 시작 (기존 방식과 같은 일)
+                _, delivery, summarizer = build("cold")
+                started = time.perf_counter()
+                await delivery.deliver()
+                cold = time.perf_counter() - started
+                print(f"cold  | 트리거 → 발송 {cold * 1000:9.1f}ms | 요약 호출 {summarizer.calls}")
+
+                # warm: 발송 전에 refresh()를 끝내 둠
+                precomputer, delivery, summarizer = build("warm")
+                started = time.perf_counter()
+                await precomputer.refresh()
+                first_refresh = time.perf_counter() - started
+                started = time.perf_counter()
+                await precomputer.refresh()
+                second_refresh = time.perf_counter() - started
+                print(f"미리 계산 | 첫 refresh {first_refresh * 1000:9.1f}ms | 다시 refresh {second_refresh * 1000:9.1f}ms (요약 호출 누적 {summarizer.calls})")
+
+                started = time.perf_counter()
+                await delivery.deliver()
+                warm = time.perf_counter() - started
+                print(f"warm  | 트리거 → 발송 {warm * 1000:9.1f}ms | x{cold / warm:.0f} 단축")
+
+                # 재시작: 메모리 스냅샷 없이 SQLite에서 읽어 바로 발송
+                restarted = DigestSnapshotStore(f"sqlite:///{os.path.join(directory, 'warm.db')}")
+                delivery.precomputer.store = restarted
+                started = time.perf_counter()
+                await delivery.deliver()
+                print(f"재시작 | 트리거 → 발송 {(time.perf_counter() - started) * 1000:9.1f}ms (저장된 스냅샷 사용)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args.articles, args.llm_latency))
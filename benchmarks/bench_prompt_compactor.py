@@ -0,0 +1,40 @@
+# 📊 벤치마크: 요약 전처리(상투 문구 제거 + 토큰 예산) 전후 입력 토큰 수와 처리 시간
+# 실행: python -m benchmarks.bench_prompt_compactor [--articles 300 --budget 600]
+
+import argparse
+import time
+
+from benchmarks.fixtures import article_text
+from benchmarks.stats import percentile
+from summaries.prompt_compactor import PromptCompactor
+
+BOILERPLATE = (
+    "▲ 기사와 관련된 사진 설명입니다. (사진=뉴시스)\n"
+    "홍길동 기자 (hong@ytn.co.kr)\n"
+    "※ '당신의 제보가 뉴스가 됩니다' 카카오톡 : YTN 검색해 채널 추가 / 전화 : 02-398-8585 / 메일 : social@ytn.co.kr\n"
+    "[저작권자(c) YTN 무단전재, 재배포 및 AI 데이터 활용 금지]"
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--articles", type=int, default=300)
+    parser.add_argument("--paragraphs", type=int, default=24)
+    parser.add_argument("--budget", type=int, default=600)
+    args = parser.parse_args()
+
+    texts = [f"[서울=YTN] 홍길동 기자 = {article_text(args.paragraphs, seed=i)}\n{BOILERPLATE}" for i in range(args.articles)]
+    compactor = PromptCompactor(token_budget=args.budget)
+
+    latencies = []
+    before = after = 0
+    for text in texts:
+        started = time.perf_counter()
+        result = compactor.compact(text)
+        latencies.append((time.perf_counter() - started) * 1000)
+        before += result.tokens_before
+        after += result.tokens_after
+
+    print(
+        f"기사 {len(texts)}건 | 입력 토큰 {before} → {after} ({(1 - after / before) * 100:.0f}% 감소) | "
+        f"p50 {percentile(latencies, 50):.2f}ms p95 {percentile(latencies, 95):.2f}ms"
+    )
@@ -0,0 +1,72 @@
+# 📊 벤치마크: 구독자별 다이제스트 10k개 렌더링 (기사 블록 캐시 유무 비교)
+# 실행: python -m benchmarks.bench_render_cache
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from crawler.naver_ranking_crawler import NewsArticle
+from messenger.message_formatter import FormattedMessage, MessageFormatter
+from summaries.dummy_summarizer import DummySummarizer
+
+CATEGORIES = ["경제", "사회", "정치", "국제"]
+
+def make_articles(count: int) -> List[Tuple[NewsArticle, object]]:
+    summarizer = DummySummarizer()
+    return [
+        (
+            NewsArticle(
+                title=f"기사 제목 {i}",
+                link=f"https://n.news.naver.com/article/052/{2000000 + i:010d}",
+                category=CATEGORIES[i % len(CATEGORIES)]
+            ),
+            summarizer.summarize(f"본문 {i}")
+        )
+        for i in range(count)
+    ]
+
+def make_subscribers(count: int, seed: int = 0) -> List[List[str]]:
+    rng = random.Random(seed)
+    return [rng.sample(CATEGORIES, rng.randint(1, len(CATEGORIES))) for _ in range(count)]
+
+def render_all(
+    formatter: MessageFormatter,
+    articles: List[Tuple[NewsArticle, object]],
+    subscribers: List[List[str]],
+    per_digest: int
+) -> List[FormattedMessage]:
+    by_category: Dict[str, List[Tuple[NewsArticle, object]]] = {category: [] for category in CATEGORIES}
+    for article, summary in articles:
+        by_category[article.category].append((article, summary))
+    messages = []
+    for categories in subscribers:
+        picked = [pair for category in categories for pair in by_category[category][:per_digest]]
+        messages.append(formatter.format_news_message(
+            [article for article, _ in picked],
+            [summary for _, summary in picked],
+            encode=True
+        ))
+    return messages
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--per-category", type=int, default=3)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    subscribers = make_subscribers(args.subscribers)
+
+    for label, cache_size in (("캐시 없음", 0), ("블록·다이제스트 캐시", 4096)):
+        formatter = MessageFormatter(cache_size=cache_size)
+        started = time.perf_counter()
+        messages = render_all(formatter, articles, subscribers, args.per_category)
+        elapsed = time.perf_counter() - started
+        payload_bytes = sum(len(message.template_object) for message in messages)
+        print(
+            f"{label:10} | {len(messages)}개 {elapsed * 1000:8.1f}ms | "
+            f"{len(messages) / elapsed:9.0f} 개/s | 인코딩 {payload_bytes / 1024 / 1024:6.1f}MB | "
+            f"캐시 적중 {formatter.hits} / 미스 {formatter.misses}"
+        )
@@ -0,0 +1,215 @@
+# 📦 벤치마크용 로컬 가짜 서버 (aiohttp.web)
+# - 실제 카카오 API 대신 localhost에서 응답
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional, Sequence
+
+from aiohttp import web
+
+from benchmarks.fixtures import article_page, ranking_page
+
+class FakeServer:
+    """
+    aiohttp 앱을 localhost의 빈 포트에 띄우는 공통 베이스
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.app = web.Application()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "FakeServer":
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+class FakeNaverServer(FakeServer):
+    """
+    네이버 언론사 랭킹 페이지(/press/{press_id}/ranking)와 기사 페이지(/article/{press_id}/{article_id}) 흉내
+    - recorded: load_pages()로 읽은 저장 HTML이 있으면 그대로, 없으면 생성한 픽스처를 응답
+    - 기사 페이지는 article_pool개를 돌려 가며 응답 (메모리 고정)
+    """
+    def __init__(
+        self,
+        latency: float = 0.0,
+        per_page: int = 20,
+        sections: Sequence[str] = ("100", "101", "102", "104"),
+        article_pool: int = 50,
+        recorded: Optional[Dict[str, List[str]]] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.per_page = per_page
+        self.sections = sections
+        self.recorded_ranking = (recorded or {}).get("ranking") or []
+        self.articles = ((recorded or {}).get("article") or [article_page(seed=i) for i in range(article_pool)])
+        self._ranking: Dict[str, str] = {}
+        self.requests = 0
+        self.bytes_sent = 0
+        self.app.router.add_get("/press/{press_id}/ranking", self.handle_ranking)
+        self.app.router.add_get("/article/{press_id}/{article_id}", self.handle_article)
+
+    def ranking_html(self, press_id: str) -> str:
+        if press_id not in self._ranking:
+            if self.recorded_ranking:
+                self._ranking[press_id] = self.recorded_ranking[len(self._ranking) % len(self.recorded_ranking)]
+            else:
+                self._ranking[press_id] = ranking_page(
+                    self.per_page, seed=len(self._ranking), press_id=press_id, sections=self.sections
+                )
+        return self._ranking[press_id]
+
+    async def _respond(self, html: str) -> web.Response:
+        self.requests += 1
+        body = html.encode("utf-8")
+        self.bytes_sent += len(body)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+    async def handle_ranking(self, request: web.Request) -> web.Response:
+        return await self._respond(self.ranking_html(request.match_info["press_id"]))
+
+    async def handle_article(self, request: web.Request) -> web.Response:
+        article_id = int(request.match_info["article_id"])
+        return await self._respond(self.articles[article_id % len(self.articles)])
+
+class FakeKakaoServer(FakeServer):
+    """
+    카카오 메시지 발송 API 흉내
+    - rate_limit_per_second를 넘는 요청에는 429 + Retry-After
+    - max_receivers를 넘는 묶음에는 400
+    """
+    SEND_PATH = "/v2/api/talk/message/default/send"
+    MEMO_PATH = "/v2/api/talk/memo/default/send"
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        rate_limit_per_second: Optional[float] = None,
+        max_receivers: int = 5,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.rate_limit_per_second = rate_limit_per_second
+        self.max_receivers = max_receivers
+        self.requests = 0
+        self.rejected = 0
+        self.delivered = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self.app.router.add_post(self.SEND_PATH, self.handle_send)
+        self.app.router.add_post(self.MEMO_PATH, self.handle_memo)
+
+    @property
+    def send_url(self) -> str:
+        return self.base_url + self.SEND_PATH
+
+    @property
+    def memo_url(self) -> str:
+        return self.base_url + self.MEMO_PATH
+
+    def _over_limit(self) -> bool:
+        if self.rate_limit_per_second is None:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start, self._window_count = now, 0
+        self._window_count += 1
+        return self._window_count > self.rate_limit_per_second
+
+    async def handle_send(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self._over_limit():
+            self.rejected += 1
+            return web.json_response({"code": -10, "msg": "rate limited"}, status=429, headers={"Retry-After": "0.2"})
+        form = await request.post()
+        receivers = json.loads(form.get("receiver_uuids", "[]"))
+        if len(receivers) > self.max_receivers:
+            return web.json_response({"code": -2, "msg": "too many receivers"}, status=400)
+        await asyncio.sleep(self.latency)
+        self.delivered += len(receivers)
+        return web.json_response({"successful_receiver_uuids": receivers})
+
+    async def handle_memo(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await request.post()
+        await asyncio.sleep(self.latency)
+        self.delivered += 1
+        return web.json_response({"result_code": 0})
+
+FAKE_SUMMARY = (
+    "요약: 정부가 전세사기 피해자 지원 특별법을 시행한다.\n"
+    "키워드: [전세사기, 특별법, 피해자, 보증금, 지원금]\n"
+    "단어설명:\n"
+    "- 전세사기: 설명: 보증금을 돌려주지 않는 사기 / 예문: 전세사기 피해가 늘었다.\n"
+    "- 특별법: 설명: 특정 사안에 적용되는 법 / 예문: 특별법이 통과되었다.\n"
+    "- 피해자: 설명: 손해를 입은 사람 / 예문: 피해자를 지원한다.\n"
+)
+
+class FakeOpenAIServer(FakeServer):
+    """
+    OpenAI 호환 /v1/chat/completions 흉내
+    - latency: 첫 응답까지의 지연(초), token_interval: 스트리밍 청크 간격(초)
+    """
+    COMPLETIONS_PATH = "/v1/chat/completions"
+
+    def __init__(self, latency: float = 0.2, token_interval: float = 0.005, content: str = FAKE_SUMMARY, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.token_interval = token_interval
+        self.content = content
+        self.requests = 0
+        self.prompt_chars = 0
+        self.completion_chars = 0
+        self.app.router.add_post(self.COMPLETIONS_PATH, self.handle_completions)
+
+    @property
+    def api_base(self) -> str:
+        return self.base_url + "/v1"
+
+    def reply_for(self, body: dict) -> str:
+        return self.content
+
+    async def handle_completions(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        body = await request.json()
+        self.prompt_chars += sum(len(message.get("content", "")) for message in body.get("messages", []))
+        content = self.reply_for(body)
+        self.completion_chars += len(content)
+        await asyncio.sleep(self.latency)
+        if not body.get("stream"):
+            return web.json_response({
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}]
+            })
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for start in range(0, len(content), 8):
+            chunk = {"choices": [{"index": 0, "delta": {"content": content[start:start + 8]}}]}
+            await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            await asyncio.sleep(self.token_interval)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
@@ -0,0 +1,79 @@
+# 📦 벤치마크용 네이버 페이지 픽스처
+# - 저장해 둔 HTML(--pages 디렉터리)이 없으면 실제 페이지와 비슷한 구조/크기의 HTML을 생성
+
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+_WORDS = [
+    "정부", "전세사기", "피해자", "지원", "특별법", "시행", "금리", "환율", "인상", "발표",
+    "국회", "경제", "물가", "상승", "대책", "논의", "기업", "투자", "시장", "증가",
+]
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 16))) + "."
+
+def _chrome(rng: random.Random, blocks: int) -> str:
+    # 헤더/메뉴/스크립트 등 본문과 무관한 페이지 골격
+    parts = ['<script>window.__STATE__ = {' + ",".join(f'"k{i}": {i}' for i in range(400)) + '};</script>']
+    for i in range(blocks):
+        links = "".join(
+            f'<li class="menu_item"><a href="https://news.naver.com/section/{i}{j}">{rng.choice(_WORDS)}</a></li>'
+            for j in range(20)
+        )
+        parts.append(f'<div class="nav_block" data-index="{i}"><ul>{links}</ul></div>')
+    return "".join(parts)
+
+def ranking_page(articles: int = 20, seed: int = 0, press_id: str = "052", sections: Sequence[str] = ("102",)) -> str:
+    # sections: 기사 링크에 차례로 붙일 섹션 ID (카테고리 분류용)
+    rng = random.Random(seed)
+    items = "".join(
+        '<li class="as_thumb">'
+        f'<a href="https://n.news.naver.com/article/{press_id}/{2000000 + seed * 1000 + i:010d}?sid={sections[i % len(sections)]}">'
+        f'<span class="list_ranking_num">{i + 1}</span>'
+        f'<div class="list_content"><strong class="list_title">{_sentence(rng)}</strong></div>'
+        '</a></li>'
+        for i in range(articles)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>랭킹</title></head><body>"
+        f"{_chrome(rng, 30)}"
+        f'<div class="press_ranking_home"><ul class="press_ranking_list">{items}</ul></div>'
+        f"{_chrome(rng, 30)}"
+        "</body></html>"
+    )
+
+def article_page(paragraphs: int = 12, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    body = "<br><br>".join(" ".join(_sentence(rng) for _ in range(4)) for _ in range(paragraphs))
+    return (
+        "<!DOCTYPE html><html><head><title>기사</title></head><body>"
+        f"{_chrome(rng, 40)}"
+        '<div id="newsct_article" class="newsct_article _article_body">'
+        f'<article id="dic_area" class="go_trans _article_content">{body}'
+        '<span class="end_photo_org"><img src="https://imgnews.pstatic.net/photo.jpg">'
+        '<em class="img_desc">사진 설명입니다.</em></span></article></div>'
+        '<div class="byline"><p class="byline_p"><span class="byline_s">홍길동 기자 (hong@ytn.co.kr)</span></p></div>'
+        f"{_chrome(rng, 40)}"
+        "</body></html>"
+    )
+
+def article_text(paragraphs: int = 12, seed: int = 0) -> str:
+    # 본문 추출이 끝난 기사 텍스트 (문단마다 4문장)
+    rng = random.Random(seed)
+    return "\n".join(" ".join(_sentence(rng) for _ in range(4)) for _ in range(paragraphs))
+
+def load_pages(directory: Optional[str] = None, count: int = 20) -> Dict[str, List[str]]:
+    """
+    directory/ranking_*.html, directory/article_*.html 을 읽고, 없으면 생성한 픽스처를 반환
+    """
+    if directory:
+        root = Path(directory)
+        ranking = [path.read_text(encoding="utf-8") for path in sorted(root.glob("ranking_*.html"))]
+        articles = [path.read_text(encoding="utf-8") for path in sorted(root.glob("article_*.html"))]
+        if ranking or articles:
+            return {"ranking": ranking, "article": articles}
+    return {
+        "ranking": [ranking_page(seed=i) for i in range(max(1, count // 10))],
+        "article": [article_page(seed=i) for i in range(count)],
+    }
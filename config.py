@@ -5,23 +5,111 @@ from typing import Optional
 class Settings(BaseSettings):
     # OpenAI API 설정
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: str = "https://api.openai.com/v1"
+    OPENAI_MAX_CONCURRENCY: int = 4
+    OPENAI_TIMEOUT_SECONDS: float = 30.0
     
     # 카카오톡 API 설정
     KAKAO_REST_API_KEY: Optional[str] = None
     KAKAO_REDIRECT_URI: Optional[str] = None
     MY_KAKAO_UUID: Optional[str] = None
     MY_KAKAO_ACCESS_TOKEN: Optional[str] = None
+    KAKAO_BATCH_SIZE: int = 5  # 요청당 최대 수신자 수
+    KAKAO_SEND_CONCURRENCY: int = 8
+    KAKAO_SEND_RATE_PER_SECOND: float = 20.0
     
     # 데이터베이스 설정
     DATABASE_URL: str = "sqlite:///./news_bot.db"
     
+    # 묶음 요약 설정 (요청 하나에 담을 기사 본문 토큰 예산)
+    SUMMARY_BATCH_TOKEN_BUDGET: int = 6000
+    SUMMARY_BATCH_MAX_ARTICLES: int = 6
+    
+    # 요약 캐시 설정
+    SUMMARY_CACHE_TTL_HOURS: int = 48
+    SUMMARY_CACHE_MAX_ENTRIES: int = 5000
+    
+    # 요약 입력 토큰 예산 (상투 문구 제거 후에도 넘으면 중요한 문장만 남김)
+    SUMMARY_INPUT_TOKEN_BUDGET: int = 1500
+    
+    # 요약 백엔드 대체 설정 (기사 하나 요약 SLA, hedging 최소 대기, 회로 차단기)
+    SUMMARY_SLA_SECONDS: float = 20.0
+    SUMMARY_HEDGE_MIN_SECONDS: float = 3.0
+    SUMMARY_STATS_WINDOW: int = 50
+    CIRCUIT_ERROR_RATE: float = 0.5
+    CIRCUIT_MIN_REQUESTS: int = 5
+    CIRCUIT_COOLDOWN_SECONDS: float = 60.0
+    
+    # 키워드 용어집 설정
+    GLOSSARY_HOT_SIZE: int = 512
+    GLOSSARY_MAX_ENTRIES: int = 20000
+    
     # 크롤링 설정
     CRAWL_INTERVAL_MINUTES: int = 60
     NEWS_CATEGORIES: list[str] = ["경제", "사회", "정치", "국제"]
+    NEWS_PRESS_IDS: list[str] = ["052"]  # 052: YTN
+    CRAWL_RANKING_TYPES: list[str] = ["popular"]
+    CRAWL_HOST_CONCURRENCY: int = 2
+    CRAWL_HOST_MIN_INTERVAL_SECONDS: float = 0.2
+    HTML_PARSER_BACKEND: str = "auto"  # auto | selectolax | lxml | bs4 | bs4-full
+    EXTRACT_MAX_BYTES: int = 2 * 1024 * 1024
+    EXTRACT_TIMEOUT_SECONDS: float = 10.0
+    
+    # 미리 계산 모드 (CRAWL_INTERVAL_MINUTES마다 + 발송 LEAD 분 전에 크롤링/요약, 발송 시각에는 포맷 + 발송만)
+    PRECOMPUTE_ENABLED: bool = False
+    PRECOMPUTE_LEAD_MINUTES: int = 15
+    PRECOMPUTE_MAX_AGE_MINUTES: int = 90
+    PRECOMPUTE_KEEP_SNAPSHOTS: int = 3
+    
+    # 파싱 프로세스 풀 설정 (PARSE_WORKERS 비우면 CPU 코어 수, 0이면 프로세스 없이 스레드에서 파싱)
+    PARSE_WORKERS: Optional[int] = None
+    PARSE_BATCH_SIZE: int = 8
+    PARSE_BATCH_BYTES: int = 1024 * 1024
+    PARSE_BATCH_LINGER_SECONDS: float = 0.005
+    
+    # 원본 HTML 보관 설정 (켜면 받아 온 페이지를 압축 저장해 재처리/백필에 사용)
+    ARCHIVE_ENABLED: bool = False
+    ARCHIVE_DIR: str = "./html_archive"
+    ARCHIVE_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    ARCHIVE_COMPRESSION_LEVEL: int = 3
+    
+    # HTTP 연결 설정
+    HTTP_TOTAL_CONNECTIONS: int = 32  # aiohttp(카카오 발송/OpenAI)의 전체 동시 연결 수 (requests에는 적용 안 됨)
+    HTTP_CONNECTIONS_PER_HOST: int = 8  # 호스트당 연결 수 (requests 풀 크기, aiohttp limit_per_host)
+    HTTP_HOST_POOLS: int = 16  # requests가 캐시할 호스트별 커넥션 풀 개수
+    HTTP_TIMEOUT_SECONDS: float = 10.0  # 요청 하나의 기본 타임아웃 (OpenAI 요약은 OPENAI_TIMEOUT_SECONDS)
+    HTTP_DNS_CACHE_SECONDS: int = 300  # aiohttp DNS 캐시 (requests에는 적용 안 됨)
+    
+    # 작업 큐 설정
+    JOB_WORKERS: int = 4
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_LEASE_SECONDS: float = 300.0
     
     # 메시지 설정
     MAX_SUMMARY_LENGTH: int = 200
     MAX_KEYWORDS: int = 5
+    MAX_ARTICLES_PER_CATEGORY: int = 3
+    
+    # 구독 설정
+    DEFAULT_SEND_SLOT: str = "08:00"
+    
+    # 발송 스케줄 설정 (카카오 한도 중 사용할 비율, 배정 단위, 원하는 시각보다 먼저 보낼 수 있는 최대 시간)
+    DELIVERY_QUOTA_UTILIZATION: float = 0.8
+    DELIVERY_TICK_SECONDS: float = 10.0
+    DELIVERY_MAX_EARLY_MINUTES: int = 5
+    
+    # 파이프라인 설정 (단계별 동시 실행 개수)
+    PIPELINE_QUEUE_SIZE: int = 16
+    PIPELINE_EXTRACT_CONCURRENCY: int = 8
+    PIPELINE_SUMMARIZE_CONCURRENCY: int = 4
+    PIPELINE_FORMAT_CONCURRENCY: int = 1
+    PIPELINE_SEND_CONCURRENCY: int = 4
+    
+    # 계측 설정 (끄면 기록 비용 거의 없음)
+    METRICS_ENABLED: bool = False
+    METRICS_MAX_SPANS: int = 10000
+    METRICS_REPORT_PATH: str = "metrics_report.json"
+    METRICS_PROMETHEUS_PATH: str = "metrics.prom"
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,201 @@
+# 📦 Step 1 확장: 여러 언론사 × 카테고리 랭킹을 동시에 크롤링
+# - 언론사 랭킹 페이지마다 NaverNewsCrawler를 재사용하고, 같은 호스트에는 동시 요청 수/간격 제한
+# - 기사 링크의 sid(섹션 ID)로 카테고리를 정하고 NEWS_CATEGORIES에 속한 기사만 남김
+#   (sid가 없는 링크는 섹션을 알 수 없으므로 거르지 않고 그대로 남김)
+# - 여러 목록에 나온 기사는 하나로 합치고 순위를 합산(Reciprocal Rank Fusion)해 정렬
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from config import settings
+from crawler.crawl_state import article_id_from_link
+from crawler.naver_ranking_crawler import HTTPClient, NaverNewsCrawler, NewsArticle
+from utils.html_parser import HTMLParserBackend
+
+if TYPE_CHECKING:
+    from crawler.crawl_state import ConditionalRequestCache, SeenArticleIndex
+
+# 네이버 뉴스 섹션 ID → 카테고리
+SECTION_CATEGORIES = {
+    "100": "정치",
+    "101": "경제",
+    "102": "사회",
+    "103": "생활/문화",
+    "104": "국제",
+    "105": "IT/과학",
+}
+
+def category_from_link(link: str, default: Optional[str] = "일반") -> Optional[str]:
+    sid = parse_qs(urlparse(link).query).get("sid", [""])[0]
+    return SECTION_CATEGORIES.get(sid, default)
+
+@dataclass(frozen=True)
+class CrawlTarget:
+    press_id: str
+    ranking_type: str = "popular"
+
+    @property
+    def url(self) -> str:
+        return f"https://media.naver.com/press/{self.press_id}/ranking"
+
+class PoliteHTTPClient:
+    """
+    호스트별 동시 요청 수와 최소 요청 간격을 지키는 HTTPClient 래퍼
+    """
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        per_host_concurrency: int = settings.CRAWL_HOST_CONCURRENCY,
+        min_interval_seconds: float = settings.CRAWL_HOST_MIN_INTERVAL_SECONDS
+    ):
+        self.http_client = http_client
+        self.per_host_concurrency = per_host_concurrency
+        self.min_interval_seconds = min_interval_seconds
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_allowed: Dict[str, float] = {}
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host_concurrency)
+            return self._slots[host]
+
+    def _wait_turn(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = start + self.min_interval_seconds
+        if start > now:
+            time.sleep(start - now)
+
+    def get(self, url: str, headers: dict) -> requests.Response:
+        host = urlparse(url).netloc
+        with self._slot(host):
+            self._wait_turn(host)
+            return self.http_client.get(url, headers=headers)
+
+class NaverCrawlEngine:
+    """
+    NewsSource 구현: 언론사 × 랭킹 유형 목록을 동시에 가져와 카테고리로 거르고 합친 결과를 반환
+    """
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        press_ids: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        ranking_types: Optional[List[str]] = None,
+        max_workers: int = 8,
+        per_list_limit: int = 20,
+        parser: Optional[HTMLParserBackend] = None,
+        host_concurrency: int = settings.CRAWL_HOST_CONCURRENCY,
+        host_min_interval_seconds: float = settings.CRAWL_HOST_MIN_INTERVAL_SECONDS,
+        seen_index: Optional["SeenArticleIndex"] = None,
+        conditional_cache: Optional["ConditionalRequestCache"] = None
+    ):
+        self.http_client = PoliteHTTPClient(http_client, host_concurrency, host_min_interval_seconds)
+        self.press_ids = press_ids or settings.NEWS_PRESS_IDS
+        self.categories = categories if categories is not None else settings.NEWS_CATEGORIES
+        self.ranking_types = ranking_types or settings.CRAWL_RANKING_TYPES
+        self.max_workers = max_workers
+        self.per_list_limit = per_list_limit
+        self.parser = parser
+        # 목록마다 NaverNewsCrawler에 그대로 넘김 (새 기사만 반환, 발송 뒤 commit()에서 기록)
+        self.seen_index = seen_index
+        self.conditional_cache = conditional_cache
+        # 목록별 크롤러는 commit()까지 대기 중인 ETag/기사를 들고 있으므로 실행 사이에 재사용
+        self._crawlers: Dict[CrawlTarget, NaverNewsCrawler] = {}
+        self._returned: List[NewsArticle] = []
+
+    @property
+    def targets(self) -> List[CrawlTarget]:
+        return [
+            CrawlTarget(press_id=press_id, ranking_type=ranking_type)
+            for press_id in self.press_ids
+            for ranking_type in self.ranking_types
+        ]
+
+    def fetch_articles(self, limit: int = 3) -> List[NewsArticle]:
+        targets = self.targets
+        crawlers = [self._crawler(target) for target in targets]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets))) as executor:
+            ranked_lists = list(executor.map(self._fetch_target, targets, crawlers))
+        articles = self._merge(ranked_lists)[:limit]
+        self._returned.extend(articles)
+        return articles
+
+    def commit(self, delivered: Optional[List[NewsArticle]] = None) -> None:
+        """
+        발송까지 끝난 뒤 호출: 목록별 크롤러에 그 목록에서 나온 발송 기사를 나눠 commit()
+        (delivered=None이면 이 엔진이 반환한 기사 전부). 어느 목록에서도 나오지 않은 기사
+        (다른 프로세스에서 크롤링한 작업 큐 기사 등)는 본 것으로만 기록
+        """
+        returned, self._returned = self._returned, []
+        delivered = returned if delivered is None else delivered
+        crawlers = list(self._crawlers.values())
+        delivered_ids = {article_id_from_link(article.link) for article in delivered}
+        crawled_ids = set()
+        for crawler in crawlers:
+            # 같은 기사가 여러 목록에 나올 수 있으므로 목록마다 자기가 반환한 기사 객체로 넘김
+            pending = crawler.pending_articles
+            crawled_ids.update(article_id_from_link(article.link) for article in pending)
+            crawler.commit([article for article in pending if article_id_from_link(article.link) in delivered_ids])
+        remaining = [article for article in delivered if article_id_from_link(article.link) not in crawled_ids]
+        if self.seen_index is not None and remaining:
+            self.seen_index.mark(remaining)
+
+    def _crawler(self, target: CrawlTarget) -> NaverNewsCrawler:
+        if target not in self._crawlers:
+            self._crawlers[target] = NaverNewsCrawler(
+                self.http_client,
+                base_url=target.url,
+                seen_index=self.seen_index,
+                conditional_cache=self.conditional_cache,
+                parser=self.parser
+            )
+        return self._crawlers[target]
+
+    def _fetch_target(self, target: CrawlTarget, crawler: NaverNewsCrawler) -> List[NewsArticle]:
+        try:
+            articles = crawler.fetch_articles(limit=self.per_list_limit, category=target.ranking_type)
+        except Exception as e:
+            print(f"[크롤링] {target.press_id}/{target.ranking_type} 실패: {e}")
+            return []
+        # 랭킹 링크는 보통 sid 없이 온다 (…/article/052/0002000000?ntype=RANKING): 섹션을 모르는 기사는 거르지 않음
+        kept = []
+        for article in articles:
+            category = category_from_link(article.link, default=None)
+            # __post_init__ 이후의 대입이라 NewsArticle이 intern해 주지 않으므로 여기서 공유 문자열로 바꿈
+            article.category = sys.intern(category or "일반")
+            if category is None or not self.categories or category in self.categories:
+                kept.append(article)
+        # 카테고리로 거른 기사는 발송될 일이 없으므로 commit()의 ETag 저장을 막지 않게 대기 목록에서 뺌
+        crawler.discard([article for article in articles if article not in kept])
+        return kept
+
+    def _merge(self, ranked_lists: List[List[NewsArticle]]) -> List[NewsArticle]:
+        # 같은 기사(네이버 기사 ID 기준)는 처음 본 것을 남기고 점수 = Σ 1 / (60 + 순위)
+        scores: Dict[str, float] = {}
+        merged: Dict[str, NewsArticle] = {}
+        for articles in ranked_lists:
+            for rank, article in enumerate(articles, 1):
+                article_id = article_id_from_link(article.link)
+                merged.setdefault(article_id, article)
+                scores[article_id] = scores.get(article_id, 0.0) + 1.0 / (60 + rank)
+        return sorted(merged.values(), key=lambda article: -scores[article_id_from_link(article.link)])
+
+# 사용 예시
+if __name__ == "__main__":
+    from utils.http_transport import PooledHTTPClient
+
+    engine = NaverCrawlEngine(PooledHTTPClient(), press_ids=["052", "056", "214"])
+    for article in engine.fetch_articles(limit=10):
+        print(f"📰 [{article.category}] {article.title}")
+        print(f"🔗 {article.link}")
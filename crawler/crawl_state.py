@@ -0,0 +1,124 @@
+# 📦 증분 크롤링 상태 (SQLite, DATABASE_URL 사용)
+# - SeenArticleIndex: 이미 처리한 기사(네이버 기사 ID 기준)와 제목 해시
+# - ConditionalRequestCache: 랭킹 페이지의 ETag / Last-Modified
+
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from crawler.naver_ranking_crawler import NewsArticle
+from utils.sqlite_db import connect
+
+_ARTICLE_ID_PATTERN = re.compile(r"/article/(?:\w+/)?(\d+)/(\d+)")
+
+def article_id_from_link(link: str) -> str:
+    """
+    https://n.news.naver.com/article/052/0002000000?sid=102 → "052/0002000000"
+    네이버 기사 형식이 아니면 쿼리스트링을 뗀 링크를 그대로 씁니다.
+    """
+    match = _ARTICLE_ID_PATTERN.search(link)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+    return link.split("?", 1)[0].split("#", 1)[0]
+
+def _title_hash(title: str) -> str:
+    return hashlib.sha1(title.strip().encode("utf-8")).hexdigest()
+
+class SeenArticleIndex:
+    def __init__(self, database_url: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS seen_articles (
+                    article_id TEXT PRIMARY KEY,
+                    title_hash TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL
+                )
+                """
+            )
+
+    def filter_new(self, articles: List[NewsArticle], mark: bool = False) -> List[NewsArticle]:
+        """
+        처음 보거나 제목이 바뀐 기사만 돌려줍니다. mark=True면 바로 본 것으로 기록합니다.
+        (보통은 발송이 끝난 뒤 mark()로 기록해야 실패한 실행의 기사가 다음 실행에서 빠지지 않음)
+        """
+        ids = [article_id_from_link(article.link) for article in articles]
+        with self._lock:
+            known = self._known(ids)
+        fresh = [
+            article for article, article_id in zip(articles, ids)
+            if known.get(article_id) != _title_hash(article.title)
+        ]
+        if mark:
+            self.mark(articles)
+        return fresh
+
+    def mark(self, articles: List[NewsArticle]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO seen_articles (article_id, title_hash, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET title_hash = excluded.title_hash, last_seen = excluded.last_seen
+                """,
+                [(article_id_from_link(article.link), _title_hash(article.title), now, now) for article in articles]
+            )
+
+    def _known(self, ids: List[str]) -> Dict[str, str]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(
+            f"SELECT article_id, title_hash FROM seen_articles WHERE article_id IN ({placeholders})", ids
+        ).fetchall()
+        return dict(rows)
+
+    def __contains__(self, link: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM seen_articles WHERE article_id = ?", (article_id_from_link(link),)
+            ).fetchone() is not None
+
+class ConditionalRequestCache:
+    def __init__(self, database_url: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT
+                )
+                """
+            )
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM http_validators WHERE url = ?", (url,)
+            ).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def store(self, url: str, response_headers) -> None:
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_validators (url, etag, last_modified) VALUES (?, ?, ?)",
+                (url, etag, last_modified)
+            )
@@ -0,0 +1,348 @@
+# 📦 원본 HTML 보관소: 받아 온 랭킹/기사 페이지를 그대로 압축 저장해 네이버에 다시 요청하지 않고 재처리
+# - 추가만 하는 세그먼트 파일(segment-000001.dat ...)에 레코드 단위로 zstd 압축 (zstandard가 없으면 zlib)
+# - 오프셋 인덱스는 같은 디렉터리의 SQLite (키 = 네이버 기사 ID 또는 URL, 받은 시각)
+# - 읽을 때는 세그먼트를 mmap으로 열어 필요한 레코드 구간만 잘라 압축 해제
+# - ArchivingHTTPClient로 저장하고, ArchiveReplayHTTPClient로 크롤러/본문 추출기에 그대로 다시 흘려 보냄
+# - 스트리밍을 끝까지 읽지 않은 페이지는 truncated로 표시 (재생할 때 fallback이 있으면 다시 받음)
+
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from config import settings
+from utils.metrics import metrics
+from utils.sqlite_db import connect
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# 매직, 코덱, 원본 길이, 압축 길이, 원본 CRC32
+_RECORD_HEADER = struct.Struct("<4sBIII")
+_RECORD_MAGIC = b"NHA1"
+
+_ARTICLE_ID_PATTERN = re.compile(r"/article/(?:\w+/)?(\d+)/(\d+)")
+
+def archive_key(url: str) -> str:
+    """
+    네이버 기사 링크는 기사 ID("052/0002000000")로, 그 밖의 페이지(랭킹 등)는 쿼리스트링까지 포함한 URL로 저장
+    """
+    match = _ARTICLE_ID_PATTERN.search(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+    return url.split("#", 1)[0]
+
+@dataclass
+class ArchivedPage:
+    key: str
+    url: str
+    fetched_at: float
+    content: bytes
+    status_code: int = 200
+    encoding: Optional[str] = None
+    # 본문 추출기가 끝까지 읽지 않고 멈춘 스트리밍 응답 (앞부분만 저장됨)
+    truncated: bool = False
+
+class HTMLArchive:
+    def __init__(
+        self,
+        root: str = settings.ARCHIVE_DIR,
+        segment_bytes: int = settings.ARCHIVE_SEGMENT_BYTES,
+        level: int = settings.ARCHIVE_COMPRESSION_LEVEL
+    ):
+        self.root = os.path.abspath(root)
+        self.segment_bytes = segment_bytes
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        if zstandard is not None:
+            self.codec = CODEC_ZSTD
+            self._compress = zstandard.ZstdCompressor(level=level).compress
+        else:
+            self.codec = CODEC_ZLIB
+            self._compress = lambda data: zlib.compress(data, min(level, 9))
+
+        self._conn = connect(f"sqlite:///{os.path.join(self.root, 'index.db')}")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    key TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    url TEXT NOT NULL,
+                    segment INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    encoding TEXT,
+                    truncated INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            # truncated 열이 없던 보관소도 그대로 열 수 있도록
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(pages)")}
+            if "truncated" not in columns:
+                self._conn.execute("ALTER TABLE pages ADD COLUMN truncated INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_pages_key ON pages (key, fetched_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_pages_fetched_at ON pages (fetched_at)")
+        row = self._conn.execute("SELECT MAX(segment) FROM pages").fetchone()
+        self._segment = row[0] or 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.root, f"segment-{segment:06d}.dat")
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        fetched_at: Optional[float] = None,
+        status_code: int = 200,
+        encoding: Optional[str] = None,
+        truncated: bool = False
+    ) -> str:
+        """
+        Returns:
+            저장한 키 (archive_key(url))
+        """
+        key = archive_key(url)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        payload = self._compress(content)
+        record = _RECORD_HEADER.pack(_RECORD_MAGIC, self.codec, len(content), len(payload), zlib.crc32(content)) + payload
+        with self._lock:
+            if self._writer.tell() and self._writer.tell() + len(record) > self.segment_bytes:
+                self._roll()
+            offset = self._writer.tell()
+            self._writer.write(record)
+            # 인덱스가 가리키기 전에 데이터가 파일에 있어야 함
+            self._writer.flush()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO pages (key, fetched_at, url, segment, offset, length, status_code, encoding, truncated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, fetched_at, url, self._segment, offset, len(record), status_code, encoding, int(truncated))
+                )
+        metrics.inc("archive_pages_total", op="put")
+        metrics.inc("archive_bytes_total", len(content), stage="raw")
+        metrics.inc("archive_bytes_total", len(record), stage="stored")
+        return key
+
+    def _roll(self) -> None:
+        self._writer.close()
+        self._segment += 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def get(self, url_or_key: str, at: Optional[float] = None) -> Optional[ArchivedPage]:
+        """
+        at 시각 이전(기본: 지금)에 받은 것 중 가장 최근 스냅샷
+        """
+        key = archive_key(url_or_key)
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT key, fetched_at, url, segment, offset, length, status_code, encoding, truncated FROM pages
+                WHERE key = ? AND fetched_at <= ? ORDER BY fetched_at DESC LIMIT 1
+                """,
+                (key, time.time() if at is None else at)
+            ).fetchone()
+        if row is None:
+            metrics.inc("archive_pages_total", op="miss")
+            return None
+        metrics.inc("archive_pages_total", op="get")
+        return self._load(row)
+
+    def iter_pages(self, since: float = 0.0, until: Optional[float] = None) -> Iterator[ArchivedPage]:
+        """
+        받은 시각 순서로 재생 (백필/오프라인 벤치마크용). 세그먼트·오프셋 순서와 거의 같아 디스크를 순서대로 읽음
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT key, fetched_at, url, segment, offset, length, status_code, encoding, truncated FROM pages
+                WHERE fetched_at >= ? AND fetched_at <= ? ORDER BY fetched_at, segment, offset
+                """,
+                (since, float("inf") if until is None else until)
+            ).fetchall()
+        for row in rows:
+            yield self._load(row)
+
+    def _load(self, row) -> ArchivedPage:
+        key, fetched_at, url, segment, offset, length, status_code, encoding, truncated = row
+        record = self._read(segment, offset, length)
+        magic, codec, raw_length, payload_length, crc = _RECORD_HEADER.unpack_from(record)
+        if magic != _RECORD_MAGIC:
+            raise ValueError(f"손상된 보관 레코드입니다: segment={segment} offset={offset}")
+        payload = record[_RECORD_HEADER.size:_RECORD_HEADER.size + payload_length]
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstd로 압축된 보관소입니다. zstandard 패키지를 설치하세요.")
+            content = zstandard.ZstdDecompressor().decompress(payload, max_output_size=raw_length)
+        else:
+            content = zlib.decompress(payload)
+        if zlib.crc32(content) != crc:
+            raise ValueError(f"보관 레코드 CRC가 맞지 않습니다: segment={segment} offset={offset}")
+        return ArchivedPage(
+            key=key, url=url, fetched_at=fetched_at, content=content, status_code=status_code, encoding=encoding,
+            truncated=bool(truncated)
+        )
+
+    def _read(self, segment: int, offset: int, length: int) -> bytes:
+        # 세그먼트마다 mmap 하나를 재사용하고, 쓰는 중인 세그먼트가 커졌으면 다시 매핑
+        # 레코드 구간은 잠금 안에서 bytes로 잘라 내므로, 다시 매핑할 때 이전 매핑을 바로 닫아도 읽는 쪽에 영향 없음
+        with self._lock:
+            view = self._maps.get(segment)
+            if view is None or len(view) < offset + length:
+                with open(self._segment_path(segment), "rb") as f:
+                    remapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if view is not None:
+                    view.close()
+                view = self._maps[segment] = remapped
+            return view[offset:offset + length]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._writer.close()
+            for view in self._maps.values():
+                view.close()
+            self._maps.clear()
+            self._conn.close()
+
+@dataclass
+class ArchivedResponse:
+    """
+    requests.Response 대신 쓰는 응답 (크롤러/본문 추출기가 쓰는 속성만)
+    """
+    url: str
+    content: bytes
+    status_code: int = 200
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = 16 * 1024) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self) -> None:
+        return None
+
+class _ArchivingStream:
+    """
+    스트리밍 응답을 감싸 읽은 chunk를 모아 두었다가 close()할 때 보관소에 저장
+    (본문 추출기가 중간에 읽기를 멈추면 그때까지 읽은 부분만 truncated로 저장)
+    """
+    def __init__(self, response, url: str, archive: HTMLArchive):
+        self._response = response
+        self._url = url
+        self._archive = archive
+        self._chunks: List[bytes] = []
+        self._complete = False
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def iter_content(self, chunk_size: int = 16 * 1024) -> Iterator[bytes]:
+        for chunk in self._response.iter_content(chunk_size=chunk_size):
+            self._chunks.append(chunk)
+            yield chunk
+        self._complete = True
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._response.status_code == 200 and self._chunks:
+                self._archive.put(
+                    self._url, b"".join(self._chunks), encoding=self._response.encoding, truncated=not self._complete
+                )
+                if not self._complete:
+                    metrics.inc("archive_pages_total", op="put_truncated")
+        finally:
+            self._response.close()
+
+class ArchivingHTTPClient:
+    """
+    실제 요청은 inner에 맡기고, 받은 본문을 보관소에 저장하는 HTTPClient
+    """
+    def __init__(self, inner, archive: HTMLArchive):
+        self.inner = inner
+        self.archive = archive
+
+    def get(self, url: str, headers: dict):
+        response = self.inner.get(url, headers=headers)
+        # 304(변경 없음)나 오류 페이지는 재처리할 가치가 없으므로 저장하지 않음
+        if response.status_code == 200:
+            self.archive.put(url, response.content, encoding=response.encoding)
+        return response
+
+    def stream(self, url: str, headers: dict):
+        # 본문 추출기의 EXTRACT_MAX_BYTES 조기 중단/타임아웃이 그대로 동작하도록 스트리밍 유지
+        if not hasattr(self.inner, "stream"):
+            return self.get(url, headers=headers)
+        return _ArchivingStream(self.inner.stream(url, headers=headers), url, self.archive)
+
+class ArchiveReplayHTTPClient:
+    """
+    보관소에서 응답하는 HTTPClient. at을 주면 그 시각 기준 스냅샷, 없으면 fallback(실제 요청) 또는 404
+    잘린(truncated) 스냅샷은 fallback이 있으면 다시 받고, 없으면 저장된 앞부분만 돌려줌
+    """
+    def __init__(self, archive: HTMLArchive, at: Optional[float] = None, fallback=None):
+        self.archive = archive
+        self.at = at
+        self.fallback = fallback
+
+    def get(self, url: str, headers: dict):
+        page = self.archive.get(url, at=self.at)
+        if self._use_fallback(page):
+            return self.fallback.get(url, headers=headers)
+        return self._response(url, page)
+
+    def stream(self, url: str, headers: dict):
+        # ArchivedResponse가 iter_content/close를 지원하므로 get()과 같은 응답 객체를 그대로 돌려줌
+        page = self.archive.get(url, at=self.at)
+        if self._use_fallback(page):
+            if hasattr(self.fallback, "stream"):
+                return self.fallback.stream(url, headers=headers)
+            return self.fallback.get(url, headers=headers)
+        return self._response(url, page)
+
+    def _use_fallback(self, page: Optional[ArchivedPage]) -> bool:
+        return self.fallback is not None and (page is None or page.truncated)
+
+    @staticmethod
+    def _response(url: str, page: Optional[ArchivedPage]) -> ArchivedResponse:
+        if page is None:
+            return ArchivedResponse(url=url, content=b"", status_code=404)
+        return ArchivedResponse(url=url, content=page.content, status_code=page.status_code, encoding=page.encoding)
+
+# 사용 예시
+if __name__ == "__main__":
+    import tempfile
+
+    from utils.article_extractor import extract_article
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = HTMLArchive(root)
+        url = "https://n.news.naver.com/article/052/0002000000?sid=102"
+        archive.put(url, '<div id="dic_area">정부가 전세사기 피해자 지원 특별법을 시행한다.</div>'.encode("utf-8"))
+        result = extract_article(url, http_client=ArchiveReplayHTTPClient(archive))
+        print(result.status, result.text)
+        archive.close()
@@ -1,23 +1,29 @@
 # 📦 Step 1: 뉴스 링크 크롤링
 # - 네이버 YTN 인기기사 상위 3개 제목 + 링크 가져오기
 
-from dataclasses import dataclass
-from typing import List, Protocol
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Protocol, TYPE_CHECKING
 import requests
-from bs4 import BeautifulSoup
 from abc import ABC, abstractmethod
+from config import settings
+from utils.html_parser import HTMLParserBackend, ParseScope, get_parser
+from utils.metrics import SIZE_BUCKETS, metrics
 
-@dataclass
+if TYPE_CHECKING:
+    from crawler.crawl_state import ConditionalRequestCache, SeenArticleIndex
+
+@dataclass(slots=True)
 class NewsArticle:
     title: str
     link: str
     category: str = "일반"
     summary: str = ""
-    keywords: List[str] = None
+    keywords: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        if self.keywords is None:
-            self.keywords = []
+        # 카테고리는 종류가 몇 개뿐이라 같은 문자열 객체를 공유
+        self.category = sys.intern(self.category)
 
 class NewsSource(Protocol):
     def fetch_articles(self, limit: int = 3) -> List[NewsArticle]:
@@ -31,31 +37,89 @@ class RequestsHTTPClient:
     def get(self, url: str, headers: dict) -> requests.Response:
         return requests.get(url, headers=headers)
 
+RANKING_SELECTOR = "ul.press_ranking_list li.as_thumb a"
+RANKING_SCOPE = ParseScope(name="ul", attrs={"class": "press_ranking_list"})
+
 class NaverNewsCrawler:
     def __init__(
         self,
         http_client: HTTPClient,
         base_url: str = "https://media.naver.com/press/052/ranking",
-        user_agent: str = "Mozilla/5.0"
+        user_agent: str = "Mozilla/5.0",
+        seen_index: Optional["SeenArticleIndex"] = None,
+        conditional_cache: Optional["ConditionalRequestCache"] = None,
+        parser: Optional[HTMLParserBackend] = None
     ):
         self.http_client = http_client
         self.base_url = base_url
         self.headers = {"User-Agent": user_agent}
+        # 둘 다 주입하면 새로 올라온(또는 제목이 바뀐) 기사만 반환
+        self.seen_index = seen_index
+        self.conditional_cache = conditional_cache
+        self.parser = parser or get_parser(settings.HTML_PARSER_BACKEND)
+        # 발송이 끝나기 전까지는 ETag와 본 기사 기록을 미뤄 둠 (commit()에서 저장)
+        self._pending_validators: Dict[str, dict] = {}
+        self._pending_articles: List[NewsArticle] = []
 
     def fetch_articles(self, limit: int = 3, category: str = "popular") -> List[NewsArticle]:
         url = f"{self.base_url}?type={category}"
-        response = self.http_client.get(url, headers=self.headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        articles = soup.select("ul.press_ranking_list li.as_thumb a")
-        return [
+        headers = dict(self.headers)
+        if self.conditional_cache is not None:
+            headers.update(self.conditional_cache.request_headers(url))
+        with metrics.span("crawl.fetch", url=url):
+            response = self.http_client.get(url, headers=headers)
+        metrics.inc("crawl_requests_total", status=response.status_code)
+        # 랭킹 페이지가 바뀌지 않았으면 파싱 없이 종료
+        if response.status_code == 304:
+            return []
+        if self.conditional_cache is not None and response.status_code == 200:
+            self._pending_validators[url] = {
+                name: response.headers.get(name) for name in ("ETag", "Last-Modified") if response.headers.get(name)
+            }
+        if metrics.enabled:
+            size = len(getattr(response, "content", None) or b"")
+            metrics.inc("crawl_bytes_total", size)
+            metrics.observe("crawl_page_bytes", size, buckets=SIZE_BUCKETS)
+        with metrics.span("crawl.parse", parser=self.parser.name):
+            articles = self.parser.select(response.text, RANKING_SELECTOR, scope=RANKING_SCOPE)
+        results = [
             NewsArticle(
-                title=article.get_text(strip=True),
-                link=article['href'],
+                title=article.text,
+                link=article.attrs['href'],
                 category=category
             )
             for article in articles[:limit]
         ]
+        if self.seen_index is not None:
+            results = self.seen_index.filter_new(results)
+        self._pending_articles.extend(results)
+        metrics.inc("crawl_articles_total", len(results), category=category)
+        return results
+
+    @property
+    def pending_articles(self) -> List[NewsArticle]:
+        # 반환했지만 아직 commit()하지 않은 기사
+        return list(self._pending_articles)
+
+    def discard(self, articles: List[NewsArticle]) -> None:
+        # 호출 측에서 버린 기사는 발송 여부와 상관없이 commit()의 대기 목록에서 제외
+        dropped = {id(article) for article in articles}
+        self._pending_articles = [article for article in self._pending_articles if id(article) not in dropped]
+
+    def commit(self, delivered: Optional[List[NewsArticle]] = None) -> None:
+        """
+        발송까지 끝난 뒤 호출: delivered(기본: 이번에 반환한 기사 전부)를 본 것으로 기록하고,
+        반환한 기사가 모두 발송됐을 때만 ETag / Last-Modified를 저장 (하나라도 실패하면 다음 실행에서 다시 받음)
+        """
+        pending, self._pending_articles = self._pending_articles, []
+        validators, self._pending_validators = self._pending_validators, {}
+        delivered = pending if delivered is None else delivered
+        if self.seen_index is not None and delivered:
+            self.seen_index.mark(delivered)
+        delivered_links = {article.link for article in delivered}
+        if self.conditional_cache is not None and all(article.link in delivered_links for article in pending):
+            for url, headers in validators.items():
+                self.conditional_cache.store(url, headers)
 
 # 사용 예시
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+# 📦 작업 핸들러: crawl → extract → summarize → deliver
+# - 각 단계는 결과를 다음 단계 작업의 payload로 넘기므로, 발송 중 죽어도 크롤링/요약은 다시 하지 않음
+
+import asyncio
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional
+
+from config import settings
+from crawler.crawl_engine import NaverCrawlEngine
+from crawler.crawl_state import SeenArticleIndex, article_id_from_link
+from crawler.naver_ranking_crawler import NewsArticle, NewsSource
+from jobs.job_queue import JOB_CRAWL, JOB_DELIVER, JOB_EXTRACT, JOB_SUMMARIZE, Job, JobQueue
+from messenger.kakao_sender import KakaoRestApiSender, KakaoSender
+from messenger.message_formatter import MessageFormatter
+from summaries.dummy_summarizer import DummySummarizer
+from summaries.news_summarizer import Summarizer
+from summaries.summary_cache import summary_from_json, summary_to_json
+from utils.article_extractor import ArticleExtraction, extract_article
+from utils.http_transport import PooledHTTPClient
+
+class JobFailed(Exception):
+    """
+    재시도해도 소용없는 실패 (본문 없음 등)
+    """
+
+class JobHandlers:
+    """
+    워커 프로세스마다 하나씩 만들어 쓰는 단계별 작업 처리기
+    """
+    def __init__(
+        self,
+        source: NewsSource,
+        summarizer: Summarizer,
+        sender: KakaoSender,
+        receiver_uuids: List[str],
+        extractor: Callable[[str], ArticleExtraction] = extract_article,
+        formatter: Optional[MessageFormatter] = None
+    ):
+        self.source = source
+        self.summarizer = summarizer
+        self.sender = sender
+        self.receiver_uuids = receiver_uuids
+        self.extractor = extractor
+        self.formatter = formatter or MessageFormatter()
+        # 발송용 이벤트 루프는 프로세스 당 하나만 만들어 재사용
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def handle(self, job: Job, queue: JobQueue) -> None:
+        handlers: Dict[str, Callable[[Job, JobQueue], None]] = {
+            JOB_CRAWL: self.crawl,
+            JOB_EXTRACT: self.extract,
+            JOB_SUMMARIZE: self.summarize,
+            JOB_DELIVER: self.deliver,
+        }
+        handlers[job.kind](job, queue)
+
+    def crawl(self, job: Job, queue: JobQueue) -> None:
+        articles = self.source.fetch_articles(limit=job.payload.get("limit", 3))
+        print(f"[크롤링] {len(articles)}건")
+        for article in articles:
+            key = f"{job.run_id}:{article_id_from_link(article.link)}"
+            queue.enqueue(JOB_EXTRACT, key, {"article": asdict(article)}, job.run_id)
+
+    def extract(self, job: Job, queue: JobQueue) -> None:
+        article = NewsArticle(**job.payload["article"])
+        extraction = self.extractor(article.link)
+        if not extraction.ok:
+            raise JobFailed(f"본문 추출 실패: {extraction.status}")
+        queue.enqueue(JOB_SUMMARIZE, job.key, {"article": job.payload["article"], "text": extraction.text}, job.run_id)
+
+    def summarize(self, job: Job, queue: JobQueue) -> None:
+        summary = self.summarizer.summarize(job.payload["text"])
+        if not summary.summary:
+            raise JobFailed("빈 요약")
+        queue.enqueue(
+            JOB_DELIVER,
+            job.key,
+            {"article": job.payload["article"], "summary": summary_to_json(summary)},
+            job.run_id
+        )
+
+    def deliver(self, job: Job, queue: JobQueue) -> None:
+        article = NewsArticle(**job.payload["article"])
+        summary = summary_from_json(job.payload["summary"])
+        message = self.formatter.format_news_message([article], [summary])
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        sent = self._loop.run_until_complete(
+            self.sender.send_message(message, receiver_uuids=self.receiver_uuids)
+        )
+        if not sent:
+            raise RuntimeError("카카오톡 발송 실패")
+        if hasattr(self.source, "commit"):
+            self.source.commit([article])
+        print(f"[카카오톡 발송 성공] {article.title}")
+
+def default_handlers() -> JobHandlers:
+    # main.py의 파이프라인과 같은 구성
+    # (크롤링과 발송이 다른 워커 프로세스에서 끝나므로 ETag 캐시는 쓰지 않고, 발송한 기사만 본 것으로 기록)
+    return JobHandlers(
+        source=NaverCrawlEngine(PooledHTTPClient(), seen_index=SeenArticleIndex()),
+        summarizer=DummySummarizer(),
+        sender=KakaoRestApiSender(),
+        receiver_uuids=[settings.MY_KAKAO_UUID]
+    )
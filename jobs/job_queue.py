@@ -0,0 +1,181 @@
+# 📦 작업 큐: SQLite 기반의 내구성 있는 단계별 작업 큐 (DATABASE_URL 사용)
+# - (kind, key)가 같으면 한 번만 등록 → 재시도/재실행해도 같은 작업이 중복되지 않음
+# - 작업은 lease(임대 시간)를 두고 가져감 → 워커가 죽으면 lease 만료 후 다른 워커가 이어서 처리
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from config import settings
+from utils.sqlite_db import connect
+
+JOB_CRAWL = "crawl"
+JOB_EXTRACT = "extract"
+JOB_SUMMARIZE = "summarize"
+JOB_DELIVER = "deliver"
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+@dataclass
+class Job:
+    id: int
+    run_id: str
+    kind: str
+    key: str
+    payload: Any
+    attempts: int
+
+class JobQueue:
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        max_attempts: int = settings.JOB_MAX_ATTEMPTS,
+        lease_seconds: float = settings.JOB_LEASE_SECONDS
+    ):
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self._conn = connect(database_url)
+        # 여러 프로세스가 같은 DB에 쓰므로 잠금이 풀릴 때까지 기다림
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.isolation_level = None
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_until REAL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                UNIQUE (kind, key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_status ON jobs (status, lease_until)")
+
+    def enqueue(self, kind: str, key: str, payload: Any, run_id: str) -> bool:
+        """
+        작업을 등록합니다. 같은 (kind, key)가 이미 있으면 무시하고 False를 반환합니다.
+        """
+        now = time.time()
+        cursor = self._conn.execute(
+            """
+            INSERT OR IGNORE INTO jobs (run_id, kind, key, payload, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (run_id, kind, key, json.dumps(payload, ensure_ascii=False), STATUS_PENDING, now, now)
+        )
+        return cursor.rowcount == 1
+
+    def claim(self, worker_id: Optional[str] = None) -> Optional[Job]:
+        """
+        대기 중이거나 lease가 만료된 작업 하나를 가져옵니다. 앞 단계 작업을 먼저 처리합니다.
+        가져갈 때마다 시도 횟수를 올리므로 워커가 죽어 lease가 만료/반환된 작업도 한 번 시도한 것으로 셈하고,
+        이미 max_attempts번 시도한 작업은 가져가지 않고 실패로 표시합니다. (프로세스를 죽이는 작업이 무한 반복되지 않도록)
+        """
+        worker_id = worker_id or str(os.getpid())
+        now = time.time()
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, lease_until = NULL, error = COALESCE(error, ?), updated_at = ?
+                WHERE attempts >= ? AND (status = ? OR (status = ? AND lease_until < ?))
+                """,
+                (STATUS_FAILED, "재시도 횟수 초과 (처리 중 워커 종료)", now, self.max_attempts, STATUS_PENDING, STATUS_RUNNING, now)
+            )
+            row = self._conn.execute(
+                """
+                SELECT id, run_id, kind, key, payload, attempts FROM jobs
+                WHERE (status = ? OR (status = ? AND lease_until < ?)) AND attempts < ?
+                ORDER BY CASE kind WHEN ? THEN 0 WHEN ? THEN 1 WHEN ? THEN 2 ELSE 3 END, id
+                LIMIT 1
+                """,
+                (STATUS_PENDING, STATUS_RUNNING, now, self.max_attempts, JOB_CRAWL, JOB_EXTRACT, JOB_SUMMARIZE)
+            ).fetchone()
+            if row is None:
+                self._conn.execute("COMMIT")
+                return None
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_until = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (STATUS_RUNNING, worker_id, now + self.lease_seconds, now, row[0])
+            )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+        return Job(id=row[0], run_id=row[1], kind=row[2], key=row[3], payload=json.loads(row[4]), attempts=row[5] + 1)
+
+    def complete(self, job: Job) -> None:
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, lease_until = NULL, error = NULL, updated_at = ? WHERE id = ?",
+            (STATUS_DONE, time.time(), job.id)
+        )
+
+    def fail(self, job: Job, error: str, retry: bool = True) -> None:
+        # 재시도 횟수가 남았으면 다시 대기 상태로
+        status = STATUS_PENDING if retry and job.attempts < self.max_attempts else STATUS_FAILED
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, lease_until = NULL, error = ?, updated_at = ? WHERE id = ?",
+            (status, error, time.time(), job.id)
+        )
+
+    def recover(self) -> int:
+        """
+        lease 만료 여부와 관계없이 실행 중으로 남은 작업을 대기 상태로 돌립니다. (모든 워커가 멈춘 뒤 재시작할 때)
+        """
+        return self._conn.execute(
+            "UPDATE jobs SET status = ?, lease_until = NULL, updated_at = ? WHERE status = ?",
+            (STATUS_PENDING, time.time(), STATUS_RUNNING)
+        ).rowcount
+
+    def release(self, worker_id: str) -> int:
+        """
+        특정 워커가 잡고 있던 실행 중 작업을 대기 상태로 돌립니다. (워커 프로세스가 죽었을 때)
+        시도 횟수를 다 쓴 작업은 대기 상태로 돌리지 않고 실패로 표시합니다.
+        """
+        return self._conn.execute(
+            """
+            UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+                error = CASE WHEN attempts >= ? THEN COALESCE(error, ?) ELSE error END,
+                lease_until = NULL, updated_at = ?
+            WHERE status = ? AND lease_owner = ?
+            """,
+            (
+                self.max_attempts, STATUS_FAILED, STATUS_PENDING,
+                self.max_attempts, "재시도 횟수 초과 (처리 중 워커 종료)",
+                time.time(), STATUS_RUNNING, worker_id
+            )
+        ).rowcount
+
+    def unfinished(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (STATUS_PENDING, STATUS_RUNNING)
+        ).fetchone()[0]
+
+    def counts(self, run_id: Optional[str] = None) -> dict:
+        query = "SELECT kind, status, COUNT(*) FROM jobs"
+        params: List[str] = []
+        if run_id is not None:
+            query += " WHERE run_id = ?"
+            params.append(run_id)
+        rows = self._conn.execute(query + " GROUP BY kind, status", params).fetchall()
+        return {f"{kind}:{status}": count for kind, status, count in rows}
+
+    def close(self) -> None:
+        self._conn.close()
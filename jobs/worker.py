@@ -0,0 +1,107 @@
+# 📦 워커 풀: 여러 프로세스가 같은 작업 큐에서 작업을 가져와 처리
+
+import multiprocessing
+import os
+import queue as queue_module
+import time
+from typing import Callable, Optional
+
+from config import settings
+from jobs.handlers import JobFailed, JobHandlers, default_handlers
+from jobs.job_queue import JOB_CRAWL, JobQueue
+from utils.metrics import metrics
+
+def enqueue_run(run_id: str, limit: int = 3, database_url: Optional[str] = None) -> bool:
+    """
+    하루치 실행을 등록합니다. 같은 run_id로 다시 불러도 crawl 작업은 한 번만 생깁니다.
+    """
+    queue = JobQueue(database_url)
+    try:
+        return queue.enqueue(JOB_CRAWL, run_id, {"limit": limit}, run_id)
+    finally:
+        queue.close()
+
+def worker_loop(
+    database_url: Optional[str] = None,
+    handlers_factory: Callable[[], JobHandlers] = default_handlers,
+    stop_when_idle: bool = True,
+    poll_seconds: float = 1.0,
+    metrics_queue: Optional[multiprocessing.Queue] = None
+) -> None:
+    queue = JobQueue(database_url)
+    handlers = handlers_factory()
+    worker_id = f"{os.getpid()}"
+    try:
+        while True:
+            job = queue.claim(worker_id)
+            if job is None:
+                # 다른 워커가 처리 중인 작업이 다음 단계 작업을 만들 수 있으므로 모두 끝날 때까지 대기
+                if stop_when_idle and queue.unfinished() == 0:
+                    return
+                time.sleep(poll_seconds)
+                continue
+            try:
+                handlers.handle(job, queue)
+                queue.complete(job)
+            except JobFailed as e:
+                print(f"[작업 중단] {job.kind} {job.key}: {e}")
+                queue.fail(job, str(e), retry=False)
+            except Exception as e:
+                print(f"[작업 실패] {job.kind} {job.key} ({job.attempts}회): {e}")
+                queue.fail(job, str(e))
+    finally:
+        queue.close()
+        # 워커 프로세스의 계측 기록은 부모(run_worker_pool)가 합쳐서 내보냄
+        if metrics_queue is not None:
+            metrics_queue.put(metrics.state())
+
+def run_worker_pool(
+    processes: int = settings.JOB_WORKERS,
+    database_url: Optional[str] = None,
+    handlers_factory: Callable[[], JobHandlers] = default_handlers
+) -> dict:
+    """
+    워커 프로세스를 띄워 큐가 빌 때까지 처리합니다.
+    시작할 때 실행 중으로 남은 작업(이전 실행이 죽은 흔적)을 대기 상태로 되돌립니다.
+    """
+    queue = JobQueue(database_url)
+    recovered = queue.recover()
+    if recovered:
+        print(f"[작업 큐] 중단된 작업 {recovered}건을 이어서 처리합니다.")
+
+    context = multiprocessing.get_context("spawn")
+    # 계측을 켰으면 워커가 끝날 때 보낸 기록을 이 프로세스의 metrics에 합침 (비정상 종료한 워커의 기록은 잃음)
+    metrics_queue = context.Queue() if metrics.enabled else None
+
+    def spawn() -> multiprocessing.Process:
+        worker = context.Process(target=worker_loop, args=(database_url, handlers_factory), kwargs={"metrics_queue": metrics_queue})
+        worker.start()
+        return worker
+
+    def collect_metrics() -> None:
+        # 큐를 비워 줘야 기록을 보낸 워커가 종료할 수 있음
+        while metrics_queue is not None:
+            try:
+                metrics.merge(metrics_queue.get_nowait())
+            except queue_module.Empty:
+                return
+
+    workers = [spawn() for _ in range(max(1, processes))]
+    while workers:
+        time.sleep(0.2)
+        collect_metrics()
+        for worker in list(workers):
+            if worker.is_alive():
+                continue
+            workers.remove(worker)
+            if worker.exitcode != 0:
+                # 비정상 종료한 워커가 잡고 있던 작업은 lease 만료를 기다리지 않고 바로 되돌린 뒤 새 워커로 대체
+                released = queue.release(str(worker.pid))
+                print(f"[작업 큐] 워커 {worker.pid} 비정상 종료 (exit {worker.exitcode}), 작업 {released}건 재등록")
+                if queue.unfinished():
+                    workers.append(spawn())
+
+    collect_metrics()
+    counts = queue.counts()
+    queue.close()
+    return counts
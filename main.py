@@ -1,52 +1,99 @@
-from crawler.naver_ranking_crawler import NaverNewsCrawler, RequestsHTTPClient
-from utils.article_extractor import extract_article_text
+from crawler.crawl_engine import NaverCrawlEngine
+from crawler.crawl_state import ConditionalRequestCache, SeenArticleIndex
+from crawler.html_archive import ArchivingHTTPClient, HTMLArchive
+from utils.article_extractor import extract_article
+from utils.http_transport import get_default_http_client
 # from summaries.news_summarizer import GPTNewsSummarizer
 from summaries.dummy_summarizer import DummySummarizer
-from messenger.message_formatter import MessageFormatter
 from messenger.kakao_sender import KakaoRestApiSender
+from messenger.bulk_sender import KakaoBulkSender
+from pipeline.news_pipeline import NewsPipeline, PipelineConfig
+from pipeline.precompute import DigestSnapshotStore, Precomputer, SnapshotDelivery
+from subscriptions.digest_planner import DigestPlanner
+from subscriptions.subscription_store import SubscriptionStore
+from jobs.worker import enqueue_run, run_worker_pool
 import asyncio
-import openai
+from datetime import datetime, timedelta
+from functools import partial
+from typing import List
 from config import settings
-from typing import Optional
+from utils.metrics import metrics
 from apscheduler.schedulers.blocking import BlockingScheduler
 
-# 통합 테스트: 뉴스 크롤링 → 본문 추출 → 요약/단어설명+예문 → 메시지 포맷 → 카카오톡 발송
-
-def main():
-    # 1. 뉴스 크롤링 (테스트는 1개만)
-    crawler = NaverNewsCrawler(RequestsHTTPClient())
-    articles = crawler.fetch_articles(limit=1)
-    if not articles:
-        print("크롤링 결과가 없습니다.")
-        return
-
-    for article in articles:
-        print(f"[크롤링] {article.title} ({article.link})")
-        # 2. 기사 본문 추출
-        article_text = extract_article_text(article.link)
-        print(f"[본문 일부] {article_text[:100]}...")
-
-        # 3. 요약 및 단어 설명/예문 생성
-        summarizer = DummySummarizer()
-        summary_result = summarizer.summarize(article_text)
-
-        # 4. 메시지 포맷팅
-        formatter = MessageFormatter()
-        message = formatter.format_news_message([article], [summary_result])
-        print("[카카오톡 메시지 미리보기]\n", message.content)
-
-        # 5. 카카오톡 발송 (비동기)
-        async def send():
-            sender = KakaoRestApiSender()
-            success = await sender.send_message(message, receiver_uuids=[settings.MY_KAKAO_UUID])
-            print("[카카오톡 발송 결과]", "성공" if success else "실패")
-        asyncio.run(send())
+# 뉴스 봇 서버: 매일 작업 큐(crawl → extract → summarize → deliver)로 발송하거나, 미리 계산한 스냅샷으로 발송
+# 구독자 다이제스트는 발송 창이 열릴 때마다 스냅샷으로 나눠 발송
+
+def build_crawl_engine(http_client) -> NaverCrawlEngine:
+    # 이미 보낸 기사는 다시 보내지 않고, 바뀌지 않은 랭킹 페이지는 304로 건너뜀 (발송 뒤 source.commit()에서 기록)
+    return NaverCrawlEngine(http_client, seen_index=SeenArticleIndex(), conditional_cache=ConditionalRequestCache())
+
+def scheduled_run():
+    # 날짜를 run_id로 작업 큐에 등록하고 워커 풀로 처리 (같은 날 다시 실행해도 끝난 단계는 건너뜀)
+    run_id = datetime.now().strftime("%Y-%m-%d")
+    enqueue_run(run_id, limit=1)
+    print("[작업 큐] 결과:", run_worker_pool())
+    # 워커 프로세스의 계측까지 합친 누적값을 METRICS_REPORT_PATH / METRICS_PROMETHEUS_PATH에 씀
+    metrics.export()
+
+def build_snapshot_delivery() -> SnapshotDelivery:
+    # 미리 계산 모드와 구독자 발송이 함께 쓰는 스냅샷 (크롤러/본문 추출기가 같은 커넥션 풀을 공유)
+    # 보관을 켜면 받은 랭킹/기사 페이지를 저장 (나중에 ArchiveReplayHTTPClient로 재처리, 서버 프로세스가 끝날 때까지 열어 둠)
+    http_client = get_default_http_client()
+    if settings.ARCHIVE_ENABLED:
+        http_client = ArchivingHTTPClient(http_client, HTMLArchive())
+    pipeline = NewsPipeline(
+        source=build_crawl_engine(http_client),
+        summarizer=DummySummarizer(),
+        sender=KakaoRestApiSender(),
+        receiver_uuids=[settings.MY_KAKAO_UUID],
+        extractor=partial(extract_article, http_client=http_client),
+        config=PipelineConfig.from_settings(settings),
+        http_client=http_client
+    )
+    # 구독자 다이제스트가 카테고리마다 MAX_ARTICLES_PER_CATEGORY개씩 고를 수 있을 만큼
+    limit = settings.MAX_ARTICLES_PER_CATEGORY * len(settings.NEWS_CATEGORIES)
+    precomputer = Precomputer(pipeline=pipeline, store=DigestSnapshotStore(), limit=limit)
+    return SnapshotDelivery(precomputer=precomputer, planner=DigestPlanner(SubscriptionStore()))
+
+def schedule_precompute(scheduler: BlockingScheduler, delivery: SnapshotDelivery) -> None:
+    # 미리 계산 모드: 크롤링/요약은 주기적으로(+발송 직전에 한 번 더) 돌리고, 발송 시각에는 준비된 스냅샷만 포맷해 발송
+    refresh = lambda: asyncio.run(delivery.precomputer.refresh())
+    send_at = datetime.strptime(settings.DEFAULT_SEND_SLOT, "%H:%M")
+    refresh_at = send_at - timedelta(minutes=settings.PRECOMPUTE_LEAD_MINUTES + settings.DELIVERY_MAX_EARLY_MINUTES)
+    scheduler.add_job(refresh, 'interval', minutes=settings.CRAWL_INTERVAL_MINUTES, next_run_time=datetime.now())
+    scheduler.add_job(refresh, 'cron', hour=refresh_at.hour, minute=refresh_at.minute)
+    scheduler.add_job(lambda: asyncio.run(delivery.deliver()), 'cron', hour=send_at.hour, minute=send_at.minute)
+
+def schedule_subscriber_delivery(scheduler: BlockingScheduler, delivery: SnapshotDelivery) -> None:
+    # 구독자 발송: 슬롯 정각에 한꺼번에 보내지 않고, 발송 창(슬롯 - DELIVERY_MAX_EARLY_MINUTES)이 열리면
+    # DeliveryScheduler가 카카오 한도 안에서 tick마다 나눠 발송 (발송 중에도 다음 창을 열 수 있도록 창마다 별도 작업)
+    store = delivery.planner.store
+
+    def run_window(send_slots: List[str], day) -> None:
+        asyncio.run(delivery.deliver_subscribers(send_slots, KakaoBulkSender(), day=day))
+
+    def open_windows() -> None:
+        opening = datetime.now() + timedelta(minutes=settings.DELIVERY_MAX_EARLY_MINUTES)
+        send_slots = [slot for slot in store.send_slots() if slot == opening.strftime("%H:%M")]
+        if send_slots:
+            print(f"[발송 스케줄] {', '.join(send_slots)} 구독자 발송 창을 엽니다.")
+            scheduler.add_job(run_window, args=[send_slots, opening.date()])
+
+    scheduler.add_job(open_windows, 'cron', minute='*')
 
 if __name__ == "__main__":
     scheduler = BlockingScheduler()
-    scheduler.add_job(main, 'cron', hour=8, minute=0)
-    print("[스케줄러] 매일 오전 8시에 뉴스가 자동 발송됩니다. (서버 실행 중)")
+    delivery = build_snapshot_delivery()
+    if settings.PRECOMPUTE_ENABLED:
+        schedule_precompute(scheduler, delivery)
+        print(f"[스케줄러] {settings.CRAWL_INTERVAL_MINUTES}분마다 미리 계산하고 매일 {settings.DEFAULT_SEND_SLOT}에 발송합니다. (서버 실행 중)")
+    else:
+        # 이전 실행이 중간에 멈췄다면 남은 작업부터 이어서 처리
+        run_worker_pool()
+        scheduler.add_job(scheduled_run, 'cron', hour=8, minute=0)
+        print("[스케줄러] 매일 오전 8시에 뉴스가 자동 발송됩니다. (서버 실행 중)")
+    schedule_subscriber_delivery(scheduler, delivery)
     try:
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
-        print("[스케줄러] 종료됨") 
\ No newline at end of file
+        print("[스케줄러] 종료됨")
@@ -0,0 +1,184 @@
+# 📦 대량 발송: 수신자를 API 단위 묶음으로 나눠 토큰 버킷 속도 제한 아래에서 동시 발송
+# - 429/5xx 응답은 지터가 섞인 지수 백오프로 재시도
+# - 수신자별 발송 결과를 돌려줌
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from urllib.parse import urlencode
+
+from config import settings
+from messenger.message_formatter import FormattedMessage
+from utils.http_transport import AsyncHTTPTransport, request_timeout, session_scope
+from utils.metrics import metrics
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass
+class DeliveryResult:
+    receiver_uuid: str
+    success: bool
+    status: Optional[int] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰을 채우고, 최대 capacity개까지 몰아서 쓸 수 있는 비동기 토큰 버킷
+    """
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class KakaoBulkSender:
+    """
+    카카오 REST API(친구에게 메시지) 대량 발송용
+    """
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://kapi.kakao.com/v2/api/talk/message/default/send",
+        transport: Optional[AsyncHTTPTransport] = None,
+        batch_size: int = settings.KAKAO_BATCH_SIZE,
+        concurrency: int = settings.KAKAO_SEND_CONCURRENCY,
+        rate_per_second: float = settings.KAKAO_SEND_RATE_PER_SECOND,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0
+    ):
+        self.api_key = api_key or settings.KAKAO_REST_API_KEY
+        self.base_url = base_url
+        self.transport = transport
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate_per_second)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+
+    async def send_message(self, message: FormattedMessage, receiver_uuids: List[str]) -> bool:
+        """
+        KakaoSender 프로토콜 호환용: 모든 수신자에게 발송되었는지 여부만 반환
+        """
+        results = await self.send_bulk(message, receiver_uuids)
+        return all(result.success for result in results)
+
+    async def send_bulk(self, message: FormattedMessage, receiver_uuids: List[str]) -> List[DeliveryResult]:
+        """
+        수신자 목록을 batch_size 단위로 나눠 동시에 발송합니다.
+
+        Args:
+            message: 포맷팅된 메시지
+            receiver_uuids: 수신자 UUID 목록
+
+        Returns:
+            List[DeliveryResult]: 수신자별 발송 결과 (입력 순서 유지)
+        """
+        # 메시지 부분은 한 번만 인코딩하고 묶음마다 수신자 목록만 덧붙임
+        encoded_message = urlencode({
+            "template_id": message.template_id,
+            "template_args": json.dumps({"title": message.title, "content": message.content}, ensure_ascii=False)
+        })
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send_batch(batch: List[str]) -> List[DeliveryResult]:
+            async with semaphore:
+                return await self._send_batch(encoded_message, batch)
+
+        batches = await asyncio.gather(*(
+            send_batch(batch) for batch in chunked(receiver_uuids, self.batch_size)
+        ))
+        return [result for batch in batches for result in batch]
+
+    async def _send_batch(self, encoded_message: str, batch: List[str]) -> List[DeliveryResult]:
+        data = f"{encoded_message}&{urlencode({'receiver_uuids': json.dumps(batch)})}".encode("ascii")
+        status: Optional[int] = None
+        error: Optional[str] = None
+        for attempt in range(1, self.max_retries + 2):
+            await self.bucket.acquire()
+            retry_after: Optional[float] = None
+            if attempt > 1:
+                metrics.inc("kakao_retries_total", sender="bulk")
+            try:
+                with metrics.span("send", sender="bulk", receivers=len(batch), attempt=attempt):
+                    async with session_scope(self.transport) as session:
+                        async with session.post(
+                            self.base_url, headers=self.headers, data=data, timeout=request_timeout(self.transport)
+                        ) as response:
+                            status = response.status
+                            metrics.inc("kakao_requests_total", sender="bulk", status=status)
+                            metrics.inc("kakao_sent_bytes_total", len(data), sender="bulk")
+                            if status == 200:
+                                body = await response.json(content_type=None)
+                                return self._parse_results(batch, body, attempt)
+                            error = await response.text()
+                            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            except Exception as e:
+                status, error = None, str(e)
+
+            if status is not None and status not in RETRYABLE_STATUSES:
+                break
+            if attempt <= self.max_retries:
+                await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+        metrics.inc("kakao_failures_total", len(batch), sender="bulk")
+        print(f"대량 발송 실패 ({len(batch)}명): {status} {error}")
+        return [
+            DeliveryResult(receiver_uuid=uuid, success=False, status=status, attempts=attempt, error=error)
+            for uuid in batch
+        ]
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _parse_results(self, batch: List[str], body: Optional[dict], attempt: int) -> List[DeliveryResult]:
+        # 응답에 성공 목록이 있으면 수신자별로 판정, 없으면 묶음 전체를 성공으로 봄
+        body = body or {}
+        successful = body.get("successful_receiver_uuids")
+        failures = {}
+        for info in body.get("failure_info", []):
+            for uuid in info.get("receiver_uuids", []):
+                failures[uuid] = info.get("msg") or str(info.get("code"))
+        results = []
+        for uuid in batch:
+            ok = uuid not in failures and (successful is None or uuid in successful)
+            results.append(DeliveryResult(
+                receiver_uuid=uuid,
+                success=ok,
+                status=200,
+                attempts=attempt,
+                error=None if ok else failures.get(uuid, "not in successful_receiver_uuids")
+            ))
+        return results
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
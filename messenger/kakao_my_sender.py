@@ -1,37 +1,39 @@
-import aiohttp
-import json
-from messenger.message_formatter import FormattedMessage
+from typing import Optional
+from messenger.message_formatter import FormattedMessage, encode_template_object
+from utils.http_transport import AsyncHTTPTransport, request_timeout, session_scope
+from utils.metrics import metrics
 
 class KakaoMySender:
     """
     카카오톡 나에게 보내기 API 전용 (사업자/채널 없이 본인 계정에만 메시지 전송)
     """
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, transport: Optional[AsyncHTTPTransport] = None):
         self.access_token = access_token
         self.base_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        self.transport = transport
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/x-www-form-urlencoded"
         }
 
     async def send_to_me(self, message: FormattedMessage) -> bool:
-        data = {
-            "template_object": json.dumps({
-                "object_type": "text",
-                "text": message.content,
-                "link": {"web_url": "https://developers.kakao.com"}
-            })
-        }
+        # 포맷 단계에서 미리 인코딩해 둔 본문이 있으면 그대로 전송
+        data = message.template_object or encode_template_object(message.content)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    headers=self.headers,
-                    data=data
-                ) as response:
-                    if response.status != 200:
-                        print("카카오 나에게 보내기 응답:", response.status, await response.text())
-                    return response.status == 200
+            with metrics.span("send", sender="my_memo", receivers=1):
+                async with session_scope(self.transport) as session:
+                    async with session.post(
+                        self.base_url,
+                        headers=self.headers,
+                        data=data,
+                        timeout=request_timeout(self.transport)
+                    ) as response:
+                        metrics.inc("kakao_requests_total", sender="my_memo", status=response.status)
+                        metrics.inc("kakao_sent_bytes_total", len(data), sender="my_memo")
+                        if response.status != 200:
+                            print("카카오 나에게 보내기 응답:", response.status, await response.text())
+                        return response.status == 200
         except Exception as e:
+            metrics.inc("kakao_failures_total", sender="my_memo")
             print(f"나에게 보내기 발송 중 오류 발생: {e}")
             return False 
\ No newline at end of file
@@ -1,8 +1,9 @@
 from typing import List, Optional, Protocol
-import aiohttp
 from dataclasses import dataclass
 from config import settings
-from messenger.message_formatter import FormattedMessage
+from messenger.message_formatter import FormattedMessage, encode_template_object
+from utils.http_transport import AsyncHTTPTransport, request_timeout, session_scope
+from utils.metrics import metrics
 
 @dataclass
 class KakaoMessage:
@@ -21,10 +22,12 @@ class KakaoRestApiSender:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        base_url: str = "https://kapi.kakao.com/v2/api/talk/message/default/send"
+        base_url: str = "https://kapi.kakao.com/v2/api/talk/message/default/send",
+        transport: Optional[AsyncHTTPTransport] = None
     ):
         self.api_key = api_key or settings.KAKAO_REST_API_KEY
         self.base_url = base_url
+        self.transport = transport
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/x-www-form-urlencoded"
@@ -51,18 +54,22 @@ class KakaoRestApiSender:
         )
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    headers=self.headers,
-                    data={
-                        "template_id": kakao_message.template_id,
-                        "template_args": kakao_message.template_args,
-                        "receiver_uuids": kakao_message.receiver_uuids
-                    }
-                ) as response:
-                    return response.status == 200
+            with metrics.span("send", sender="rest_api", receivers=len(receiver_uuids)):
+                async with session_scope(self.transport) as session:
+                    async with session.post(
+                        self.base_url,
+                        headers=self.headers,
+                        data={
+                            "template_id": kakao_message.template_id,
+                            "template_args": kakao_message.template_args,
+                            "receiver_uuids": kakao_message.receiver_uuids
+                        },
+                        timeout=request_timeout(self.transport)
+                    ) as response:
+                        metrics.inc("kakao_requests_total", sender="rest_api", status=response.status)
+                        return response.status == 200
         except Exception as e:
+            metrics.inc("kakao_failures_total", sender="rest_api")
             print(f"REST API 메시지 발송 중 오류 발생: {e}")
             return False
 
@@ -71,9 +78,15 @@ class KakaoAlimtalkSender:
     카카오 알림톡(비즈 인증) 발송용 - 실제 운영 시 사용
     (실제 엔드포인트/파라미터는 알림톡 가이드에 맞게 수정 필요)
     """
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://alimtalk-api.kakao.com/send"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://alimtalk-api.kakao.com/send",
+        transport: Optional[AsyncHTTPTransport] = None
+    ):
         self.api_key = api_key or settings.KAKAO_REST_API_KEY
         self.base_url = base_url
+        self.transport = transport
         self.headers = {
             "Authorization": f"KakaoAK {self.api_key}",
             "Content-Type": "application/json"
@@ -87,14 +100,18 @@ class KakaoAlimtalkSender:
             "message": message.content
         }
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    headers=self.headers,
-                    json=payload
-                ) as response:
-                    return response.status == 200
+            with metrics.span("send", sender="alimtalk", receivers=len(receiver_uuids)):
+                async with session_scope(self.transport) as session:
+                    async with session.post(
+                        self.base_url,
+                        headers=self.headers,
+                        json=payload,
+                        timeout=request_timeout(self.transport)
+                    ) as response:
+                        metrics.inc("kakao_requests_total", sender="alimtalk", status=response.status)
+                        return response.status == 200
         except Exception as e:
+            metrics.inc("kakao_failures_total", sender="alimtalk")
             print(f"알림톡 발송 중 오류 발생: {e}")
             return False
 
@@ -102,34 +119,34 @@ class KakaoSelfMessageSender:
     """
     카카오톡 나에게 보내기 API 전용 (사업자/채널 없이 본인 계정에만 메시지 전송)
     """
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, transport: Optional[AsyncHTTPTransport] = None):
         self.access_token = access_token
         self.base_url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
+        self.transport = transport
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/x-www-form-urlencoded"
         }
 
     async def send_to_me(self, message: FormattedMessage) -> bool:
-        import json
-        data = {
-            "template_object": json.dumps({
-                "object_type": "text",
-                "text": message.content,
-                "link": {"web_url": "https://developers.kakao.com"}
-            })
-        }
+        # 포맷 단계에서 미리 인코딩해 둔 본문이 있으면 그대로 전송
+        data = message.template_object or encode_template_object(message.content)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    headers=self.headers,
-                    data=data
-                ) as response:
-                    if response.status != 200:
-                        print("카카오 나에게 보내기 응답:", response.status, await response.text())
-                    return response.status == 200
+            with metrics.span("send", sender="self_memo", receivers=1):
+                async with session_scope(self.transport) as session:
+                    async with session.post(
+                        self.base_url,
+                        headers=self.headers,
+                        data=data,
+                        timeout=request_timeout(self.transport)
+                    ) as response:
+                        metrics.inc("kakao_requests_total", sender="self_memo", status=response.status)
+                        metrics.inc("kakao_sent_bytes_total", len(data), sender="self_memo")
+                        if response.status != 200:
+                            print("카카오 나에게 보내기 응답:", response.status, await response.text())
+                        return response.status == 200
         except Exception as e:
+            metrics.inc("kakao_failures_total", sender="self_memo")
             print(f"나에게 보내기 발송 중 오류 발생: {e}")
             return False
 
@@ -1,49 +1,150 @@
-from typing import List
+from typing import List, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlencode
+import hashlib
+import json
 from crawler.naver_ranking_crawler import NewsArticle
 from summaries.news_summarizer import SummaryResult, KeywordDetail
+from utils.metrics import metrics
 
 @dataclass
 class FormattedMessage:
     title: str
     content: str
     template_id: str = "news_summary"  # 카카오톡 템플릿 ID
+    template_object: Optional[bytes] = None  # 미리 인코딩한 '나에게 보내기' 요청 본문
+
+def _summary_fingerprint(summary: SummaryResult) -> str:
+    digest = hashlib.sha1(summary.summary.encode("utf-8"))
+    for keyword in summary.keywords[:3]:
+        digest.update(b"\0" + keyword.encode("utf-8"))
+        detail = summary.keyword_details.get(keyword)
+        if detail:
+            digest.update(b"\1" + detail.explanation.encode("utf-8") + b"\1" + detail.example.encode("utf-8"))
+    return digest.hexdigest()
+
+def encode_template_object(content: str, web_url: str = "https://developers.kakao.com") -> bytes:
+    """
+    카카오 '나에게 보내기' API의 form 본문을 한 번만 만들어 두고 그대로 보낼 수 있도록 bytes로 인코딩
+    """
+    template_object = json.dumps({
+        "object_type": "text",
+        "text": content,
+        "link": {"web_url": web_url}
+    })
+    return urlencode({"template_object": template_object}).encode("ascii")
+
+class _LRU(OrderedDict):
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def lookup(self, key):
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key, value) -> None:
+        self[key] = value
+        if len(self) > self.max_size:
+            self.popitem(last=False)
 
 class MessageFormatter:
-    def __init__(self, template_id: str = "news_summary"):
+    def __init__(self, template_id: str = "news_summary", cache_size: int = 4096):
         self.template_id = template_id
+        # 기사 블록: (기사 링크, 제목, 요약 해시, 템플릿 ID) → 블록 문자열
+        # 다이제스트: 블록 키 목록 → (본문, 인코딩된 template_object)
+        # cache_size=0이면 캐시하지 않음
+        self.cache_size = cache_size
+        self._blocks = _LRU(cache_size)
+        self._digests = _LRU(cache_size)
+        self.hits = 0
+        self.misses = 0
+
+    def _block_key(self, article: NewsArticle, summary: SummaryResult) -> Tuple[str, str, str, str]:
+        return (article.link, article.title, _summary_fingerprint(summary), self.template_id)
     
+    def render_article_block(self, article: NewsArticle, summary: SummaryResult) -> str:
+        if self.cache_size <= 0:
+            return self._render_article_block(article, summary)
+        return self._cached_block(self._block_key(article, summary), article, summary)
+
+    def _cached_block(self, key: Tuple[str, str, str, str], article: NewsArticle, summary: SummaryResult) -> str:
+        block = self._blocks.lookup(key)
+        if block is not None:
+            self.hits += 1
+            return block
+        self.misses += 1
+        block = self._render_article_block(article, summary)
+        self._blocks.store(key, block)
+        return block
+
+    def _render_article_block(self, article: NewsArticle, summary: SummaryResult) -> str:
+        content_parts = []
+        content_parts.append(f"📰 {article.title}")
+        content_parts.append(f"👉 요약: {summary.summary}")
+        content_parts.append(f"🔗 {article.link}")
+        
+        if summary.keywords:
+            content_parts.append("\n📘 오늘의 단어")
+            for keyword in summary.keywords[:3]:  # 상위 3개 키워드만 표시
+                detail: KeywordDetail = summary.keyword_details.get(keyword)
+                if detail:
+                    content_parts.append(f"- {keyword}: {detail.explanation} 예) {detail.example}")
+        
+        content_parts.append("---")
+        return "\n".join(content_parts)
+
     def format_news_message(
         self,
         articles: List[NewsArticle],
-        summaries: List[SummaryResult]
+        summaries: List[SummaryResult],
+        encode: bool = False
+    ) -> FormattedMessage:
+        """
+        캐시된 기사 블록을 이어 붙여 메시지를 만듭니다. 같은 기사 조합의 다이제스트는 한 번만 조립합니다.
+        encode=True면 '나에게 보내기' 요청 본문(template_object)도 함께 인코딩합니다.
+        """
+        with metrics.span("format", articles=len(articles)):
+            return self._format_news_message(articles, summaries, encode)
+
+    def _format_news_message(
+        self,
+        articles: List[NewsArticle],
+        summaries: List[SummaryResult],
+        encode: bool
     ) -> FormattedMessage:
         now = datetime.now().strftime("%Y년 %m월 %d일")
         
         title = f"📢 {now} 오늘의 주요 뉴스"
-        content_parts = []
-        
-        for i, (article, summary) in enumerate(zip(articles, summaries), 1):
-            content_parts.append(f"📰 {article.title}")
-            content_parts.append(f"👉 요약: {summary.summary}")
-            content_parts.append(f"🔗 {article.link}")
-            
-            if summary.keywords:
-                content_parts.append("\n📘 오늘의 단어")
-                for keyword in summary.keywords[:3]:  # 상위 3개 키워드만 표시
-                    detail: KeywordDetail = summary.keyword_details.get(keyword)
-                    if detail:
-                        content_parts.append(f"- {keyword}: {detail.explanation} 예) {detail.example}")
-            
-            content_parts.append("---")
-        
-        content = "\n".join(content_parts)
+        pairs = list(zip(articles, summaries))
+
+        if self.cache_size <= 0:
+            content = "\n".join(self._render_article_block(article, summary) for article, summary in pairs)
+            template_object = encode_template_object(content) if encode else None
+        else:
+            keys = tuple(self._block_key(article, summary) for article, summary in pairs)
+            cached = self._digests.lookup(keys)
+            metrics.inc("format_digest_cache_total", result="miss" if cached is None else "hit")
+            if cached is None:
+                content = "\n".join(
+                    self._cached_block(key, article, summary)
+                    for key, (article, summary) in zip(keys, pairs)
+                )
+                cached = (content, None)
+            content, template_object = cached
+            if encode and template_object is None:
+                template_object = encode_template_object(content)
+            self._digests.store(keys, (content, template_object))
         
         return FormattedMessage(
             title=title,
             content=content,
-            template_id=self.template_id
+            template_id=self.template_id,
+            template_object=template_object if encode else None
         )
 
 # 사용 예시
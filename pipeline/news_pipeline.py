@@ -0,0 +1,229 @@
+# 📦 파이프라인: 크롤링 → 본문 추출 → 요약 → 포맷 → 발송
+# - 단계 사이를 크기가 제한된 asyncio.Queue로 연결
+# - 단계마다 동시 실행 개수를 따로 지정 (느린 기사 하나가 전체를 막지 않도록)
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from crawler.naver_ranking_crawler import HTTPClient, NewsArticle, NewsSource
+from utils.article_extractor import ArticleExtraction, extract_article, fetch_article_html
+from utils.parse_executor import ParseExecutor
+from summaries.news_summarizer import SummaryResult, Summarizer
+from summaries.dedup import NearDuplicateIndex
+from messenger.message_formatter import FormattedMessage, MessageFormatter
+from messenger.kakao_sender import KakaoSender
+from utils.metrics import metrics
+
+# 단계 종료 신호
+_DONE = object()
+
+@dataclass
+class PipelineConfig:
+    queue_size: int = 16
+    extract_concurrency: int = 8
+    summarize_concurrency: int = 4
+    format_concurrency: int = 1
+    send_concurrency: int = 4
+
+    @classmethod
+    def from_settings(cls, settings) -> "PipelineConfig":
+        return cls(
+            queue_size=settings.PIPELINE_QUEUE_SIZE,
+            extract_concurrency=settings.PIPELINE_EXTRACT_CONCURRENCY,
+            summarize_concurrency=settings.PIPELINE_SUMMARIZE_CONCURRENCY,
+            format_concurrency=settings.PIPELINE_FORMAT_CONCURRENCY,
+            send_concurrency=settings.PIPELINE_SEND_CONCURRENCY,
+        )
+
+@dataclass
+class PipelineResult:
+    article: NewsArticle
+    article_text: str = ""
+    extraction: Optional[ArticleExtraction] = None
+    summary: Optional[SummaryResult] = None
+    message: Optional[FormattedMessage] = None
+    sent: bool = False
+    error: Optional[str] = None
+
+class NewsPipeline:
+    """
+    NewsSource / Summarizer / KakaoSender를 받아 기사 단위로 병렬 처리하는 파이프라인
+    """
+    def __init__(
+        self,
+        source: NewsSource,
+        summarizer: Summarizer,
+        sender: KakaoSender,
+        receiver_uuids: List[str],
+        formatter: Optional[MessageFormatter] = None,
+        extractor: Callable[[str], Union[ArticleExtraction, str]] = extract_article,
+        config: Optional[PipelineConfig] = None,
+        deduplicator: Optional[NearDuplicateIndex] = None,
+        parse_executor: Optional[ParseExecutor] = None,
+        http_client: Optional[HTTPClient] = None
+    ):
+        self.source = source
+        self.summarizer = summarizer
+        self.sender = sender
+        self.receiver_uuids = receiver_uuids
+        self.formatter = formatter or MessageFormatter()
+        self.extractor = extractor
+        self.config = config or PipelineConfig()
+        # 주입하면 본문이 거의 같은 기사는 대표 기사의 요약을 재사용
+        self.deduplicator = deduplicator
+        # 실행 단위 상태 (run()마다 초기화)
+        self.saved_summaries = 0
+        # 주입하면 본문 다운로드는 스레드에서, 파싱은 프로세스 풀에서 (extractor 대신 사용)
+        self.parse_executor = parse_executor
+        # parse_executor를 쓸 때 원본 HTML을 받을 클라이언트 (비우면 프로세스 전역 클라이언트)
+        self.http_client = http_client
+        self._summary_futures: Dict[str, asyncio.Future] = {}
+
+    async def run(self, limit: int = 3) -> List[PipelineResult]:
+        articles = await self.crawl(limit)
+        results = await self.process(articles)
+        # 발송까지 끝난 기사만 본 것으로 기록 (크롤링 직후에 기록하면 실패한 기사가 다음 실행에서 빠짐)
+        if hasattr(self.source, "commit"):
+            self.source.commit([item.article for item in results if item.sent])
+        return results
+
+    async def crawl(self, limit: int = 3) -> List[NewsArticle]:
+        try:
+            articles = await asyncio.to_thread(self.source.fetch_articles, limit)
+        except Exception as e:
+            print(f"[크롤링] 오류 발생: {e}")
+            articles = []
+        if not articles:
+            print("크롤링 결과가 없습니다.")
+        for article in articles:
+            print(f"[크롤링] {article.title} ({article.link})")
+        return articles
+
+    async def process(self, articles: List[NewsArticle], send: bool = True) -> List[PipelineResult]:
+        """
+        크롤링한 기사를 본문 추출 → 요약 (→ 포맷 → 발송) 단계로 처리합니다.
+        send=False면 요약까지만 하고 결과를 돌려줌 (미리 계산 모드)
+        """
+        # 이전 실행의 future는 다른 이벤트 루프에 묶여 있을 수 있으므로 실행마다 새로 시작
+        self.saved_summaries = 0
+        self._summary_futures = {}
+        size = self.config.queue_size
+        extract_q: asyncio.Queue = asyncio.Queue(maxsize=size)
+        summarize_q: asyncio.Queue = asyncio.Queue(maxsize=size)
+        format_q: Optional[asyncio.Queue] = asyncio.Queue(maxsize=size) if send else None
+        send_q: asyncio.Queue = asyncio.Queue(maxsize=size)
+        results: List[PipelineResult] = []
+
+        stages = [
+            self._feed(articles, extract_q),
+            self._stage(extract_q, summarize_q, self._extract, self.config.extract_concurrency, results),
+            self._stage(summarize_q, format_q, self._summarize, self.config.summarize_concurrency, results),
+        ]
+        if send:
+            stages += [
+                self._stage(format_q, send_q, self._format, self.config.format_concurrency, results),
+                self._stage(send_q, None, self._send, self.config.send_concurrency, results),
+            ]
+        await asyncio.gather(*stages)
+        return results
+
+    async def _feed(self, articles: List[NewsArticle], out_q: asyncio.Queue) -> None:
+        for article in articles:
+            await out_q.put(PipelineResult(article=article))
+        await out_q.put(_DONE)
+
+    async def _stage(
+        self,
+        in_q: asyncio.Queue,
+        out_q: Optional[asyncio.Queue],
+        handler: Callable[[PipelineResult], Awaitable[None]],
+        concurrency: int,
+        results: List[PipelineResult]
+    ) -> None:
+        async def worker():
+            while True:
+                item: Any = await in_q.get()
+                if item is _DONE:
+                    # 같은 단계의 다른 워커도 종료할 수 있도록 신호를 되돌려 놓음
+                    await in_q.put(_DONE)
+                    return
+                stage = handler.__name__.lstrip('_')
+                try:
+                    with metrics.span(f"pipeline.{stage}"):
+                        await handler(item)
+                except Exception as e:
+                    item.error = f"{stage}: {e}"
+                    print(f"[파이프라인] {item.article.title} 처리 중 오류 발생: {e}")
+                metrics.inc("pipeline_articles_total", stage=stage, result="error" if item.error else "ok")
+                if item.error or out_q is None:
+                    results.append(item)
+                else:
+                    await out_q.put(item)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        if out_q is not None:
+            await out_q.put(_DONE)
+
+    async def _extract(self, item: PipelineResult) -> None:
+        if self.parse_executor is not None:
+            page = await asyncio.to_thread(fetch_article_html, item.article.link, self.http_client)
+            extracted = await self.parse_executor.parse_article(page)
+        else:
+            extracted = await asyncio.to_thread(self.extractor, item.article.link)
+        if isinstance(extracted, ArticleExtraction):
+            item.extraction = extracted
+            if not extracted.ok:
+                # 본문이 없는 기사는 요약/발송하지 않음
+                item.error = f"extract: {extracted.status}"
+                print(f"[본문 추출 실패] {item.article.title} ({extracted.status})")
+                return
+            extracted = extracted.text
+        item.article_text = extracted
+        print(f"[본문 일부] {item.article_text[:100]}...")
+
+    async def _summarize(self, item: PipelineResult) -> None:
+        await self._summarize_item(item)
+        if item.summary is not None and not item.summary.summary:
+            # 요약 백엔드가 모두 실패하면 빈 요약이 옴: 빈 메시지를 보내지 않고 이 기사는 건너뜀
+            item.error = "summarize: 빈 요약"
+            print(f"[요약 실패] {item.article.title} (빈 요약)")
+
+    async def _summarize_item(self, item: PipelineResult) -> None:
+        if self.deduplicator is None:
+            item.summary = await self._call_summarizer(item.article_text)
+            return
+
+        key = item.article.link
+        representative = self.deduplicator.find_or_add(key, item.article_text)
+        # 요약 future는 대표 기사 key로 묶음. 대표 기사가 이전 실행에서 나왔으면 이번 실행에서 처음 온 기사가 요약
+        group = key if representative is None else representative
+        if group in self._summary_futures:
+            summary = await asyncio.shield(self._summary_futures[group])
+            if summary is None:
+                raise RuntimeError("대표 기사 요약 실패")
+            item.summary = summary
+            self.saved_summaries += 1
+            print(f"[중복 기사] {item.article.title} → 대표 기사 요약 재사용")
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._summary_futures[group] = future
+        try:
+            item.summary = await self._call_summarizer(item.article_text)
+        finally:
+            future.set_result(item.summary)
+
+    async def _call_summarizer(self, text: str) -> SummaryResult:
+        # 비동기 요약기는 이벤트 루프에서 바로, 동기 요약기는 스레드에서 실행
+        if hasattr(self.summarizer, "asummarize"):
+            return await self.summarizer.asummarize(text)
+        return await asyncio.to_thread(self.summarizer.summarize, text)
+
+    async def _format(self, item: PipelineResult) -> None:
+        item.message = self.formatter.format_news_message([item.article], [item.summary])
+        print("[카카오톡 메시지 미리보기]\n", item.message.content)
+
+    async def _send(self, item: PipelineResult) -> None:
+        item.sent = await self.sender.send_message(item.message, receiver_uuids=self.receiver_uuids)
+        print("[카카오톡 발송 결과]", "성공" if item.sent else "실패")
@@ -0,0 +1,214 @@
+# 📦 미리 계산 모드: 발송 시각 전에 크롤링 → 본문 추출 → 요약을 끝내 두고, 발송 시각에는 포맷 + 발송만
+# - CRAWL_INTERVAL_MINUTES마다(그리고 발송 PRECOMPUTE_LEAD_MINUTES 전에) refresh()로 최신 스냅샷을 만듦 (NewsPipeline을 발송 없이 실행)
+# - 이전 스냅샷에 있던 기사는 본문 추출/요약을 다시 하지 않고 재사용
+# - 스냅샷은 SQLite에 compact_models.pack 형식으로 저장 (재시작해도 바로 발송 가능), 최신 것은 메모리에도 유지
+# - 발송 시각에 스냅샷이 없거나 PRECOMPUTE_MAX_AGE_MINUTES보다 오래됐으면 그때 새로 계산
+# - 구독자 다이제스트는 같은 스냅샷으로 렌더링해 DeliveryScheduler로 발송 시간대에 나눠 발송
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import settings
+from crawler.naver_ranking_crawler import NewsArticle
+from messenger.bulk_sender import KakaoBulkSender
+from pipeline.news_pipeline import NewsPipeline
+from subscriptions.delivery_scheduler import DeliveryReport, DeliveryScheduler
+from subscriptions.digest_planner import DigestPlanner
+from summaries.news_summarizer import SummaryResult
+from utils.compact_models import CompactArticle, CompactSummary, pack, unpack
+from utils.metrics import metrics
+from utils.sqlite_db import connect
+
+@dataclass
+class DigestSnapshot:
+    created_at: float
+    articles: List[NewsArticle]
+    # 기사 링크 → 요약
+    summaries: Dict[str, SummaryResult] = field(default_factory=dict)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    def summaries_in_order(self) -> List[SummaryResult]:
+        return [self.summaries[article.link] for article in self.articles]
+
+class DigestSnapshotStore:
+    """
+    SQLite 기반 스냅샷 저장소 (DATABASE_URL 사용). 최근 keep개만 남김
+    """
+    def __init__(self, database_url: Optional[str] = None, keep: int = settings.PRECOMPUTE_KEEP_SNAPSHOTS):
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._latest: Optional[DigestSnapshot] = None
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS digest_snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    article_count INTEGER NOT NULL,
+                    payload BLOB NOT NULL
+                )
+                """
+            )
+
+    def save(self, snapshot: DigestSnapshot) -> None:
+        # 기사, 요약 순서로 번갈아 담음
+        payload = pack(
+            item
+            for article in snapshot.articles
+            for item in (article, snapshot.summaries[article.link])
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO digest_snapshots (created_at, article_count, payload) VALUES (?, ?, ?)",
+                (snapshot.created_at, len(snapshot.articles), payload)
+            )
+            self._conn.execute(
+                "DELETE FROM digest_snapshots WHERE id NOT IN (SELECT id FROM digest_snapshots ORDER BY id DESC LIMIT ?)",
+                (self.keep,)
+            )
+            self._latest = snapshot
+
+    def latest(self) -> Optional[DigestSnapshot]:
+        with self._lock:
+            if self._latest is not None:
+                return self._latest
+            row = self._conn.execute(
+                "SELECT created_at, payload FROM digest_snapshots ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            items = unpack(row[1])
+            articles: List[NewsArticle] = []
+            summaries: Dict[str, SummaryResult] = {}
+            for article, summary in zip(items[::2], items[1::2]):
+                if isinstance(article, CompactArticle) and isinstance(summary, CompactSummary):
+                    articles.append(article.to_article())
+                    summaries[article.link] = summary.to_result()
+            self._latest = DigestSnapshot(created_at=row[0], articles=articles, summaries=summaries)
+            return self._latest
+
+    def close(self) -> None:
+        self._conn.close()
+
+class Precomputer:
+    """
+    NewsPipeline의 크롤링/본문 추출/요약 단계를 발송 없이 돌려 스냅샷을 만듦 (중복 제거, 오류 처리, 단계별 동시 실행 설정을 그대로 사용)
+    """
+    def __init__(self, pipeline: NewsPipeline, store: DigestSnapshotStore, limit: int = 3):
+        self.pipeline = pipeline
+        self.store = store
+        self.limit = limit
+        # 스케줄러의 주기 실행과 발송 시각의 즉시 계산이 겹치지 않도록 (작업마다 이벤트 루프가 달라 스레드 잠금 사용)
+        self._refresh_lock = threading.Lock()
+
+    async def refresh(self) -> DigestSnapshot:
+        await asyncio.to_thread(self._refresh_lock.acquire)
+        try:
+            with metrics.span("precompute.refresh") as span:
+                snapshot, reused, summarized = await self._refresh()
+                span.set(articles=len(snapshot.articles), reused=reused, summarized=summarized)
+        finally:
+            self._refresh_lock.release()
+        metrics.inc("precompute_articles_total", reused, result="reused")
+        metrics.inc("precompute_articles_total", summarized, result="summarized")
+        print(f"[미리 계산] 기사 {len(snapshot.articles)}건 준비 (재사용 {reused}, 새로 요약 {summarized})")
+        metrics.export()
+        return snapshot
+
+    async def _refresh(self) -> Tuple[DigestSnapshot, int, int]:
+        articles = await self.pipeline.crawl(self.limit)
+        previous = self.store.latest()
+        known = previous.summaries if previous else {}
+        # 이전 스냅샷에 있던 기사는 본문 추출/요약을 다시 하지 않음
+        fresh = [article for article in articles if article.link not in known]
+        results = await self.pipeline.process(fresh, send=False)
+
+        current = {article.link for article in articles}
+        summaries = {link: summary for link, summary in known.items() if link in current}
+        summarized = [item for item in results if not item.error and item.summary and item.summary.summary]
+        summaries.update({item.article.link: item.summary for item in summarized})
+        snapshot = DigestSnapshot(
+            created_at=time.time(),
+            articles=[article for article in articles if article.link in summaries],
+            summaries=summaries
+        )
+        self.store.save(snapshot)
+        return snapshot, len(articles) - len(fresh), len(summarized)
+
+class SnapshotDelivery:
+    """
+    발송 시각에 최신 스냅샷을 포맷해 바로 발송 (발송기/수신자/포맷터는 precomputer의 파이프라인 것을 사용)
+    planner를 주면 구독자 다이제스트도 스냅샷으로 만들어 DeliveryScheduler로 발송 시간대에 나눠 보냄
+    """
+    def __init__(
+        self,
+        precomputer: Precomputer,
+        max_age_seconds: float = settings.PRECOMPUTE_MAX_AGE_MINUTES * 60,
+        planner: Optional[DigestPlanner] = None,
+        delivery_scheduler: Optional[DeliveryScheduler] = None
+    ):
+        self.precomputer = precomputer
+        self.max_age_seconds = max_age_seconds
+        self.planner = planner
+        self.delivery_scheduler = delivery_scheduler or DeliveryScheduler()
+
+    async def snapshot(self) -> DigestSnapshot:
+        snapshot = self.precomputer.store.latest()
+        if snapshot is None or snapshot.age_seconds > self.max_age_seconds:
+            # 준비된 스냅샷이 없으면 지금 계산 (기존처럼 느리지만 발송은 함)
+            print("[미리 계산] 사용할 스냅샷이 없어 지금 계산합니다.")
+            metrics.inc("precompute_snapshot_total", result="cold")
+            return await self.precomputer.refresh()
+        metrics.inc("precompute_snapshot_total", result="warm")
+        return snapshot
+
+    async def deliver(self) -> bool:
+        triggered = time.perf_counter()
+        snapshot = await self.snapshot()
+        if not snapshot.articles:
+            print("발송할 기사가 없습니다.")
+            metrics.export()
+            return False
+
+        pipeline = self.precomputer.pipeline
+        with metrics.span("format"):
+            message = pipeline.formatter.format_news_message(snapshot.articles, snapshot.summaries_in_order())
+        sent = await pipeline.sender.send_message(message, receiver_uuids=pipeline.receiver_uuids)
+        elapsed = time.perf_counter() - triggered
+        metrics.observe("delivery_trigger_to_send_seconds", elapsed)
+        print(f"[미리 계산] 발송 {'성공' if sent else '실패'} (트리거 후 {elapsed * 1000:.1f}ms, 스냅샷 {snapshot.age_seconds:.0f}초 전)")
+        # 발송까지 끝난 기사만 본 것으로 기록
+        if sent and hasattr(pipeline.source, "commit"):
+            pipeline.source.commit(snapshot.articles)
+        metrics.export()
+        return sent
+
+    async def deliver_subscribers(
+        self,
+        send_slots: Sequence[str],
+        sender: KakaoBulkSender,
+        day: Optional[date] = None
+    ) -> DeliveryReport:
+        """
+        send_slots의 구독자 다이제스트를 스냅샷으로 미리 렌더링(prepare)하고, 한도 안에서 tick에 배정(assign)해 시각마다 발송(run)
+        발송 창이 열릴 때(가장 이른 슬롯 - DELIVERY_MAX_EARLY_MINUTES) 호출
+        """
+        if self.planner is None:
+            raise ValueError("구독자 발송에는 planner가 필요합니다.")
+        snapshot = await self.snapshot()
+        plans = self.delivery_scheduler.prepare(
+            self.planner, send_slots, snapshot.articles, snapshot.summaries,
+            day=day, formatter=self.precomputer.pipeline.formatter
+        )
+        schedule = self.delivery_scheduler.assign(plans)
+        report = await self.delivery_scheduler.run(schedule, sender)
+        metrics.export()
+        return report
@@ -0,0 +1,189 @@
+# 📦 발송 스케줄러: 정각에 모든 구독자에게 한꺼번에 보내지 않고 API 한도 안에서 시간대에 고르게 나눠 발송
+# - 다이제스트는 발송 창이 열리기 전에 미리 계획/렌더링 (prepare)
+# - 시간을 tick(기본 10초) 단위로 나누고, 한 tick에 보낼 수 있는 수신자 수 = 초당 요청 한도 × 사용률 × tick × 묶음 크기
+# - 구독자는 원하는 시각에 가장 가까운 빈 tick에 배정 (최대 DELIVERY_MAX_EARLY_MINUTES 먼저, 늦는 쪽은 제한 없음)
+# - run()은 tick 시각마다 발송을 풀어 주고, 목표 시각 대비 실제 발송 시각 차이(skew)를 기록
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from config import settings
+from crawler.naver_ranking_crawler import NewsArticle
+from messenger.bulk_sender import DeliveryResult, KakaoBulkSender
+from messenger.message_formatter import MessageFormatter
+from subscriptions.digest_planner import DigestPlan, DigestPlanner
+from summaries.news_summarizer import SummaryResult
+from utils.metrics import metrics
+
+SKEW_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+def slot_time(day: date, send_slot: str) -> float:
+    """
+    (날짜, "HH:MM") → 로컬 시각 epoch 초
+    """
+    hour, minute = (int(part) for part in send_slot.split(":"))
+    return datetime(day.year, day.month, day.day, hour, minute).timestamp()
+
+def _percentile(values: Sequence[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+@dataclass
+class ScheduledSend:
+    at: float
+    target: float
+    plan: DigestPlan
+    receiver_uuids: List[str]
+
+@dataclass
+class DeliveryReport:
+    results: List[DeliveryResult] = field(default_factory=list)
+    # 수신자별 (발송 완료 시각 - 원하는 시각), 음수면 먼저 보냄
+    skews: List[float] = field(default_factory=list)
+    # tick별 (실제로 풀어 준 시각 - 예정 시각): 스케줄러 자체 지연
+    release_lags: List[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        late = [skew for skew in self.skews if skew >= 0]
+        return {
+            "receivers": len(self.results),
+            "succeeded": sum(result.success for result in self.results),
+            "skew_p50": round(_percentile(self.skews, 50), 3),
+            "skew_p95": round(_percentile(self.skews, 95), 3),
+            "skew_max": round(max(self.skews, default=0.0), 3),
+            "early": len(self.skews) - len(late),
+            "release_lag_p95": round(_percentile(self.release_lags, 95), 3),
+        }
+
+class DeliveryScheduler:
+    def __init__(
+        self,
+        rate_per_second: float = settings.KAKAO_SEND_RATE_PER_SECOND,
+        batch_size: int = settings.KAKAO_BATCH_SIZE,
+        utilization: float = settings.DELIVERY_QUOTA_UTILIZATION,
+        tick_seconds: float = settings.DELIVERY_TICK_SECONDS,
+        max_early_seconds: float = settings.DELIVERY_MAX_EARLY_MINUTES * 60,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        self.rate_per_second = rate_per_second
+        self.batch_size = batch_size
+        self.utilization = utilization
+        self.tick_seconds = tick_seconds
+        self.max_early_seconds = max_early_seconds
+        self.clock = clock
+        self.sleep = sleep
+
+    @property
+    def capacity_per_tick(self) -> int:
+        # 묶음 단위로 내림 (최소 한 묶음)
+        requests = max(1, int(self.rate_per_second * self.utilization * self.tick_seconds))
+        return requests * self.batch_size
+
+    def prepare(
+        self,
+        planner: DigestPlanner,
+        send_slots: Sequence[str],
+        articles: Sequence[NewsArticle],
+        summaries: Dict[str, SummaryResult],
+        day: Optional[date] = None,
+        formatter: Optional[MessageFormatter] = None
+    ) -> Dict[float, List[DigestPlan]]:
+        """
+        발송 창이 열리기 전에 슬롯별 다이제스트를 계획하고 렌더링해 둡니다. (목표 시각 → 렌더링된 계획)
+        """
+        day = day or date.today()
+        formatter = formatter or MessageFormatter()
+        prepared: Dict[float, List[DigestPlan]] = {}
+        with metrics.span("delivery.prepare", slots=len(send_slots)):
+            for send_slot in send_slots:
+                plans = planner.render(planner.plan(send_slot, articles), summaries, formatter)
+                prepared[slot_time(day, send_slot)] = [plan for plan in plans if plan.message and plan.message.content]
+        return prepared
+
+    def assign(self, plans_by_target: Dict[float, Sequence[DigestPlan]]) -> List[ScheduledSend]:
+        """
+        목표 시각이 이른 구독자부터, 목표 tick에서 가까운 순서(+0, +1, -1, +2, -2 ...)로 남은 자리를 채웁니다.
+        """
+        if not plans_by_target:
+            return []
+        tick = self.tick_seconds
+        capacity = self.capacity_per_tick
+        base = min(plans_by_target) - self.max_early_seconds
+        used: Dict[int, int] = {}
+        schedule: List[ScheduledSend] = []
+
+        for target in sorted(plans_by_target):
+            queue = [(plan, list(plan.receiver_uuids)) for plan in plans_by_target[target]]
+            remaining = sum(len(uuids) for _, uuids in queue)
+            home = math.ceil((target - base) / tick - 1e-9)
+            earliest = math.ceil((target - self.max_early_seconds - base) / tick - 1e-9)
+            for index in self._ticks_near(home, earliest):
+                if not remaining:
+                    break
+                free = capacity - used.get(index, 0)
+                if free <= 0:
+                    continue
+                take = min(free, remaining)
+                used[index] = used.get(index, 0) + take
+                remaining -= take
+                at = base + index * tick
+                # 한 tick의 자리를 다이제스트 순서대로 나눠 담음
+                while take:
+                    plan, uuids = queue[0]
+                    chunk, queue[0] = uuids[:take], (plan, uuids[take:])
+                    schedule.append(ScheduledSend(at=at, target=target, plan=plan, receiver_uuids=chunk))
+                    take -= len(chunk)
+                    if not queue[0][1]:
+                        queue.pop(0)
+        schedule.sort(key=lambda send: send.at)
+        metrics.inc("delivery_scheduled_total", sum(len(send.receiver_uuids) for send in schedule))
+        return schedule
+
+    @staticmethod
+    def _ticks_near(home: int, earliest: int):
+        yield home
+        step = 1
+        while True:
+            yield home + step
+            if home - step >= earliest:
+                yield home - step
+            step += 1
+
+    async def run(self, schedule: Sequence[ScheduledSend], sender: KakaoBulkSender) -> DeliveryReport:
+        """
+        tick 시각마다 해당 발송을 풀어 줍니다. 앞 tick의 발송이 끝나기를 기다리지 않으므로 느린 응답이 뒤 tick을 밀지 않습니다.
+        """
+        report = DeliveryReport()
+        tasks: List[asyncio.Task] = []
+        index = 0
+        while index < len(schedule):
+            at = schedule[index].at
+            wait = at - self.clock()
+            if wait > 0:
+                await self.sleep(wait)
+            lag = self.clock() - at
+            report.release_lags.append(lag)
+            metrics.observe("delivery_release_lag_seconds", max(0.0, lag))
+            while index < len(schedule) and schedule[index].at == at:
+                tasks.append(asyncio.create_task(self._send(schedule[index], sender, report)))
+                index += 1
+        await asyncio.gather(*tasks)
+        print(f"[발송 스케줄] {report.summary()}")
+        return report
+
+    async def _send(self, send: ScheduledSend, sender: KakaoBulkSender, report: DeliveryReport) -> None:
+        with metrics.span("delivery.release", receivers=len(send.receiver_uuids)):
+            results = await sender.send_bulk(send.plan.message, send.receiver_uuids)
+        skew = self.clock() - send.target
+        report.results.extend(results)
+        report.skews.extend([skew] * len(results))
+        if skew < 0:
+            metrics.inc("delivery_early_total", len(results))
+        metrics.observe("delivery_skew_seconds", max(0.0, skew), buckets=SKEW_BUCKETS)
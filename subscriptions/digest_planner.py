@@ -0,0 +1,87 @@
+# 📦 다이제스트 계획: 발송 슬롯의 구독자를 관심 카테고리 조합별로 묶어
+# 고유한 다이제스트마다 요약/렌더링은 한 번만 하고 대량 발송기로 묶음 발송
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import settings
+from crawler.naver_ranking_crawler import NewsArticle
+from messenger.bulk_sender import DeliveryResult, KakaoBulkSender
+from messenger.message_formatter import FormattedMessage, MessageFormatter
+from subscriptions.subscription_store import SubscriptionStore
+from summaries.news_summarizer import Summarizer, SummaryResult, summarize_many
+
+@dataclass
+class DigestPlan:
+    categories: Tuple[str, ...]
+    articles: List[NewsArticle]
+    receiver_uuids: List[str] = field(default_factory=list)
+    message: Optional[FormattedMessage] = None
+
+class DigestPlanner:
+    def __init__(self, store: SubscriptionStore, per_category: int = settings.MAX_ARTICLES_PER_CATEGORY):
+        self.store = store
+        self.per_category = per_category
+
+    def plan(self, send_slot: str, articles: Sequence[NewsArticle]) -> List[DigestPlan]:
+        """
+        발송 슬롯의 구독자 그룹마다 받을 기사 목록을 정합니다. (기사가 하나도 없는 그룹은 제외)
+        """
+        by_category: Dict[str, List[NewsArticle]] = {}
+        for article in articles:
+            bucket = by_category.setdefault(article.category, [])
+            if len(bucket) < self.per_category:
+                bucket.append(article)
+
+        plans = []
+        for categories, uuids in self.store.preference_groups(send_slot).items():
+            picked = [article for category in categories for article in by_category.get(category, [])]
+            if picked:
+                plans.append(DigestPlan(categories=categories, articles=picked, receiver_uuids=uuids))
+        return plans
+
+    @staticmethod
+    def unique_articles(plans: Sequence[DigestPlan]) -> List[NewsArticle]:
+        seen: Dict[str, NewsArticle] = {}
+        for plan in plans:
+            for article in plan.articles:
+                seen.setdefault(article.link, article)
+        return list(seen.values())
+
+    def summarize(
+        self,
+        plans: Sequence[DigestPlan],
+        texts: Dict[str, str],
+        summarizer: Summarizer
+    ) -> Dict[str, SummaryResult]:
+        """
+        여러 다이제스트에 걸친 기사를 한 번씩만 요약합니다. texts: 기사 링크 → 본문
+        """
+        articles = [article for article in self.unique_articles(plans) if article.link in texts]
+        results = summarize_many(summarizer, [texts[article.link] for article in articles])
+        return {article.link: result for article, result in zip(articles, results)}
+
+    def render(
+        self,
+        plans: Sequence[DigestPlan],
+        summaries: Dict[str, SummaryResult],
+        formatter: Optional[MessageFormatter] = None
+    ) -> List[DigestPlan]:
+        formatter = formatter or MessageFormatter()
+        for plan in plans:
+            pairs = [(article, summaries[article.link]) for article in plan.articles if article.link in summaries]
+            plan.message = formatter.format_news_message(
+                [article for article, _ in pairs],
+                [summary for _, summary in pairs]
+            )
+        return list(plans)
+
+    async def deliver(self, plans: Sequence[DigestPlan], sender: KakaoBulkSender) -> List[DeliveryResult]:
+        # 다이제스트마다 수신자 목록을 묶음 발송 (발송기 안에서 속도 제한 공유)
+        batches = await asyncio.gather(*(
+            sender.send_bulk(plan.message, plan.receiver_uuids)
+            for plan in plans
+            if plan.message is not None and plan.message.content
+        ))
+        return [result for batch in batches for result in batch]
@@ -0,0 +1,126 @@
+# 📦 구독 저장소: 구독자, 관심 카테고리, 발송 시각 (SQLite, DATABASE_URL 사용)
+# - 카테고리와 발송 슬롯에 인덱스
+# - 관심 카테고리 조합을 pref_key로 함께 저장해 같은 다이제스트를 받을 구독자를 SQL 한 번으로 묶음
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import settings
+from utils.sqlite_db import connect
+
+def preference_key(categories: Iterable[str]) -> str:
+    return "|".join(sorted(set(categories)))
+
+@dataclass
+class Subscriber:
+    kakao_uuid: str
+    categories: List[str] = field(default_factory=list)
+    send_slot: str = settings.DEFAULT_SEND_SLOT  # "HH:MM"
+    active: bool = True
+
+class SubscriptionStore:
+    def __init__(self, database_url: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS subscribers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kakao_uuid TEXT NOT NULL UNIQUE,
+                    send_slot TEXT NOT NULL,
+                    pref_key TEXT NOT NULL,
+                    active INTEGER NOT NULL DEFAULT 1,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_subscribers_slot_pref ON subscribers (send_slot, active, pref_key);
+                CREATE TABLE IF NOT EXISTS subscriber_categories (
+                    subscriber_id INTEGER NOT NULL REFERENCES subscribers (id) ON DELETE CASCADE,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (subscriber_id, category)
+                );
+                CREATE INDEX IF NOT EXISTS ix_subscriber_categories_category ON subscriber_categories (category);
+                """
+            )
+
+    def upsert_many(self, subscribers: Iterable[Subscriber]) -> int:
+        """
+        구독자를 한 트랜잭션으로 추가/갱신합니다.
+        """
+        now = time.time()
+        count = 0
+        with self._lock, self._conn:
+            for subscriber in subscribers:
+                categories = sorted(set(subscriber.categories))
+                row = self._conn.execute(
+                    """
+                    INSERT INTO subscribers (kakao_uuid, send_slot, pref_key, active, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(kakao_uuid) DO UPDATE SET
+                        send_slot = excluded.send_slot,
+                        pref_key = excluded.pref_key,
+                        active = excluded.active,
+                        updated_at = excluded.updated_at
+                    RETURNING id
+                    """,
+                    (subscriber.kakao_uuid, subscriber.send_slot, preference_key(categories), int(subscriber.active), now)
+                ).fetchone()
+                self._conn.execute("DELETE FROM subscriber_categories WHERE subscriber_id = ?", (row[0],))
+                self._conn.executemany(
+                    "INSERT INTO subscriber_categories (subscriber_id, category) VALUES (?, ?)",
+                    [(row[0], category) for category in categories]
+                )
+                count += 1
+        return count
+
+    def add(self, subscriber: Subscriber) -> None:
+        self.upsert_many([subscriber])
+
+    def unsubscribe(self, kakao_uuid: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE subscribers SET active = 0, updated_at = ? WHERE kakao_uuid = ?", (time.time(), kakao_uuid)
+            )
+
+    def send_slots(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT send_slot FROM subscribers WHERE active = 1 ORDER BY send_slot"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def uuids_for_category(self, category: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT s.kakao_uuid FROM subscriber_categories c
+                JOIN subscribers s ON s.id = c.subscriber_id
+                WHERE c.category = ? AND s.active = 1
+                """,
+                (category,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def preference_groups(self, send_slot: str) -> Dict[Tuple[str, ...], List[str]]:
+        """
+        발송 슬롯의 활성 구독자를 관심 카테고리 조합별로 묶습니다. (인덱스 순서대로 한 번 읽음)
+        """
+        groups: Dict[Tuple[str, ...], List[str]] = {}
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT pref_key, kakao_uuid FROM subscribers WHERE send_slot = ? AND active = 1 ORDER BY pref_key",
+                (send_slot,)
+            )
+            for pref_key, kakao_uuid in cursor:
+                key = tuple(pref_key.split("|")) if pref_key else ()
+                groups.setdefault(key, []).append(kakao_uuid)
+        return groups
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM subscribers WHERE active = 1").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
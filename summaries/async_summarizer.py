@@ -0,0 +1,175 @@
+# 📦 비동기 GPT 요약기
+# - OpenAI 호환 /chat/completions 엔드포인트를 aiohttp로 직접 호출 (이벤트 루프를 막지 않음)
+# - 세마포어로 동시 요청 수 제한, 호출별 타임아웃
+# - stream=True면 토큰이 들어오는 대로 부분 SummaryResult를 만들어 줌
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional
+
+from config import settings
+from summaries.news_summarizer import (
+    GPTNewsSummarizer,
+    SYSTEM_PROMPT,
+    SummaryResult,
+    build_summary_prompt,
+    parse_summary_response,
+)
+from utils.http_transport import AsyncHTTPTransport, request_timeout, session_scope
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from summaries.prompt_compactor import PromptCompactor
+
+class AsyncGPTNewsSummarizer:
+    prompt_version = GPTNewsSummarizer.prompt_version
+
+    def __init__(
+        self,
+        api_key: str = settings.OPENAI_API_KEY,
+        model: str = "gpt-3.5-turbo",
+        base_url: str = settings.OPENAI_BASE_URL,
+        transport: Optional[AsyncHTTPTransport] = None,
+        max_concurrency: int = settings.OPENAI_MAX_CONCURRENCY,
+        timeout_seconds: float = settings.OPENAI_TIMEOUT_SECONDS,
+        stream: bool = False,
+        compactor: Optional["PromptCompactor"] = None
+    ):
+        self.model = model
+        self.compactor = compactor
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.transport = transport
+        self.timeout_seconds = timeout_seconds
+        self.stream = stream
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def summarize(self, text: str) -> SummaryResult:
+        """
+        Summarizer 프로토콜 호환용 (이벤트 루프 밖에서만 호출)
+        """
+        return asyncio.run(self.asummarize(text))
+
+    async def asummarize(
+        self,
+        text: str,
+        on_partial: Optional[Callable[[SummaryResult], None]] = None
+    ) -> SummaryResult:
+        """
+        기사 하나를 요약합니다. timeout_seconds를 넘기면 asyncio.TimeoutError가 발생합니다.
+
+        Args:
+            text: 기사 본문
+            on_partial: 스트리밍 중 새 줄이 파싱될 때마다 호출되는 콜백 (stream=True일 때만)
+        """
+        if self.compactor is not None:
+            compacted = self.compactor.compact(text)
+            print(f"[요약 입력] 토큰 {compacted.tokens_before} → {compacted.tokens_after}")
+            text = compacted.text
+        async with self._semaphore:
+            kind = "summarize_stream" if self.stream else "summarize"
+            try:
+                with metrics.span("openai", kind=kind, model=self.model, articles=1):
+                    result = await asyncio.wait_for(self._summarize(text, on_partial), self.timeout_seconds)
+            except asyncio.TimeoutError:
+                metrics.inc("openai_failures_total", kind=kind, reason="timeout")
+                raise
+            except Exception:
+                metrics.inc("openai_failures_total", kind=kind, reason="error")
+                raise
+            metrics.inc("openai_requests_total", kind=kind)
+            metrics.inc("summarized_articles_total", kind=kind)
+            return result
+
+    async def _summarize(
+        self,
+        text: str,
+        on_partial: Optional[Callable[[SummaryResult], None]]
+    ) -> SummaryResult:
+        if not self.stream:
+            content = await self._complete(text)
+            return parse_summary_response(content)
+        result = SummaryResult(summary="", keywords=[], keyword_details={})
+        async for partial in self._stream_partials(text):
+            result = partial
+            if on_partial is not None:
+                on_partial(partial)
+        return result
+
+    def _payload(self, text: str, stream: bool) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_summary_prompt(text)}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 700,
+            "stream": stream
+        }
+
+    async def _complete(self, text: str) -> str:
+        async with session_scope(self.transport) as session:
+            async with session.post(
+                self.url,
+                headers=self.headers,
+                json=self._payload(text, False),
+                timeout=request_timeout(self.transport, self.timeout_seconds)
+            ) as response:
+                response.raise_for_status()
+                body = await response.json()
+        usage = body.get("usage") if metrics.enabled else None
+        if usage:
+            metrics.inc("openai_tokens_total", usage.get("prompt_tokens", 0), kind="summarize", type="prompt")
+            metrics.inc("openai_tokens_total", usage.get("completion_tokens", 0), kind="summarize", type="completion")
+        return body["choices"][0]["message"]["content"]
+
+    async def _stream_partials(self, text: str) -> AsyncIterator[SummaryResult]:
+        # 완성된 줄이 생길 때마다 지금까지의 응답을 다시 파싱 (응답이 짧아 비용은 무시할 수준)
+        buffer = ""
+        parsed_upto = 0
+        async for delta in self._stream_deltas(text):
+            buffer += delta
+            last_newline = buffer.rfind("\n")
+            if last_newline > parsed_upto:
+                parsed_upto = last_newline
+                yield parse_summary_response(buffer[:last_newline])
+        yield parse_summary_response(buffer)
+
+    async def _stream_deltas(self, text: str) -> AsyncIterator[str]:
+        async with session_scope(self.transport) as session:
+            async with session.post(
+                self.url,
+                headers=self.headers,
+                json=self._payload(text, True),
+                timeout=request_timeout(self.transport, self.timeout_seconds)
+            ) as response:
+                response.raise_for_status()
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        return
+                    choices = json.loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+
+# 사용 예시
+if __name__ == "__main__":
+    async def run():
+        async with AsyncHTTPTransport() as transport:
+            summarizer = AsyncGPTNewsSummarizer(transport=transport, stream=True)
+            result = await summarizer.asummarize(
+                "정부가 내년부터 전세사기 피해자 지원을 위한 특별법을 시행한다.",
+                on_partial=lambda partial: print(f"[부분 요약] {partial.summary}")
+            )
+            print(f"요약: {result.summary}")
+            print(f"키워드: {result.keywords}")
+
+    asyncio.run(run())
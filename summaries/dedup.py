@@ -0,0 +1,148 @@
+# 📦 요약 전 중복 기사 묶기: 한국어 글자 n-gram MinHash + LSH
+# - 언론사/카테고리마다 제목만 조금 다른 같은 기사를 찾아 대표 기사 하나만 요약
+# - LSH 밴드 버킷으로 후보만 비교하므로 전체 쌍 비교(n²)를 하지 않음
+
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from summaries.news_summarizer import Summarizer, SummaryResult, summarize_many
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_WORD = re.compile(r"[\W_]+")
+
+def shingles(text: str, ngram: int = 3) -> List[int]:
+    # 공백/문장부호를 지운 글자열에서 n-gram을 뽑아 32비트 해시로 변환
+    compact = _NON_WORD.sub("", text)
+    if len(compact) <= ngram:
+        return [zlib.crc32(compact.encode("utf-8"))] if compact else []
+    return list({zlib.crc32(compact[i:i + ngram].encode("utf-8")) for i in range(len(compact) - ngram + 1)})
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, ngram: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.ngram = ngram
+        # 고정 시드의 (a, b) 순열 파라미터 → 프로세스가 달라도 같은 서명
+        state = seed
+        params = []
+        for _ in range(num_perm * 2):
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            params.append(state >> 33)
+        self._a = [max(1, value) for value in params[:num_perm]]
+        self._b = params[num_perm:]
+        if np is not None:
+            self._np_a = np.array(self._a, dtype=np.uint64)
+            self._np_b = np.array(self._b, dtype=np.uint64)
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        values = shingles(text, self.ngram)
+        if not values:
+            return tuple([_MAX_HASH] * self.num_perm)
+        if np is not None:
+            # (a * x + b) mod 2^61-1 를 (순열 × shingle) 행렬로 한 번에 계산 (a < 2^31, x < 2^32 이라 uint64에서 넘치지 않음)
+            hashed = np.array(values, dtype=np.uint64)[:, None] * self._np_a + self._np_b
+            hashed = (hashed % np.uint64(_MERSENNE_PRIME)) & np.uint64(_MAX_HASH)
+            return tuple(int(value) for value in hashed.min(axis=0))
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in values)
+            for a, b in zip(self._a, self._b)
+        )
+
+def estimated_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명을 bands개의 밴드로 나눠 버킷에 넣고, 같은 버킷에 걸린 후보만 유사도를 확인합니다.
+    임계값 근사: (1 / bands) ** (1 / rows)
+    """
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16, ngram: int = 3):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm, ngram=ngram)
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[Hashable]] = {}
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._representative: Dict[Hashable, Hashable] = {}
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def find_or_add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        이미 넣은 기사 중 가장 비슷한 대표 기사의 key를 반환하고, 없으면 key를 새 대표로 등록 후 None을 반환합니다.
+        """
+        signature = self.hasher.signature(text)
+        best: Optional[Hashable] = None
+        best_score = self.threshold
+        candidates = {
+            candidate
+            for bucket_key in self._bands(signature)
+            for candidate in self._buckets.get(bucket_key, [])
+        }
+        for candidate in candidates:
+            score = estimated_similarity(signature, self._signatures[candidate])
+            if score >= best_score:
+                best, best_score = candidate, score
+        if best is not None:
+            representative = self._representative[best]
+            self._representative[key] = representative
+            return representative
+        self._signatures[key] = signature
+        self._representative[key] = key
+        for bucket_key in self._bands(signature):
+            self._buckets.setdefault(bucket_key, []).append(key)
+        return None
+
+    def cluster(self, texts: Sequence[str]) -> List[List[int]]:
+        """
+        texts를 중복 묶음(인덱스 목록)으로 나눕니다. 이 인덱스에 넣어 둔 기사와는 별개로 계산합니다.
+        """
+        index = NearDuplicateIndex(self.threshold, self.hasher.num_perm, self.bands, self.hasher.ngram)
+        clusters: Dict[int, List[int]] = {}
+        for i, text in enumerate(texts):
+            representative = index.find_or_add(i, text)
+            clusters.setdefault(i if representative is None else representative, []).append(i)
+        return list(clusters.values())
+
+@dataclass
+class DedupReport:
+    articles: int
+    clusters: int
+
+    @property
+    def saved_calls(self) -> int:
+        return self.articles - self.clusters
+
+def summarize_deduplicated(
+    summarizer: Summarizer,
+    texts: Sequence[str],
+    index: Optional[NearDuplicateIndex] = None
+) -> Tuple[List[SummaryResult], DedupReport]:
+    """
+    중복 묶음마다 첫 기사만 요약하고 같은 묶음의 다른 기사에는 그 요약을 씁니다.
+
+    Returns:
+        (texts와 같은 순서의 요약 결과, 절약한 요약 호출 수를 담은 DedupReport)
+    """
+    index = index or NearDuplicateIndex()
+    clusters = index.cluster(texts)
+    representatives = [cluster[0] for cluster in clusters]
+    summaries = summarize_many(summarizer, [texts[i] for i in representatives])
+    results: List[Optional[SummaryResult]] = [None] * len(texts)
+    for cluster, summary in zip(clusters, summaries):
+        for i in cluster:
+            results[i] = summary
+    report = DedupReport(articles=len(texts), clusters=len(clusters))
+    print(f"[중복 제거] 기사 {report.articles}건 → 요약 {report.clusters}건 (절약 {report.saved_calls}건)")
+    return results, report
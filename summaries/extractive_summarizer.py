@@ -0,0 +1,191 @@
+# 📦 로컬 추출 요약기: 네트워크/API 키 없이 본문 문장 중 핵심 문장을 골라 요약
+# - 문장 × 단어 TF-IDF 행렬 → 문장 유사도 그래프 → TextRank(거듭제곱법)로 문장 점수 계산
+# - 키워드는 TF-IDF 가중치 합이 큰 단어
+# - LLM이 느리거나 장애일 때의 대체 요약기, 또는 LLM에 보낼 기사를 거르는 사전 필터로 사용
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+from summaries.news_summarizer import KeywordDetail, Summarizer, SummaryResult
+from utils.metrics import metrics
+
+# 문장 끝(.!?) 뒤에 공백이 없어도 나눔 (본문 추출기는 조각을 공백 없이 이어 붙임: "시행한다.이 법안은")
+# 소수점(3.5), 영문 약어/도메인(newsis.com), 닫는 따옴표 뒤에 바로 이어지는 인용 어미("...하겠다."고)는 나누지 않음
+_SENTENCE_END = re.compile(
+    r"(?:(?<=[.!?])(?![\d.!?\"'”’)\]])(?!(?<=[A-Za-z0-9]\.)[A-Za-z])|(?<=[.!?][\"'”’)\]])(?![가-힣A-Za-z0-9\"'”’)\]]))\s*|\n+"
+)
+_TOKEN = re.compile(r"[가-힣A-Za-z0-9]+")
+# 길이가 긴 조사부터 떼어냄 ("에서는" → "에서" 보다 먼저)
+_JOSA = sorted(
+    ["은", "는", "이", "가", "을", "를", "의", "에", "에서", "에게", "으로", "로", "와", "과", "도", "만",
+     "까지", "부터", "보다", "처럼", "이나", "나", "에서는", "으로는", "에는", "이라고", "라고", "했다", "한다", "하는"],
+    key=len,
+    reverse=True
+)
+_STOPWORDS = {"기자", "뉴스", "무단", "전재", "배포", "금지", "있다", "없다", "했다", "밝혔다", "말했다", "이번", "지난"}
+# 행렬이 이보다 작으면 희소 행렬 생성 비용이 더 커서 밀집 행렬 사용
+SPARSE_MIN_CELLS = 200_000
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if len(sentence.strip()) > 1]
+
+@lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    # 기사 어휘는 반복이 많아 어절별 결과를 캐시 ("" 는 버리는 단어)
+    for josa in _JOSA:
+        if len(word) > len(josa) + 1 and word.endswith(josa):
+            word = word[:-len(josa)]
+            break
+    if len(word) < 2 or word in _STOPWORDS or word.isdigit():
+        return ""
+    return word
+
+def tokenize(sentence: str) -> List[str]:
+    return [stem for stem in map(_stem, _TOKEN.findall(sentence)) if stem]
+
+class ExtractiveSummarizer(Summarizer):
+    def __init__(
+        self,
+        max_sentences: int = 3,
+        max_chars: int = 200,
+        num_keywords: int = 5,
+        damping: float = 0.85,
+        iterations: int = 30
+    ):
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+        self.num_keywords = num_keywords
+        self.damping = damping
+        self.iterations = iterations
+
+    def summarize(self, text: str) -> SummaryResult:
+        with metrics.span("summarize.extractive"):
+            result = self._summarize(text)
+        metrics.inc("summarized_articles_total", kind="extractive")
+        return result
+
+    def sentence_scores(self, sentences: Sequence[str]) -> np.ndarray:
+        """
+        문장별 TextRank 점수 (단어가 하나도 없으면 모두 0)
+        """
+        _, _, scores, _ = self._analyze(sentences)
+        return scores
+
+    def _analyze(self, sentences: Sequence[str]) -> Tuple[List[List[str]], Dict[str, int], np.ndarray, np.ndarray]:
+        tokenized = [tokenize(sentence) for sentence in sentences]
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, tokens in enumerate(tokenized):
+            for token in tokens:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+        if not vocabulary:
+            return tokenized, vocabulary, np.zeros(len(sentences)), np.zeros(0)
+        weights, term_weights = self._tfidf(rows, cols, len(sentences), len(vocabulary))
+        return tokenized, vocabulary, self._textrank(weights), term_weights
+
+    def _summarize(self, text: str) -> SummaryResult:
+        sentences = split_sentences(text)
+        if not sentences:
+            return SummaryResult(summary="", keywords=[], keyword_details={})
+
+        tokenized, vocabulary, scores, term_weights = self._analyze(sentences)
+        if not vocabulary:
+            return SummaryResult(summary=self._trim(sentences[:1]), keywords=[], keyword_details={})
+
+        # 점수 상위 문장을 본문 순서대로 이어 붙임
+        picked = sorted(np.argsort(-scores, kind="stable")[:self.max_sentences])
+        summary = self._trim([sentences[i] for i in picked])
+
+        terms = list(vocabulary)
+        top_terms = np.argsort(-term_weights, kind="stable")[:self.num_keywords]
+        keywords = [terms[i] for i in top_terms]
+        counts = Counter(token for tokens in tokenized for token in tokens)
+        keyword_details = {}
+        for keyword in keywords:
+            example = next(sentence for sentence, tokens in zip(sentences, tokenized) if keyword in tokens)
+            keyword_details[keyword] = KeywordDetail(
+                explanation=f"기사 핵심어 (본문 {counts[keyword]}회 등장)",
+                example=example
+            )
+        return SummaryResult(summary=summary, keywords=keywords, keyword_details=keyword_details)
+
+    def summarize_many(self, texts: List[str]) -> List[SummaryResult]:
+        return [self.summarize(text) for text in texts]
+
+    def _tfidf(self, rows: List[int], cols: List[int], n_sentences: int, n_terms: int) -> Tuple[object, np.ndarray]:
+        """
+        문장별 L2 정규화된 TF-IDF 행렬과 단어별 가중치 합을 반환합니다. (큰 기사는 scipy 희소 행렬)
+        """
+        data = np.ones(len(rows), dtype=np.float64)
+        use_sparse = sparse is not None and n_sentences * n_terms >= SPARSE_MIN_CELLS
+        if use_sparse:
+            counts = sparse.csr_matrix((data, (rows, cols)), shape=(n_sentences, n_terms))
+            counts.sum_duplicates()
+            document_frequency = np.bincount(counts.indices, minlength=n_terms)
+        else:
+            counts = np.zeros((n_sentences, n_terms))
+            np.add.at(counts, (rows, cols), 1.0)
+            document_frequency = (counts > 0).sum(axis=0)
+
+        idf = np.log((1 + n_sentences) / (1 + document_frequency)) + 1.0
+        if use_sparse:
+            weights = counts.multiply(idf).tocsr()
+            norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+            norms[norms == 0] = 1.0
+            weights = sparse.diags(1.0 / norms) @ weights
+            term_weights = np.asarray(weights.sum(axis=0)).ravel()
+        else:
+            weights = counts * idf
+            norms = np.linalg.norm(weights, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            weights = weights / norms
+            term_weights = weights.sum(axis=0)
+        return weights, term_weights
+
+    def _textrank(self, weights) -> np.ndarray:
+        # 코사인 유사도 그래프에서 PageRank (자기 자신으로 가는 간선 제외)
+        similarity = weights @ weights.T
+        if sparse is not None and sparse.issparse(similarity):
+            similarity = similarity.toarray()
+        np.fill_diagonal(similarity, 0.0)
+        n = similarity.shape[0]
+        out_degree = similarity.sum(axis=1, keepdims=True)
+        out_degree[out_degree == 0] = 1.0
+        transition = similarity / out_degree
+        scores = np.full(n, 1.0 / n)
+        for _ in range(self.iterations):
+            updated = (1 - self.damping) / n + self.damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < 1e-6:
+                return updated
+            scores = updated
+        return scores
+
+    def _trim(self, sentences: Sequence[str]) -> str:
+        summary = " ".join(sentences)
+        if len(summary) <= self.max_chars:
+            return summary
+        return summary[:self.max_chars - 1].rstrip() + "…"
+
+# 사용 예시
+if __name__ == "__main__":
+    text = (
+        "정부가 전세사기 피해자 지원을 위한 특별법 개정안을 발표했다. "
+        "개정안은 피해자가 살던 집을 공공이 먼저 매입해 장기 임대하는 내용을 담았다. "
+        "국토교통부는 전세사기 피해자의 주거 안정을 최우선으로 하겠다고 밝혔다. "
+        "야당은 보증금 선지급 방안이 빠졌다며 비판했다. "
+        "특별법 개정안은 다음 달 국회 본회의에 상정될 예정이다."
+    )
+    result = ExtractiveSummarizer(max_sentences=2).summarize(text)
+    print(result.summary)
+    print(result.keywords)
@@ -0,0 +1,286 @@
+# 📦 요약기 대체 경로: 여러 요약 백엔드(GPT → 로컬 추출 요약)를 순서대로 묶은 Summarizer
+# - 백엔드마다 최근 지연 시간/오류율을 기록하고, 오류율이 높으면 회로 차단기로 잠시 건너뜀
+# - 응답이 평소 p95보다 늦으면 다음 백엔드를 동시에 띄워(hedging) 먼저 끝난 결과를 사용
+# - 기사 하나의 요약은 SLA 안에 반드시 끝나도록, 시간이 모자라면 마지막(로컬) 백엔드로 바로 넘어감
+# - 마지막 백엔드도 요약을 못 만들면 빈 요약을 그대로 돌려줌 (파이프라인은 빈 요약 기사를 발송하지 않음)
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from config import settings
+from summaries.news_summarizer import Summarizer, SummaryResult
+from utils.metrics import metrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 동기 요약기 전용 스레드 풀: 기본 executor를 쓰면 asyncio.run()이 종료할 때 포기한 호출까지 기다리므로 따로 둠
+# 스레드는 취소할 수 없어서, SLA/hedging으로 포기한 호출도 끝날 때까지(GPT는 OPENAI_TIMEOUT_SECONDS) 스레드 하나를 계속 차지함
+# → 풀 크기가 동시에 남을 수 있는 포기한 호출의 상한. 풀이 차면 새 원격 호출은 대기하다가 SLA에 걸려 로컬 백엔드로 넘어감
+_BACKEND_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="summarizer-backend")
+# 마지막(로컬) 백엔드는 포기한 원격 호출 뒤에 줄 서지 않도록 별도 풀에서 실행
+_LOCAL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="summarizer-local")
+
+class RollingStats:
+    """
+    최근 window개 호출의 (지연 시간, 성공 여부)
+    """
+    def __init__(self, window: int = settings.SUMMARY_STATS_WINDOW):
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+
+    def record(self, latency: float, ok: bool) -> None:
+        self._samples.append((latency, ok))
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def latency_percentile(self, p: float) -> Optional[float]:
+        latencies = sorted(latency for latency, ok in self._samples if ok)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))]
+
+class CircuitBreaker:
+    """
+    closed: 정상 / open: cooldown_seconds 동안 호출하지 않음 / half_open: 시험 호출 하나만 허용
+    """
+    def __init__(
+        self,
+        error_rate_threshold: float = settings.CIRCUIT_ERROR_RATE,
+        min_requests: int = settings.CIRCUIT_MIN_REQUESTS,
+        cooldown_seconds: float = settings.CIRCUIT_COOLDOWN_SECONDS
+    ):
+        self.error_rate_threshold = error_rate_threshold
+        self.min_requests = min_requests
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self.state = HALF_OPEN
+            self._probing = False
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return self.state == CLOSED
+
+    def release(self) -> None:
+        """
+        결과를 기록하지 않고 끝난 호출(먼저 끝난 다른 백엔드 때문에 취소 등)의 시험 호출 자리를 돌려줌
+        """
+        self._probing = False
+
+    def record(self, ok: bool, stats: RollingStats) -> None:
+        if self.state == HALF_OPEN:
+            self._probing = False
+            if ok:
+                self.state = CLOSED
+            else:
+                self._open()
+        elif self.state == CLOSED and len(stats) >= self.min_requests and stats.error_rate >= self.error_rate_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+@dataclass
+class SummarizerBackend:
+    name: str
+    summarizer: Summarizer
+    # 이 시간 안에 끝나지 않으면 실패로 기록 (None이면 SLA까지 기다림)
+    timeout_seconds: Optional[float] = None
+    stats: RollingStats = field(default_factory=RollingStats)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+    async def call(self, text: str, executor: Executor = _BACKEND_EXECUTOR) -> SummaryResult:
+        # 비동기 요약기는 이벤트 루프에서 바로, 동기 요약기는 스레드에서 실행
+        if hasattr(self.summarizer, "asummarize"):
+            return await self.summarizer.asummarize(text)
+        # asyncio.to_thread처럼 contextvars(계측 span 부모)를 넘겨 줌
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, context.run, self.summarizer.summarize, text
+        )
+
+class FallbackSummarizer:
+    """
+    backends 순서가 우선순위. 마지막 백엔드는 빠르고 실패하지 않는 로컬 요약기여야 합니다. (회로 상태와 무관하게 항상 호출)
+    """
+    def __init__(
+        self,
+        backends: List[SummarizerBackend],
+        sla_seconds: float = settings.SUMMARY_SLA_SECONDS,
+        hedge_min_seconds: float = settings.SUMMARY_HEDGE_MIN_SECONDS,
+        local_reserve_seconds: float = 0.5
+    ):
+        if not backends:
+            raise ValueError("backends가 비어 있습니다.")
+        self.backends = backends
+        self.sla_seconds = sla_seconds
+        self.hedge_min_seconds = hedge_min_seconds
+        # SLA 중 마지막 백엔드 몫으로 남겨 두는 시간
+        self.local_reserve_seconds = local_reserve_seconds
+        self.run_deadline: Optional[float] = None
+
+    def start_run(self, seconds: float) -> None:
+        """
+        실행 전체의 마감(지금부터 seconds초)을 정합니다. 이후 요약은 남은 시간 안에서만 원격 백엔드를 기다립니다.
+        """
+        self.run_deadline = time.monotonic() + seconds
+
+    def summarize(self, text: str) -> SummaryResult:
+        """
+        Summarizer 프로토콜 호환용 (이벤트 루프 밖에서만 호출)
+        """
+        return asyncio.run(self.asummarize(text))
+
+    async def asummarize(self, text: str) -> SummaryResult:
+        started = time.monotonic()
+        deadline = started + self.sla_seconds
+        if self.run_deadline is not None:
+            deadline = min(deadline, self.run_deadline)
+        remote_deadline = deadline - self.local_reserve_seconds
+
+        *remote, local = self.backends
+        # 회로 확인(allow)은 실제로 호출을 띄울 때만 (half_open의 시험 호출 자리를 미리 잡지 않도록)
+        candidates = list(remote)
+        running: Dict[asyncio.Task, Tuple[SummarizerBackend, float]] = {}
+        try:
+            while candidates or running:
+                now = time.monotonic()
+                if now >= remote_deadline:
+                    break
+                if candidates and (not running or self._hedge_delay(running) <= 0):
+                    backend = candidates.pop(0)
+                    if not backend.breaker.allow():
+                        continue
+                    if running:
+                        metrics.inc("summarizer_hedges_total", backend=backend.name)
+                    running[asyncio.create_task(backend.call(text))] = (backend, now)
+                wait = remote_deadline - now
+                if candidates and running:
+                    wait = min(wait, self._hedge_delay(running))
+                done, _ = await asyncio.wait(running, timeout=max(0.0, wait), return_when=asyncio.FIRST_COMPLETED)
+                result = self._collect(done, running)
+                if result is not None:
+                    # 먼저 끝난 결과를 쓰고 늦은 쪽은 취소 (실패로 기록하지 않음)
+                    for task, (backend, _) in running.items():
+                        task.cancel()
+                        backend.breaker.release()
+                    running.clear()
+                    return result
+                self._expire_timeouts(running)
+        finally:
+            for task, (backend, task_started) in running.items():
+                task.cancel()
+                # SLA 때문에 포기한 호출은 느린 실패로 기록해 회로 차단기에 반영
+                self._record(backend, time.monotonic() - task_started, ok=False, reason="abandoned")
+
+        metrics.inc("summarizer_fallbacks_total", backend=local.name)
+        local_started = time.monotonic()
+        result = await local.call(text, executor=_LOCAL_EXECUTOR)
+        self._record(local, time.monotonic() - local_started, ok=bool(result.summary), reason="ok")
+        return result
+
+    def _hedge_delay(self, running: Dict[asyncio.Task, Tuple[SummarizerBackend, float]]) -> float:
+        # 가장 최근에 띄운 호출이 평소 p95를 넘기면 다음 백엔드를 띄움
+        backend, task_started = max(running.values(), key=lambda item: item[1])
+        p95 = backend.stats.latency_percentile(95)
+        threshold = max(self.hedge_min_seconds, p95 if p95 is not None else 0.0)
+        return max(0.0, task_started + threshold - time.monotonic())
+
+    def _collect(
+        self,
+        done: Set[asyncio.Task],
+        running: Dict[asyncio.Task, Tuple[SummarizerBackend, float]]
+    ) -> Optional[SummaryResult]:
+        result: Optional[SummaryResult] = None
+        for task in done:
+            backend, task_started = running.pop(task)
+            latency = time.monotonic() - task_started
+            error = task.exception()
+            ok = error is None and bool(task.result().summary)
+            self._record(backend, latency, ok, reason="ok" if ok else ("error" if error else "empty"))
+            if error is not None:
+                print(f"[요약 대체] {backend.name} 실패: {error}")
+            if ok and result is None:
+                result = task.result()
+        return result
+
+    def _expire_timeouts(self, running: Dict[asyncio.Task, Tuple[SummarizerBackend, float]]) -> None:
+        now = time.monotonic()
+        for task, (backend, task_started) in list(running.items()):
+            if backend.timeout_seconds is not None and now - task_started >= backend.timeout_seconds:
+                task.cancel()
+                del running[task]
+                self._record(backend, now - task_started, ok=False, reason="timeout")
+
+    def _record(self, backend: SummarizerBackend, latency: float, ok: bool, reason: str) -> None:
+        before = backend.breaker.state
+        backend.stats.record(latency, ok)
+        backend.breaker.record(ok, backend.stats)
+        metrics.inc("summarizer_backend_calls_total", backend=backend.name, result=reason)
+        metrics.observe("summarizer_backend_seconds", latency, backend=backend.name)
+        if backend.breaker.state != before:
+            metrics.inc("summarizer_circuit_changes_total", backend=backend.name, state=backend.breaker.state)
+            print(f"[회로 차단기] {backend.name}: {before} → {backend.breaker.state}")
+
+    def report(self) -> List[dict]:
+        return [
+            {
+                "backend": backend.name,
+                "state": backend.breaker.state,
+                "calls": len(backend.stats),
+                "error_rate": round(backend.stats.error_rate, 3),
+                "p95_seconds": backend.stats.latency_percentile(95),
+            }
+            for backend in self.backends
+        ]
+
+def default_fallback_summarizer(primary: Summarizer) -> FallbackSummarizer:
+    """
+    primary(GPT) → 로컬 추출 요약 순서의 기본 구성
+    마지막 백엔드는 기사 본문에서 문장을 고르므로, 본문과 상관없는 고정 요약이 발송되는 일이 없음
+    (문장이 하나도 없으면 빈 요약 → 파이프라인이 그 기사를 건너뜀)
+    """
+    from summaries.extractive_summarizer import ExtractiveSummarizer
+
+    return FallbackSummarizer([
+        SummarizerBackend(name=getattr(primary, "model", type(primary).__name__), summarizer=primary),
+        SummarizerBackend(name="extractive", summarizer=ExtractiveSummarizer()),
+    ])
+
+# 사용 예시
+if __name__ == "__main__":
+    from summaries.extractive_summarizer import ExtractiveSummarizer
+
+    class SlowSummarizer:
+        def summarize(self, text: str) -> SummaryResult:
+            time.sleep(5)
+            return SummaryResult(summary="늦은 요약", keywords=[], keyword_details={})
+
+    summarizer = FallbackSummarizer(
+        [
+            SummarizerBackend(name="slow", summarizer=SlowSummarizer()),
+            SummarizerBackend(name="extractive", summarizer=ExtractiveSummarizer()),
+        ],
+        sla_seconds=2.0,
+        hedge_min_seconds=0.5
+    )
+    print(summarizer.summarize("정부가 전세사기 피해자 지원 특별법을 시행한다.").summary)
+    print(summarizer.report())
@@ -0,0 +1,165 @@
+# 📦 키워드 용어집: 한 번 설명한 키워드(환율, 금리, 신탁 ...)의 KeywordDetail을 SQLite에 저장해 재사용
+# - 정규화한 키워드를 키로 사용
+# - 자주 쓰는 항목은 메모리 핫 캐시(LRU)에서 바로 반환
+# - 최대 개수를 넘으면 사용 횟수가 적고 오래 안 쓴 항목부터 삭제
+
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import settings
+from summaries.news_summarizer import KeywordDetail
+from summaries.summary_cache import CacheStats
+from utils.sqlite_db import connect
+
+_EDGE_MARKS = "\"'“”‘’`[](){}<>「」『』·,."
+
+def normalize_keyword(keyword: str) -> str:
+    # 전각/반각 통일, 앞뒤 따옴표·괄호 제거, 공백 하나로, 영문은 소문자
+    text = unicodedata.normalize("NFKC", keyword).strip().strip(_EDGE_MARKS).strip()
+    return re.sub(r"\s+", " ", text).lower()
+
+class KeywordGlossary:
+    """
+    SQLite 기반 키워드 설명 저장소 (DATABASE_URL 사용)
+    """
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        hot_size: int = settings.GLOSSARY_HOT_SIZE,
+        max_entries: int = settings.GLOSSARY_MAX_ENTRIES
+    ):
+        self.hot_size = hot_size
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._hot: "OrderedDict[str, KeywordDetail]" = OrderedDict()
+        # 핫 캐시 적중은 DB에 바로 쓰지 않고 모아 두었다가 put_many/flush 때 반영
+        self._pending_uses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS keyword_glossary (
+                    keyword TEXT PRIMARY KEY,
+                    explanation TEXT NOT NULL,
+                    example TEXT NOT NULL,
+                    uses INTEGER NOT NULL DEFAULT 0,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_keyword_glossary_usage ON keyword_glossary (uses, last_used)"
+            )
+
+    def get_many(self, keywords: Iterable[str]) -> Tuple[Dict[str, KeywordDetail], List[str]]:
+        """
+        Returns:
+            (용어집에 있는 키워드 → KeywordDetail, 용어집에 없는 키워드 목록) — 키워드는 입력 그대로
+        """
+        found: Dict[str, KeywordDetail] = {}
+        missing: List[str] = []
+        with self._lock:
+            cold: Dict[str, List[str]] = {}
+            for keyword in dict.fromkeys(keywords):
+                key = normalize_keyword(keyword)
+                if not key:
+                    continue
+                detail = self._hot.get(key)
+                if detail is not None:
+                    self._hot.move_to_end(key)
+                    self._pending_uses[key] = self._pending_uses.get(key, 0) + 1
+                    found[keyword] = detail
+                    self.stats.hits += 1
+                else:
+                    cold.setdefault(key, []).append(keyword)
+
+            if cold:
+                placeholders = ",".join("?" * len(cold))
+                rows = self._conn.execute(
+                    f"SELECT keyword, explanation, example FROM keyword_glossary WHERE keyword IN ({placeholders})",
+                    list(cold)
+                ).fetchall()
+                for key, explanation, example in rows:
+                    detail = KeywordDetail(explanation=explanation, example=example)
+                    self._remember(key, detail)
+                    self._pending_uses[key] = self._pending_uses.get(key, 0) + len(cold[key])
+                    for keyword in cold.pop(key):
+                        found[keyword] = detail
+                        self.stats.hits += 1
+                for keywords_for_key in cold.values():
+                    missing.extend(keywords_for_key)
+                    self.stats.misses += len(keywords_for_key)
+        return found, missing
+
+    def get(self, keyword: str) -> Optional[KeywordDetail]:
+        found, _ = self.get_many([keyword])
+        return found.get(keyword)
+
+    def put_many(self, details: Dict[str, KeywordDetail]) -> None:
+        # 설명이 빈 항목은 저장하지 않음 (다음에 다시 요청)
+        now = time.time()
+        rows = [
+            (key, detail.explanation, detail.example, now)
+            for key, detail in ((normalize_keyword(keyword), detail) for keyword, detail in details.items())
+            if key and detail.explanation
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO keyword_glossary (keyword, explanation, example, uses, last_used)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT(keyword) DO UPDATE SET
+                    explanation = excluded.explanation,
+                    example = excluded.example,
+                    last_used = excluded.last_used
+                """,
+                rows
+            )
+            for key, explanation, example, _ in rows:
+                self._remember(key, KeywordDetail(explanation=explanation, example=example))
+            self._flush_uses(now)
+            self._evict()
+
+    def flush(self) -> None:
+        with self._lock, self._conn:
+            self._flush_uses(time.time())
+
+    def _remember(self, key: str, detail: KeywordDetail) -> None:
+        self._hot[key] = detail
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_size:
+            self._hot.popitem(last=False)
+
+    def _flush_uses(self, now: float) -> None:
+        if self._pending_uses:
+            self._conn.executemany(
+                "UPDATE keyword_glossary SET uses = uses + ?, last_used = ? WHERE keyword = ?",
+                [(uses, now, key) for key, uses in self._pending_uses.items()]
+            )
+            self._pending_uses.clear()
+
+    def _evict(self) -> None:
+        evicted = [
+            row[0] for row in self._conn.execute(
+                "SELECT keyword FROM keyword_glossary ORDER BY uses DESC, last_used DESC LIMIT -1 OFFSET ?",
+                (self.max_entries,)
+            )
+        ]
+        if evicted:
+            self._conn.executemany("DELETE FROM keyword_glossary WHERE keyword = ?", [(key,) for key in evicted])
+            for key in evicted:
+                self._hot.pop(key, None)
+            self.stats.evictions += len(evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM keyword_glossary").fetchone()[0]
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
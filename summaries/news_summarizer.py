@@ -1,14 +1,26 @@
-from typing import List, Protocol
+from typing import TYPE_CHECKING, Callable, List, Optional, Protocol
+from functools import lru_cache
+import json
 import openai
 from dataclasses import dataclass
 from config import settings
+from utils.metrics import metrics
 
-@dataclass
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+if TYPE_CHECKING:
+    from summaries.keyword_glossary import KeywordGlossary
+    from summaries.prompt_compactor import PromptCompactor
+
+@dataclass(frozen=True, slots=True)
 class KeywordDetail:
     explanation: str
     example: str
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     summary: str
     keywords: List[str]
@@ -18,12 +30,10 @@ class Summarizer(Protocol):
     def summarize(self, text: str) -> SummaryResult:
         ...
 
-class GPTNewsSummarizer:
-    def __init__(self, api_key: str = settings.OPENAI_API_KEY):
-        openai.api_key = api_key
-    
-    def summarize(self, text: str) -> SummaryResult:
-        prompt = f"""
+SYSTEM_PROMPT = "You are a helpful news summarizer."
+
+def build_summary_prompt(text: str) -> str:
+    return f"""
         다음 뉴스 기사를 요약해주세요:
         
         {text}
@@ -41,47 +51,315 @@ class GPTNewsSummarizer:
         - 키워드2: 설명: [설명] / 예문: [예문]
         ...
         """
+
+def parse_summary_response(result: str) -> SummaryResult:
+    lines = result.split('\n')
+    summary = ""
+    keywords = []
+    keyword_details = {}
+    
+    for line in lines:
+        if line.startswith("요약:"):
+            summary = line.replace("요약:", "").strip()
+        elif line.startswith("키워드:"):
+            keywords = [k.strip() for k in line.replace("키워드:", "").strip("[]").split(",")]
+        elif line.startswith("- "):
+            # - 키워드: 설명: ... / 예문: ...
+            try:
+                key, rest = line[2:].split(": 설명:", 1)
+                explanation, example = rest.split("/ 예문:")
+                keyword_details[key.strip()] = KeywordDetail(
+                    explanation=explanation.strip(),
+                    example=example.strip()
+                )
+            except Exception:
+                continue
+    
+    return SummaryResult(
+        summary=summary,
+        keywords=keywords,
+        keyword_details=keyword_details
+    )
+
+def build_keyword_summary_prompt(text: str) -> str:
+    # 용어집을 쓸 때: 단어 설명 없이 요약과 키워드만 요청
+    return f"""
+        다음 뉴스 기사를 요약해주세요:
         
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a helpful news summarizer."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=700
-        )
-        
-        result = response.choices[0].message.content
-        
-        # 응답 파싱
-        lines = result.split('\n')
-        summary = ""
-        keywords = []
-        keyword_details = {}
+        {text}
         
-        for line in lines:
-            if line.startswith("요약:"):
-                summary = line.replace("요약:", "").strip()
-            elif line.startswith("키워드:"):
-                keywords = [k.strip() for k in line.replace("키워드:", "").strip("[]").split(",")]
-            elif line.startswith("- "):
-                # - 키워드: 설명: ... / 예문: ...
-                try:
-                    key, rest = line[2:].split(": 설명:", 1)
-                    explanation, example = rest.split("/ 예문:")
-                    keyword_details[key.strip()] = KeywordDetail(
-                        explanation=explanation.strip(),
-                        example=example.strip()
+        다음 형식으로 응답해주세요:
+        요약: [200자 이내의 요약문]
+        키워드: [중요한 키워드 5개를 쉼표로 구분]
+        """
+
+# 용어집에 없는 키워드의 설명만 모아서 요청할 때의 지시문
+GLOSSARY_SYSTEM_PROMPT = """You are a helpful news glossary writer.
+사용자가 보낸 경제/시사 용어마다 쉬운 '설명'과 '예문'을 만들어 아래 JSON 형식으로만 응답하세요.
+{"키워드": {"explanation": "...", "example": "..."}}"""
+
+def build_glossary_prompt(keywords: List[str]) -> str:
+    return "용어: " + ", ".join(keywords)
+
+def parse_glossary_response(result: str) -> dict[str, KeywordDetail]:
+    start, end = result.find("{"), result.rfind("}")
+    data = json.loads(result[start:end + 1])
+    return {
+        str(keyword).strip(): KeywordDetail(
+            explanation=str(detail.get("explanation", "")).strip(),
+            example=str(detail.get("example", "")).strip()
+        )
+        for keyword, detail in data.items()
+        if isinstance(detail, dict)
+    }
+
+# 여러 기사를 한 번에 요약할 때의 지시문 (요청마다 한 번만 보냄)
+BATCH_SYSTEM_PROMPT = """You are a helpful news summarizer.
+사용자가 번호가 붙은 여러 뉴스 기사를 보냅니다. 기사마다
+1. 200자 이내의 요약
+2. 중요한 키워드 5개
+3. 각 키워드에 대해 '설명'과 '예문'
+을 만들어 아래 JSON 형식으로만 응답하세요.
+{"articles": [{"id": 1, "summary": "...", "keywords": ["..."], "keyword_details": {"키워드": {"explanation": "...", "example": "..."}}}]}"""
+
+# 용어집을 쓸 때의 묶음 요약 지시문 (단어 설명 제외)
+BATCH_KEYWORDS_SYSTEM_PROMPT = """You are a helpful news summarizer.
+사용자가 번호가 붙은 여러 뉴스 기사를 보냅니다. 기사마다 200자 이내의 요약과 중요한 키워드 5개를
+만들어 아래 JSON 형식으로만 응답하세요.
+{"articles": [{"id": 1, "summary": "...", "keywords": ["..."]}]}"""
+
+def estimate_tokens(text: str) -> int:
+    # 한국어는 대략 글자당 1토큰으로 어림 (tiktoken을 쓸 수 없을 때만)
+    return len(text) + 1
+
+@lru_cache(maxsize=8)
+def token_counter(model: str) -> Callable[[str], int]:
+    """
+    모델 토크나이저로 토큰 수를 세는 함수. tiktoken이 없거나 인코딩 파일을 받을 수 없으면 글자 수로 어림합니다.
+    """
+    if tiktoken is not None:
+        try:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception as e:
+            print(f"[토큰 계산] tiktoken 인코딩을 불러오지 못해 글자 수로 어림합니다: {e}")
+    return estimate_tokens
+
+def pack_batches(
+    texts: List[str],
+    token_budget: int,
+    max_articles: int,
+    count_tokens: Callable[[str], int] = estimate_tokens
+) -> List[List[int]]:
+    """
+    입력 순서를 유지하면서 토큰 예산 안에 들어가도록 기사 인덱스를 묶습니다.
+    예산보다 긴 기사는 혼자 한 묶음이 됩니다. (count_tokens는 PromptCompactor와 같은 token_counter(model)를 넘김)
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for i, text in enumerate(texts):
+        cost = count_tokens(text)
+        if current and (used + cost > token_budget or len(current) >= max_articles):
+            batches.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+def build_batch_prompt(texts: List[str]) -> str:
+    return "\n\n".join(f"[기사 {i}]\n{text}" for i, text in enumerate(texts, 1))
+
+def parse_batch_response(result: str, count: int) -> dict[int, SummaryResult]:
+    """
+    JSON 응답을 기사 번호(0부터) → SummaryResult로 변환합니다. 형식이 틀린 항목은 빠집니다.
+    """
+    start, end = result.find("{"), result.rfind("}")
+    data = json.loads(result[start:end + 1])
+    parsed: dict[int, SummaryResult] = {}
+    for item in data.get("articles", []):
+        try:
+            index = int(item["id"]) - 1
+            if not 0 <= index < count or not item.get("summary"):
+                continue
+            details = item.get("keyword_details") or {}
+            parsed[index] = SummaryResult(
+                summary=str(item["summary"]).strip(),
+                keywords=[str(k).strip() for k in item.get("keywords", [])],
+                keyword_details={
+                    str(keyword).strip(): KeywordDetail(
+                        explanation=str(detail.get("explanation", "")).strip(),
+                        example=str(detail.get("example", "")).strip()
                     )
-                except Exception:
-                    continue
-        
-        return SummaryResult(
-            summary=summary,
-            keywords=keywords,
-            keyword_details=keyword_details
+                    for keyword, detail in details.items()
+                    if isinstance(detail, dict)
+                }
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return parsed
+
+class GPTNewsSummarizer:
+    # 프롬프트 문구를 바꾸면 올려서 요약 캐시가 예전 결과를 쓰지 않도록 함
+    prompt_version = "1"
+
+    def __init__(
+        self,
+        api_key: str = settings.OPENAI_API_KEY,
+        model: str = "gpt-3.5-turbo",
+        glossary: Optional["KeywordGlossary"] = None,
+        compactor: Optional["PromptCompactor"] = None
+    ):
+        openai.api_key = api_key
+        self.model = model
+        # 주입하면 용어집에 없는 키워드의 설명만 따로 요청
+        self.glossary = glossary
+        # 주입하면 상투 문구를 지우고 토큰 예산에 맞춰 본문을 줄인 뒤 요청
+        self.compactor = compactor
+    
+    def summarize(self, text: str) -> SummaryResult:
+        text = self._compact(text)
+        if self.glossary is not None:
+            return self._fill_keyword_details([self._summarize_keywords_only(text)])[0]
+
+        return self._summarize_one(text)
+
+    def summarize_many(
+        self,
+        texts: List[str],
+        token_budget: int = settings.SUMMARY_BATCH_TOKEN_BUDGET,
+        max_articles: int = settings.SUMMARY_BATCH_MAX_ARTICLES
+    ) -> List[SummaryResult]:
+        """
+        여러 기사를 토큰 예산 단위로 묶어 한 번의 요청으로 요약합니다.
+        묶음 응답을 파싱하지 못한 기사는 summarize()로 하나씩 다시 요약합니다.
+
+        Returns:
+            List[SummaryResult]: texts와 같은 순서의 요약 결과
+        """
+        # 줄인 본문 기준으로 묶어야 한 요청에 더 많은 기사가 들어감
+        texts = [self._compact(text) for text in texts]
+        # 용어집을 쓰면 요약/키워드만 받고, 설명은 마지막에 모든 기사의 모르는 키워드를 모아 한 번에 요청
+        summarize_one = self._summarize_one if self.glossary is None else self._summarize_keywords_only
+        results: List[Optional[SummaryResult]] = [None] * len(texts)
+        # 본문 압축(PromptCompactor)과 같은 토크나이저로 세어 두 예산이 같은 단위가 되도록
+        for batch in pack_batches(texts, token_budget, max_articles, token_counter(self.model)):
+            if len(batch) == 1:
+                results[batch[0]] = summarize_one(texts[batch[0]])
+                continue
+            parsed: dict[int, SummaryResult] = {}
+            try:
+                parsed = self._summarize_batch([texts[i] for i in batch])
+            except Exception as e:
+                print(f"묶음 요약 실패, 기사별 요약으로 전환: {e}")
+            for position, index in enumerate(batch):
+                results[index] = parsed.get(position) or summarize_one(texts[index])
+        if self.glossary is not None:
+            results = self._fill_keyword_details(results)
+        return results
+
+    def _compact(self, text: str) -> str:
+        if self.compactor is None:
+            return text
+        compacted = self.compactor.compact(text)
+        print(f"[요약 입력] 토큰 {compacted.tokens_before} → {compacted.tokens_after}")
+        return compacted.text
+
+    def _summarize_one(self, text: str) -> SummaryResult:
+        result = self._complete("summarize", SYSTEM_PROMPT, build_summary_prompt(text), max_tokens=700)
+        return parse_summary_response(result)
+
+    def _summarize_batch(self, texts: List[str]) -> dict[int, SummaryResult]:
+        system_prompt = BATCH_SYSTEM_PROMPT if self.glossary is None else BATCH_KEYWORDS_SYSTEM_PROMPT
+        max_tokens_per_article = 600 if self.glossary is None else 250
+        result = self._complete(
+            "summarize_batch",
+            system_prompt,
+            build_batch_prompt(texts),
+            max_tokens=min(4000, max_tokens_per_article * len(texts)),
+            articles=len(texts)
         )
+        return parse_batch_response(result, len(texts))
+
+    def _summarize_keywords_only(self, text: str) -> SummaryResult:
+        result = self._complete("summarize", SYSTEM_PROMPT, build_keyword_summary_prompt(text), max_tokens=300)
+        return parse_summary_response(result)
+
+    def _complete(self, kind: str, system_prompt: str, user_prompt: str, max_tokens: int, articles: int = 1) -> str:
+        # 모든 ChatCompletion 호출이 지나는 곳: 요청 종류별 지연 시간과 토큰 사용량을 계측
+        with metrics.span("openai", kind=kind, model=self.model, articles=articles):
+            try:
+                response = openai.ChatCompletion.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    request_timeout=settings.OPENAI_TIMEOUT_SECONDS
+                )
+            except Exception:
+                metrics.inc("openai_failures_total", kind=kind)
+                raise
+        metrics.inc("openai_requests_total", kind=kind)
+        metrics.inc("summarized_articles_total", articles, kind=kind)
+        usage = response.get("usage") if metrics.enabled else None
+        if usage:
+            metrics.inc("openai_tokens_total", usage.get("prompt_tokens", 0), kind=kind, type="prompt")
+            metrics.inc("openai_tokens_total", usage.get("completion_tokens", 0), kind=kind, type="completion")
+        return response.choices[0].message.content
+
+    def _fill_keyword_details(self, results: List[SummaryResult]) -> List[SummaryResult]:
+        """
+        용어집에 있는 키워드는 저장된 설명을 쓰고, 없는 키워드만 한 번의 요청으로 설명을 받아 용어집에 추가합니다.
+        """
+        from summaries.keyword_glossary import normalize_keyword
+
+        keywords = [keyword for result in results for keyword in result.keywords]
+        known, missing = self.glossary.get_many(keywords)
+        if missing:
+            try:
+                result = self._complete(
+                    "glossary",
+                    GLOSSARY_SYSTEM_PROMPT,
+                    build_glossary_prompt(missing),
+                    max_tokens=min(4000, 120 * len(missing)),
+                    articles=0
+                )
+                explained = parse_glossary_response(result)
+                self.glossary.put_many(explained)
+                # 모델이 키워드 표기를 조금 바꿔 답해도 정규화한 키로 맞춤
+                by_key = {normalize_keyword(keyword): detail for keyword, detail in explained.items()}
+                for keyword in missing:
+                    detail = by_key.get(normalize_keyword(keyword))
+                    if detail is not None and detail.explanation:
+                        known[keyword] = detail
+            except Exception as e:
+                print(f"키워드 설명 요청 실패: {e}")
+
+        stats = self.glossary.stats
+        metrics.inc("glossary_lookups_total", len(keywords) - len(missing), result="hit")
+        metrics.inc("glossary_lookups_total", len(missing), result="miss")
+        print(f"[용어집] 적중 {stats.hits} / 미스 {stats.misses} (적중률 {stats.hit_rate:.0%})")
+        for result in results:
+            result.keyword_details = {
+                keyword: known[keyword] for keyword in result.keywords if keyword in known
+            }
+        return results
+
+def summarize_many(summarizer: Summarizer, texts: List[str]) -> List[SummaryResult]:
+    """
+    summarize_many를 지원하는 Summarizer는 묶음 요약을, 아니면 기사별 요약을 사용합니다.
+    """
+    if hasattr(summarizer, "summarize_many"):
+        return summarizer.summarize_many(texts)
+    return [summarizer.summarize(text) for text in texts]
 
 # 사용 예시
 if __name__ == "__main__":
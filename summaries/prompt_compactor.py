@@ -0,0 +1,168 @@
+# 📦 요약 전처리: LLM에 보내기 전에 기사 본문을 줄임
+# - 기자 정보, 저작권 문구, 사진 설명, 제보 안내 같은 상투 문구 제거
+# - 모델 토크나이저(tiktoken, 없으면 글자 수 어림)로 토큰을 세고, 예산을 넘으면
+#   리드 문장 + TextRank 점수가 높은 문장만 본문 순서대로 남김
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from config import settings
+from summaries.extractive_summarizer import ExtractiveSummarizer, split_sentences
+from summaries.news_summarizer import token_counter
+from utils.metrics import metrics
+
+# 기사 끝에 붙는 안내 문구 (저작권, 제보 안내): 표지부터 문장 끝까지 지우고, 그 뒤의 문장 부호 없는 조각도 버림
+_TRAILER_SENTENCES = [
+    re.compile(pattern)
+    for pattern in (
+        r"(무단\s*전재|재배포\s*금지|저작권자|ⓒ|©|Copyright|All rights reserved)",
+        r"(제보|기사\s*문의)\s*[:：]?.*(카카오톡|전화|이메일|메일|@)",
+        r"※",
+    )
+]
+# 문장 전체를 지우는 상투 문구 (기자 연락처, 사진 설명, 해시태그)
+_BOILERPLATE_SENTENCES = [
+    re.compile(pattern)
+    for pattern in (
+        r"^\s*[▲△▶▷■□◆◇]",
+        r"^\s*(\[|\()?\s*사진\s*(설명|제공)?\s*[=:：]",
+        r"^\s*[가-힣]{2,4}\s*(기자|특파원|앵커)\s*(\(|<)?\s*[\w.+-]+@[\w-]+\.[\w.]+\s*(\)|>)?\s*$",
+        r"^\s*#\S+(\s+#\S+)*\s*$",
+    )
+]
+# 문장 안에서 지우는 조각 (출처 표기, 이메일, 사진 표기)
+_BOILERPLATE_SPANS = [
+    re.compile(pattern)
+    for pattern in (
+        r"^\s*[\[(【]\s*[가-힣A-Za-z·]+\s*=\s*[가-힣A-Za-z·]+\s*[\])】]",  # [서울=뉴시스], (서울=연합뉴스)
+        r"^\s*[가-힣]{2,4}\s*(기자|특파원)\s*=\s*",  # 홍길동 기자 =
+        r"[\[(]\s*사진\s*[=:][^\])]*[\])]",  # (사진=연합뉴스)
+        r"[\w.+-]+@[\w-]+\.[\w.]+",
+    )
+]
+
+_SENTENCE_FINAL = re.compile(r"[.!?][\"'”’)\]]*\s*$")
+
+def _strip_sentence(sentence: str) -> Tuple[str, bool]:
+    """
+    Returns:
+        (상투 문구를 지운 문장, 기사 끝 안내 문구가 시작됐는지)
+    """
+    trailer = False
+    for pattern in _TRAILER_SENTENCES:
+        match = pattern.search(sentence)
+        if match:
+            sentence, trailer = sentence[:match.start()], True
+    if any(pattern.search(sentence) for pattern in _BOILERPLATE_SENTENCES):
+        sentence = ""
+    for pattern in _BOILERPLATE_SPANS:
+        sentence = pattern.sub("", sentence)
+    return sentence.strip(), trailer
+
+def strip_boilerplate(text: str) -> str:
+    """
+    문장 단위로 상투 문구를 지웁니다. 본문 추출 결과는 기사 전체가 한 줄이므로
+    줄 단위로 지우면 저작권 표시 하나 때문에 기사 전체가 사라짐
+    """
+    lines = []
+    for line in text.splitlines():
+        kept = []
+        in_trailer = False
+        for sentence in split_sentences(line):
+            # 안내 문구 뒤의 문장 부호 없는 조각("[카카오톡] YTN 검색해 채널 추가")은 안내 문구의 일부로 봄
+            if in_trailer and not _SENTENCE_FINAL.search(sentence):
+                continue
+            sentence, trailer = _strip_sentence(sentence)
+            in_trailer = in_trailer or trailer
+            if len(sentence) > 1:
+                kept.append(sentence)
+        if kept:
+            lines.append(" ".join(kept))
+    return "\n".join(lines)
+
+@dataclass
+class CompactedText:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    sentences_before: int = 0
+    sentences_after: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+class PromptCompactor:
+    def __init__(
+        self,
+        model: str = "gpt-3.5-turbo",
+        token_budget: int = settings.SUMMARY_INPUT_TOKEN_BUDGET,
+        lead_sentences: int = 2,
+        ranker: Optional[ExtractiveSummarizer] = None
+    ):
+        self.model = model
+        self.token_budget = token_budget
+        self.lead_sentences = lead_sentences
+        self.ranker = ranker or ExtractiveSummarizer()
+        self.count_tokens = token_counter(model)
+
+    def compact(self, text: str) -> CompactedText:
+        tokens_before = self.count_tokens(text)
+        cleaned = strip_boilerplate(text)
+        sentences = split_sentences(cleaned)
+        kept = sentences
+        if self.count_tokens(cleaned) > self.token_budget:
+            kept = self._select(sentences)
+            cleaned = " ".join(kept)
+        result = CompactedText(
+            text=cleaned,
+            tokens_before=tokens_before,
+            tokens_after=self.count_tokens(cleaned),
+            sentences_before=len(sentences),
+            sentences_after=len(kept)
+        )
+        metrics.inc("prompt_tokens_total", result.tokens_before, stage="before")
+        metrics.inc("prompt_tokens_total", result.tokens_after, stage="after")
+        return result
+
+    def _select(self, sentences: List[str]) -> List[str]:
+        # 리드 문장은 항상 먼저, 나머지는 점수 순으로 예산이 찰 때까지 (문장 하나가 예산보다 길면 건너뜀)
+        # 들어가는 문장이 하나도 없으면(문장 구분이 없는 본문 등) 첫 문장을 예산에 맞게 잘라 씀
+        scores = self.ranker.sentence_scores(sentences)
+        order = list(range(min(self.lead_sentences, len(sentences))))
+        order += sorted(range(len(order), len(sentences)), key=lambda i: -scores[i])
+        picked, used = [], 0
+        for i in order:
+            cost = self.count_tokens(sentences[i]) + 1
+            if used + cost > self.token_budget:
+                continue
+            picked.append(i)
+            used += cost
+        if not picked and sentences:
+            return [self._truncate(sentences[0])]
+        return [sentences[i] for i in sorted(picked)]
+
+    def _truncate(self, sentence: str) -> str:
+        # 예산 안에 들어가는 가장 긴 앞부분 (토크나이저와 상관없이 쓰도록 글자 수로 이분 탐색)
+        low, high = 0, len(sentence)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(sentence[:middle]) <= self.token_budget:
+                low = middle
+            else:
+                high = middle - 1
+        return sentence[:low].rstrip()
+
+# 사용 예시
+if __name__ == "__main__":
+    text = """[서울=뉴시스] 홍길동 기자 = 정부가 내년부터 전세사기 피해자 지원을 위한 특별법을 시행한다.
+이 법안은 전세보증금을 반환받지 못한 피해자들에게 최대 5000만원까지 지원금을 지급하는 내용을 담고 있다.
+▲ 서울 시내 한 아파트 단지 (사진=뉴시스)
+홍길동 기자 (hong@newsis.com)
+※ '당신의 제보가 뉴스가 됩니다' 카카오톡 : YTN 검색해 채널 추가
+[저작권자(c) 뉴시스. 무단전재-재배포 금지]"""
+    compactor = PromptCompactor(token_budget=40)
+    result = compactor.compact(text)
+    print(result.text)
+    print(f"토큰 {result.tokens_before} → {result.tokens_after} (문장 {result.sentences_before} → {result.sentences_after})")
@@ -0,0 +1,185 @@
+# 📦 요약 캐시: 기사 본문 해시(+모델, 프롬프트 버전, 요약기 구성)를 키로 SummaryResult를 SQLite에 저장
+# - 요약기 구성: 용어집 모드(단어 설명 생략), 본문 압축 예산 → 같은 기사라도 결과가 다르므로 따로 캐시
+# - 같은 기사가 연속 크롤링에 다시 나오면 LLM 호출 없이 캐시에서 반환
+# - TTL 만료 + 최대 개수 초과 시 가장 오래 안 쓴 항목부터 삭제(LRU)
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+from config import settings
+from summaries.news_summarizer import KeywordDetail, Summarizer, SummaryResult, summarize_many
+from utils.metrics import metrics
+from utils.sqlite_db import connect
+
+def normalize_text(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+def summarizer_variant(summarizer: Summarizer) -> str:
+    """
+    요약 결과를 바꾸는 요약기 구성 (용어집 모드, 본문 압축 예산). 기본 구성이면 빈 문자열
+    """
+    parts = []
+    if getattr(summarizer, "glossary", None) is not None:
+        parts.append("glossary")
+    compactor = getattr(summarizer, "compactor", None)
+    if compactor is not None:
+        parts.append(f"compact={compactor.token_budget}/{compactor.lead_sentences}")
+    return ",".join(parts)
+
+def summary_cache_key(text: str, model: str, prompt_version: str, variant: str = "") -> str:
+    digest = hashlib.sha256()
+    # 기본 구성은 variant를 넣지 않아 기존 캐시 키가 그대로 유효함
+    parts = (model, prompt_version, variant, normalize_text(text)) if variant else (model, prompt_version, normalize_text(text))
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def summary_to_json(result: SummaryResult) -> str:
+    return json.dumps(asdict(result), ensure_ascii=False)
+
+def summary_from_json(payload: str) -> SummaryResult:
+    data = json.loads(payload)
+    return SummaryResult(
+        summary=data["summary"],
+        keywords=data["keywords"],
+        keyword_details={
+            keyword: KeywordDetail(**detail)
+            for keyword, detail in data["keyword_details"].items()
+        }
+    )
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class SummaryCache:
+    """
+    SQLite 기반 요약 캐시 (DATABASE_URL 사용)
+    """
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        ttl_seconds: float = settings.SUMMARY_CACHE_TTL_HOURS * 3600,
+        max_entries: int = settings.SUMMARY_CACHE_MAX_ENTRIES
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = connect(database_url)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_summary_cache_last_access ON summary_cache (last_access)"
+            )
+
+    def get(self, key: str) -> Optional[SummaryResult]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM summary_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM summary_cache WHERE key = ?", (key,))
+                    self.stats.evictions += 1
+                self.stats.misses += 1
+                metrics.inc("summary_cache_lookups_total", result="miss")
+                return None
+            self._conn.execute("UPDATE summary_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+        metrics.inc("summary_cache_lookups_total", result="hit")
+        return summary_from_json(row[0])
+
+    def put(self, key: str, result: SummaryResult) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summary_cache (key, payload, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, summary_to_json(result), now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        expired = self._conn.execute(
+            "DELETE FROM summary_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        overflow = self._conn.execute(
+            """
+            DELETE FROM summary_cache WHERE key IN (
+                SELECT key FROM summary_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,)
+        ).rowcount
+        self.stats.evictions += expired + overflow
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+class CachedSummarizer(Summarizer):
+    """
+    임의의 Summarizer를 감싸 캐시에 있는 기사는 LLM 호출을 건너뜁니다.
+    """
+    def __init__(
+        self,
+        summarizer: Summarizer,
+        cache: Optional[SummaryCache] = None,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        variant: Optional[str] = None
+    ):
+        self.summarizer = summarizer
+        self.cache = cache if cache is not None else SummaryCache()
+        self.model = model or getattr(summarizer, "model", type(summarizer).__name__)
+        self.prompt_version = prompt_version or getattr(summarizer, "prompt_version", "1")
+        self.variant = variant if variant is not None else summarizer_variant(summarizer)
+
+    def summarize(self, text: str) -> SummaryResult:
+        key = summary_cache_key(text, self.model, self.prompt_version, self.variant)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self.summarizer.summarize(text)
+        # 파싱에 실패한 빈 요약은 캐시하지 않음
+        if result.summary:
+            self.cache.put(key, result)
+        return result
+
+    def summarize_many(self, texts: List[str]) -> List[SummaryResult]:
+        # 캐시에 없는 기사만 모아 감싼 Summarizer의 묶음 요약으로 보냄
+        keys = [summary_cache_key(text, self.model, self.prompt_version, self.variant) for text in texts]
+        results: List[Optional[SummaryResult]] = [self.cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            for i, result in zip(missing, summarize_many(self.summarizer, [texts[i] for i in missing])):
+                results[i] = result
+                if result.summary:
+                    self.cache.put(keys[i], result)
+        return results
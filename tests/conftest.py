@@ -0,0 +1,6 @@
+# 테스트 공통 설정: 저장소 루트를 import 경로에 넣고, 설정에 필요한 API 키는 가짜 값으로 채움
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,40 @@
+import struct
+
+import utils.compact_models as compact_models
+from crawler.naver_ranking_crawler import NewsArticle
+from summaries.news_summarizer import KeywordDetail, SummaryResult
+from summaries.summary_cache import summary_from_json, summary_to_json
+from utils.compact_models import CompactArticle, CompactSummary, pack, unpack
+
+ARTICLE = NewsArticle(title="전세사기 특별법 시행", link="https://n.news.naver.com/article/052/1", category="사회", keywords=["전세", "특별법"])
+SUMMARY = SummaryResult(
+    summary="정부가 특별법을 시행한다.",
+    keywords=["전세", "특별법"],
+    keyword_details={"전세": KeywordDetail(explanation="보증금을 맡기고 빌리는 집", example="전세로 이사했다.")}
+)
+
+def test_pack_unpack_round_trip():
+    detail = KeywordDetail(explanation="설명", example="예문")
+    items = unpack(pack([ARTICLE, SUMMARY, detail, CompactArticle.from_article(ARTICLE)]))
+    article, summary, unpacked_detail, compact = items
+    assert article.to_article() == ARTICLE and compact == CompactArticle.from_article(ARTICLE)
+    assert summary.to_result() == SUMMARY and summary.detail("전세") == SUMMARY.keyword_details["전세"]
+    assert unpacked_detail == detail
+
+def test_layout_is_little_endian_uint32():
+    data = pack([KeywordDetail(explanation="가", example="나")])
+    magic, string_count, int_count, blob_size = struct.unpack_from("<4sIII", data)
+    assert (magic, string_count, int_count, blob_size) == (b"NBC1", 2, 3, 6)
+    offset = struct.calcsize("<4sIII")
+    assert struct.unpack_from("<2I", data, offset) == (1, 1)
+    assert struct.unpack_from("<3I", data, offset + 8) == (3, 0, 1)
+    assert data[offset + 20:].decode("utf-8") == "가나"
+
+def test_struct_fallback_produces_same_bytes(monkeypatch):
+    expected = pack([ARTICLE, SUMMARY])
+    monkeypatch.setattr(compact_models, "_UINT32_CODE", None)
+    assert pack([ARTICLE, SUMMARY]) == expected
+    assert unpack(expected)[1] == CompactSummary.from_result(SUMMARY)
+
+def test_summary_json_round_trip():
+    assert summary_from_json(summary_to_json(SUMMARY)) == SUMMARY
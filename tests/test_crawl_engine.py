@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from crawler.crawl_engine import NaverCrawlEngine, category_from_link
+
+RANKING_PAGE = """<html><body><ul class="press_ranking_list">
+<li class="as_thumb"><a href="https://n.news.naver.com/article/052/0002000001?ntype=RANKING">순위 기사</a></li>
+<li class="as_thumb"><a href="https://n.news.naver.com/article/052/0002000002?sid=101">경제 기사</a></li>
+<li class="as_thumb"><a href="https://n.news.naver.com/article/052/0002000003?sid=105">IT 기사</a></li>
+</ul></body></html>"""
+
+class FakeHTTPClient:
+    def get(self, url, headers):
+        return SimpleNamespace(status_code=200, text=RANKING_PAGE, content=RANKING_PAGE.encode("utf-8"), headers={})
+
+def make_engine(**kwargs) -> NaverCrawlEngine:
+    return NaverCrawlEngine(
+        FakeHTTPClient(), press_ids=["052"], ranking_types=["popular"], host_min_interval_seconds=0, **kwargs
+    )
+
+def test_category_from_link():
+    assert category_from_link("https://n.news.naver.com/article/052/1?sid=102") == "사회"
+    assert category_from_link("https://n.news.naver.com/article/052/1?ntype=RANKING") == "일반"
+    assert category_from_link("https://n.news.naver.com/article/052/1?ntype=RANKING", default=None) is None
+
+def test_sid_less_ranking_link_is_not_filtered_out():
+    articles = make_engine(categories=["경제", "사회"]).fetch_articles(limit=10)
+    by_title = {article.title: article.category for article in articles}
+    assert by_title == {"순위 기사": "일반", "경제 기사": "경제"}
+
+def test_no_category_filter_keeps_everything():
+    articles = make_engine(categories=[]).fetch_articles(limit=10)
+    assert len(articles) == 3
+
+class ETagHTTPClient(FakeHTTPClient):
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers):
+        self.requests.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return SimpleNamespace(status_code=304, text="", content=b"", headers={})
+        return SimpleNamespace(status_code=200, text=RANKING_PAGE, content=RANKING_PAGE.encode("utf-8"), headers={"ETag": '"v1"'})
+
+def test_commit_records_seen_articles_and_validators():
+    from crawler.crawl_state import ConditionalRequestCache, SeenArticleIndex
+
+    http_client = ETagHTTPClient()
+    seen_index = SeenArticleIndex("sqlite://")
+    engine = NaverCrawlEngine(
+        http_client, press_ids=["052"], ranking_types=["popular"], categories=["경제"],
+        host_min_interval_seconds=0, seen_index=seen_index, conditional_cache=ConditionalRequestCache("sqlite://")
+    )
+    articles = engine.fetch_articles(limit=10)
+    assert [article.title for article in articles] == ["순위 기사", "경제 기사"]
+    # 발송 전에는 아무것도 기록하지 않음
+    assert engine.fetch_articles(limit=10) and "If-None-Match" not in http_client.requests[-1]
+
+    engine.commit()
+    assert articles[0].link in seen_index
+    assert engine.fetch_articles(limit=10) == []
+    assert http_client.requests[-1]["If-None-Match"] == '"v1"'
+
+def test_partial_delivery_marks_only_delivered_and_keeps_refetching():
+    from crawler.crawl_state import ConditionalRequestCache, SeenArticleIndex
+
+    http_client = ETagHTTPClient()
+    seen_index = SeenArticleIndex("sqlite://")
+    engine = NaverCrawlEngine(
+        http_client, press_ids=["052"], ranking_types=["popular"], categories=["경제"],
+        host_min_interval_seconds=0, seen_index=seen_index, conditional_cache=ConditionalRequestCache("sqlite://")
+    )
+    first, second = engine.fetch_articles(limit=10)
+    engine.commit([second])
+    assert second.link in seen_index and first.link not in seen_index
+    assert [article.title for article in engine.fetch_articles(limit=10)] == ["순위 기사"]
+    assert "If-None-Match" not in http_client.requests[-1]
+
+def test_assigned_categories_are_interned():
+    import sys
+
+    articles = make_engine(categories=[]).fetch_articles(limit=10)
+    for article in articles:
+        assert article.category is sys.intern(article.category)
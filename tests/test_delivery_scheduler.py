@@ -0,0 +1,39 @@
+from collections import Counter
+
+from subscriptions.delivery_scheduler import DeliveryScheduler
+from subscriptions.digest_planner import DigestPlan
+
+def make_scheduler(**kwargs) -> DeliveryScheduler:
+    # tick당 2번 요청 × 묶음 5명 = 10명
+    options = dict(rate_per_second=1.0, batch_size=5, utilization=1.0, tick_seconds=2.0, max_early_seconds=4.0)
+    options.update(kwargs)
+    return DeliveryScheduler(**options)
+
+def plan(count: int, prefix: str) -> DigestPlan:
+    return DigestPlan(categories=("경제",), articles=[], receiver_uuids=[f"{prefix}{i}" for i in range(count)])
+
+def test_capacity_per_tick():
+    assert make_scheduler().capacity_per_tick == 10
+    assert make_scheduler(rate_per_second=0.1).capacity_per_tick == 5
+
+def test_assign_respects_capacity_and_early_limit():
+    scheduler = make_scheduler()
+    target = 1000.0
+    schedule = scheduler.assign({target: [plan(25, "a"), plan(10, "b")]})
+    per_tick = Counter()
+    for send in schedule:
+        per_tick[send.at] += len(send.receiver_uuids)
+    assert sum(per_tick.values()) == 35
+    assert max(per_tick.values()) <= scheduler.capacity_per_tick
+    # 최대 max_early_seconds 먼저, 늦는 쪽은 남은 만큼 뒤로
+    assert min(per_tick) >= target - 4.0
+    assert per_tick[target] == 10
+    assert [send.at for send in schedule] == sorted(send.at for send in schedule)
+
+def test_assign_keeps_every_receiver_once():
+    schedule = make_scheduler().assign({1000.0: [plan(12, "a")], 1002.0: [plan(7, "b")]})
+    receivers = [uuid for send in schedule for uuid in send.receiver_uuids]
+    assert sorted(receivers) == sorted([f"a{i}" for i in range(12)] + [f"b{i}" for i in range(7)])
+
+def test_assign_empty():
+    assert make_scheduler().assign({}) == []
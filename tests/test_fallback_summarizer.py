@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from summaries.fallback_summarizer import FallbackSummarizer, SummarizerBackend, default_fallback_summarizer
+from summaries.news_summarizer import SummaryResult
+
+ARTICLE = (
+    "정부가 전세사기 피해자 지원을 위한 특별법 개정안을 발표했다. "
+    "개정안은 피해자가 살던 집을 공공이 먼저 매입해 장기 임대하는 내용을 담았다. "
+    "야당은 보증금 선지급 방안이 빠졌다며 비판했다."
+)
+
+class FailingSummarizer:
+    def summarize(self, text: str) -> SummaryResult:
+        raise RuntimeError("API 장애")
+
+class SlowSummarizer:
+    def summarize(self, text: str) -> SummaryResult:
+        time.sleep(0.5)
+        return SummaryResult(summary="늦은 요약", keywords=[], keyword_details={})
+
+def test_default_last_resort_summarizes_the_article_itself():
+    summarizer = default_fallback_summarizer(FailingSummarizer())
+    assert [backend.name for backend in summarizer.backends] == ["FailingSummarizer", "extractive"]
+    result = summarizer.summarize(ARTICLE)
+    assert result.summary and result.summary.split(".")[0] in ARTICLE
+    assert "전세 사기 피해가 반복되고" not in result.summary
+
+def test_last_resort_returns_empty_summary_when_article_has_no_sentences():
+    result = default_fallback_summarizer(FailingSummarizer()).summarize("")
+    assert result.summary == ""
+
+def test_slow_remote_falls_back_within_sla():
+    summarizer = FallbackSummarizer(
+        [
+            SummarizerBackend(name="slow", summarizer=SlowSummarizer()),
+            SummarizerBackend(name="local", summarizer=default_fallback_summarizer(FailingSummarizer()).backends[-1].summarizer),
+        ],
+        sla_seconds=0.3,
+        hedge_min_seconds=0.1,
+        local_reserve_seconds=0.1
+    )
+    started = time.monotonic()
+    result = asyncio.run(summarizer.asummarize(ARTICLE))
+    assert time.monotonic() - started < 0.45
+    assert result.summary != "늦은 요약"
+
+def test_circuit_breaker_opens_then_allows_one_probe(monkeypatch):
+    from summaries.fallback_summarizer import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RollingStats
+
+    now = [100.0]
+    monkeypatch.setattr("summaries.fallback_summarizer.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(error_rate_threshold=0.5, min_requests=2, cooldown_seconds=10)
+    stats = RollingStats(window=10)
+    for ok in (True, False):
+        stats.record(0.1, ok)
+        breaker.record(ok, stats)
+    assert breaker.state == OPEN and not breaker.allow()
+
+    now[0] += 10
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    # 취소된 시험 호출은 자리를 돌려줌
+    breaker.release()
+    assert breaker.allow()
+    stats.record(0.1, True)
+    breaker.record(True, stats)
+    assert breaker.state == CLOSED and breaker.allow()
+
+def test_circuit_breaker_failed_probe_reopens(monkeypatch):
+    from summaries.fallback_summarizer import OPEN, CircuitBreaker, RollingStats
+
+    now = [0.0]
+    monkeypatch.setattr("summaries.fallback_summarizer.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(error_rate_threshold=0.5, min_requests=1, cooldown_seconds=5)
+    stats = RollingStats(window=10)
+    stats.record(0.1, False)
+    breaker.record(False, stats)
+    now[0] = 5
+    assert breaker.allow()
+    breaker.record(False, stats)
+    assert breaker.state == OPEN and not breaker.allow()
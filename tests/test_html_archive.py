@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from crawler.html_archive import ArchiveReplayHTTPClient, ArchivingHTTPClient, HTMLArchive
+
+URL = "https://n.news.naver.com/article/052/0002000000?sid=102"
+PAGE = "<html><body><div id=\"dic_area\">본문</div></body></html>".encode("utf-8") * 50
+
+class StreamingResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.status_code = 200
+        self.encoding = "utf-8"
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 16 * 1024):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+class StreamingClient:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, headers):
+        self.calls += 1
+        return SimpleNamespace(status_code=200, content=PAGE, encoding="utf-8")
+
+    def stream(self, url, headers):
+        self.calls += 1
+        return StreamingResponse(PAGE)
+
+def test_put_get_round_trip_and_remap_closes_old_map(tmp_path):
+    archive = HTMLArchive(str(tmp_path))
+    archive.put(URL, b"first")
+    assert archive.get(URL).content == b"first"
+    old_map = archive._maps[1]
+    archive.put("https://media.naver.com/press/052/ranking?type=popular", b"second" * 100)
+    assert archive.get("https://media.naver.com/press/052/ranking?type=popular").content == b"second" * 100
+    assert old_map.closed and not archive._maps[1].closed
+    archive.close()
+
+def test_partially_read_stream_is_marked_truncated(tmp_path):
+    archive = HTMLArchive(str(tmp_path))
+    client = ArchivingHTTPClient(StreamingClient(), archive)
+    response = client.stream(URL, headers={})
+    first = next(response.iter_content(chunk_size=100))
+    response.close()
+    page = archive.get(URL)
+    assert page.truncated and page.content == first
+
+    response = client.stream(URL, headers={})
+    assert b"".join(response.iter_content(chunk_size=100)) == PAGE
+    response.close()
+    page = archive.get(URL)
+    assert not page.truncated and page.content == PAGE
+    archive.close()
+
+def test_replay_refetches_truncated_page_when_fallback_exists(tmp_path):
+    archive = HTMLArchive(str(tmp_path))
+    archive.put(URL, PAGE[:100], truncated=True)
+    live = StreamingClient()
+    response = ArchiveReplayHTTPClient(archive, fallback=live).stream(URL, headers={})
+    assert b"".join(response.iter_content()) == PAGE and live.calls == 1
+
+    # fallback이 없으면 저장된 앞부분을 그대로 재생
+    offline = ArchiveReplayHTTPClient(archive).get(URL, headers={})
+    assert offline.content == PAGE[:100]
+    archive.close()
+
+def test_opens_archive_created_without_truncated_column(tmp_path):
+    import sqlite3
+
+    conn = sqlite3.connect(str(tmp_path / "index.db"))
+    conn.execute(
+        "CREATE TABLE pages (key TEXT NOT NULL, fetched_at REAL NOT NULL, url TEXT NOT NULL, segment INTEGER NOT NULL,"
+        " offset INTEGER NOT NULL, length INTEGER NOT NULL, status_code INTEGER NOT NULL, encoding TEXT)"
+    )
+    conn.commit()
+    conn.close()
+    archive = HTMLArchive(str(tmp_path))
+    archive.put(URL, b"body")
+    assert archive.get(URL).truncated is False
+    archive.close()
@@ -0,0 +1,47 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from utils.http_transport import AsyncHTTPTransport, HTTPTransportConfig, PooledHTTPClient, request_timeout
+
+def test_pooled_client_maps_settings_to_adapter():
+    client = PooledHTTPClient(HTTPTransportConfig(host_pools=5, connections_per_host=3))
+    adapter = client.session.get_adapter("https://n.news.naver.com/")
+    assert adapter._pool_connections == 5 and adapter._pool_maxsize == 3
+    client.close()
+
+async def _slow_server_call(total_seconds):
+    async def handler(request):
+        await asyncio.sleep(0.3)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_post("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        # 공유 세션의 기본 타임아웃(0.1초)보다 긴 요청별 타임아웃을 쓰는 호출 (OpenAI 요약처럼)
+        async with AsyncHTTPTransport(HTTPTransportConfig(timeout_seconds=0.1)) as transport:
+            session = await transport.session()
+            async with session.post(f"http://127.0.0.1:{port}/", timeout=request_timeout(transport, total_seconds)) as response:
+                return await response.text()
+    finally:
+        await runner.cleanup()
+
+def test_per_request_timeout_overrides_transport_default():
+    assert asyncio.run(_slow_server_call(2.0)) == "ok"
+
+def test_transport_default_timeout_still_applies_per_request():
+    try:
+        asyncio.run(_slow_server_call(None))
+    except asyncio.TimeoutError:
+        return
+    raise AssertionError("기본 타임아웃이 적용되지 않았습니다.")
+
+def test_request_timeout_without_transport_uses_defaults():
+    timeout = request_timeout(None)
+    assert isinstance(timeout, aiohttp.ClientTimeout) and timeout.total == HTTPTransportConfig().timeout_seconds
@@ -0,0 +1,54 @@
+import time
+
+from jobs.job_queue import JOB_CRAWL, JOB_EXTRACT, JobQueue
+
+def make_queue(tmp_path, **kwargs) -> JobQueue:
+    # 여러 연결이 같은 DB를 보도록 파일 DB 사용
+    return JobQueue(f"sqlite:///{tmp_path / 'jobs.db'}", **kwargs)
+
+def test_enqueue_is_idempotent_and_earlier_stage_first(tmp_path):
+    queue = make_queue(tmp_path)
+    assert queue.enqueue(JOB_EXTRACT, "run:1", {"n": 1}, "run")
+    assert queue.enqueue(JOB_CRAWL, "run", {"limit": 3}, "run")
+    assert not queue.enqueue(JOB_CRAWL, "run", {"limit": 5}, "run")
+    job = queue.claim("w1")
+    assert (job.kind, job.payload, job.attempts) == (JOB_CRAWL, {"limit": 3}, 1)
+
+def test_running_job_is_not_claimed_until_lease_expires(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    queue.enqueue(JOB_CRAWL, "run", {}, "run")
+    first = queue.claim("w1")
+    assert queue.claim("w2") is None
+    time.sleep(0.1)
+    reclaimed = queue.claim("w2")
+    # lease가 만료돼 다시 가져가면 시도 횟수가 올라감
+    assert reclaimed.id == first.id and reclaimed.attempts == 2
+
+def test_job_that_keeps_killing_workers_ends_failed(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.enqueue(JOB_CRAWL, "run", {}, "run")
+    for attempt in (1, 2):
+        job = queue.claim("dead")
+        assert job.attempts == attempt
+        # 워커 프로세스가 죽어 run_worker_pool()이 작업을 반환
+        queue.release("dead")
+    assert queue.claim("w") is None
+    assert queue.unfinished() == 0
+    assert queue.counts() == {"crawl:failed": 1}
+
+def test_expired_lease_at_max_attempts_is_failed_on_claim(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=1, lease_seconds=0.01)
+    queue.enqueue(JOB_CRAWL, "run", {}, "run")
+    assert queue.claim("dead").attempts == 1
+    time.sleep(0.05)
+    assert queue.claim("w") is None
+    assert queue.counts() == {"crawl:failed": 1}
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.enqueue(JOB_CRAWL, "run", {}, "run")
+    queue.fail(queue.claim("w"), "boom")
+    assert queue.counts() == {"crawl:pending": 1}
+    queue.fail(queue.claim("w"), "boom")
+    assert queue.counts() == {"crawl:failed": 1}
+    assert queue.claim("w") is None
@@ -0,0 +1,39 @@
+import pickle
+
+from utils.metrics import MetricsRegistry
+
+def make_registry() -> MetricsRegistry:
+    registry = MetricsRegistry(enabled=True)
+    registry.inc("jobs_total", kind="crawl")
+    registry.observe("latency_seconds", 0.02)
+    with registry.span("summarize"):
+        pass
+    return registry
+
+def test_merge_adds_worker_state():
+    parent = make_registry()
+    worker_state = pickle.loads(pickle.dumps(make_registry().state()))
+    parent.merge(worker_state)
+    text = parent.to_prometheus()
+    assert 'newsbot_jobs_total{kind="crawl"} 2' in text
+    assert "newsbot_latency_seconds_count 2" in text
+    assert 'newsbot_stage_seconds_count{stage="summarize"} 2' in text
+    spans = parent.report()["spans"]
+    assert len(spans) == 2 and spans[1]["process"] == worker_state["pid"]
+
+def test_merge_respects_span_limit_and_disabled_registry():
+    parent = MetricsRegistry(enabled=True, max_spans=1)
+    parent.merge(make_registry().state())
+    parent.merge(make_registry().state())
+    assert len(parent.report()["spans"]) == 1 and parent.dropped_spans == 1
+
+    disabled = MetricsRegistry(enabled=False)
+    disabled.merge(make_registry().state())
+    assert disabled.to_prometheus() == "\n"
+
+def test_export_writes_both_files(tmp_path):
+    registry = make_registry()
+    registry.export(str(tmp_path / "report.json"), str(tmp_path / "metrics.prom"))
+    assert (tmp_path / "report.json").exists() and (tmp_path / "metrics.prom").exists()
+    MetricsRegistry(enabled=False).export(str(tmp_path / "off.json"), str(tmp_path / "off.prom"))
+    assert not (tmp_path / "off.json").exists()
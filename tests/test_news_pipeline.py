@@ -0,0 +1,37 @@
+import asyncio
+
+from crawler.naver_ranking_crawler import NewsArticle
+from pipeline.news_pipeline import NewsPipeline
+from summaries.news_summarizer import SummaryResult
+
+class FakeSource:
+    def fetch_articles(self, limit: int = 3):
+        return [NewsArticle(title=f"기사 {i}", link=f"https://n.news.naver.com/article/052/{i}") for i in range(limit)]
+
+class EmptyForFirstSummarizer:
+    def summarize(self, text: str) -> SummaryResult:
+        summary = "" if text.endswith("/0") else f"{text} 요약"
+        return SummaryResult(summary=summary, keywords=[], keyword_details={})
+
+class RecordingSender:
+    def __init__(self):
+        self.messages = []
+
+    async def send_message(self, message, receiver_uuids=None) -> bool:
+        self.messages.append(message)
+        return True
+
+def test_article_with_empty_summary_is_not_sent():
+    sender = RecordingSender()
+    pipeline = NewsPipeline(
+        source=FakeSource(),
+        summarizer=EmptyForFirstSummarizer(),
+        sender=sender,
+        receiver_uuids=["me"],
+        extractor=lambda link: f"본문 {link}"
+    )
+    results = asyncio.run(pipeline.run(limit=2))
+    by_title = {item.article.title: item for item in results}
+    assert by_title["기사 0"].error == "summarize: 빈 요약" and not by_title["기사 0"].sent
+    assert by_title["기사 1"].sent
+    assert len(sender.messages) == 1
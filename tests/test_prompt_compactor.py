@@ -0,0 +1,55 @@
+from summaries.extractive_summarizer import split_sentences
+from summaries.prompt_compactor import PromptCompactor, strip_boilerplate
+from utils.article_extractor import RawArticlePage, parse_article_html
+
+# YTN 기사 페이지 구조: 본문 조각은 태그마다 나뉘고 추출기는 공백 없이 이어 붙임
+YTN_PAGE = """<html><body>
+<div id="dic_area"><strong>[서울=뉴시스] 홍길동 기자 = </strong>정부가 내년부터 전세사기 피해자 지원을 위한 특별법을 시행한다.<br>
+<p>이 법안은 전세보증금을 반환받지 못한 피해자들에게 최대 5000만원까지 지원금을 지급하는 내용을 담고 있다.
+<p>국토교통부는 "피해자 구제에 최선을 다하겠다."고 밝혔다.
+<p>홍길동 기자 hong@newsis.com
+<p>※ '당신의 제보가 뉴스가 됩니다' YTN은 여러분의 소중한 제보를 기다립니다.[카카오톡] YTN 검색해 채널 추가
+<p>[저작권자(c) YTN 무단전재 및 재배포 금지]
+</div><div class="ad">광고</div></body></html>"""
+
+def extracted_text() -> str:
+    result = parse_article_html(RawArticlePage(url="https://n.news.naver.com/article/052/1", content=YTN_PAGE.encode("utf-8")))
+    assert result.ok
+    return result.text
+
+def test_extractor_output_is_one_line_without_spaces_between_sentences():
+    text = extracted_text()
+    assert "\n" not in text
+    assert "시행한다.이 법안은" in text
+
+def test_split_sentences_without_space_after_period():
+    sentences = split_sentences(extracted_text())
+    assert sentences[0].endswith("특별법을 시행한다.")
+    assert sentences[1].startswith("이 법안은")
+    assert '국토교통부는 "피해자 구제에 최선을 다하겠다."고 밝혔다.' in sentences
+    assert split_sentences("금리는 3.5%다.도메인은 newsis.com이다.") == ["금리는 3.5%다.", "도메인은 newsis.com이다."]
+
+def test_strip_boilerplate_keeps_body_of_one_line_article():
+    cleaned = strip_boilerplate(extracted_text())
+    assert cleaned.startswith("정부가 내년부터")
+    assert cleaned.endswith('"피해자 구제에 최선을 다하겠다."고 밝혔다.')
+    for marker in ("저작권", "무단전재", "제보", "카카오톡", "hong@", "뉴시스"):
+        assert marker not in cleaned
+
+def test_compact_under_budget_keeps_article():
+    result = PromptCompactor(token_budget=1500).compact(extracted_text())
+    assert result.text == strip_boilerplate(extracted_text())
+    assert result.sentences_after == 3
+
+def test_compact_never_returns_empty_text():
+    result = PromptCompactor(token_budget=300).compact("가나다라마바사 " * 400 + ".")
+    assert result.text
+    assert result.tokens_after <= 300
+
+def test_compact_over_budget_keeps_lead_and_stays_in_budget():
+    body = " ".join(f"{i}번째 문장은 전세사기 대책과 관련된 세부 내용 {i}을 설명한다." for i in range(60))
+    compactor = PromptCompactor(token_budget=200, lead_sentences=1)
+    result = compactor.compact(body)
+    assert result.tokens_before > 200 >= result.tokens_after
+    assert result.text.startswith("0번째 문장은")
+    assert result.sentences_after < result.sentences_before
@@ -0,0 +1,62 @@
+from summaries import news_summarizer
+from summaries.news_summarizer import GPTNewsSummarizer, SummaryResult, pack_batches, token_counter
+from summaries.prompt_compactor import PromptCompactor
+from summaries.summary_cache import CachedSummarizer, SummaryCache, summarizer_variant, summary_cache_key
+
+TEXT = "정부가 내년부터 전세사기 피해자 지원을 위한 특별법을 시행한다."
+
+class CountingSummarizer:
+    model = "counting"
+
+    def __init__(self, glossary=None, compactor=None):
+        self.glossary = glossary
+        self.compactor = compactor
+        self.calls = 0
+
+    def summarize(self, text: str) -> SummaryResult:
+        self.calls += 1
+        return SummaryResult(summary=f"요약 {self.calls}", keywords=[], keyword_details={})
+
+def test_default_variant_keeps_existing_keys():
+    assert summarizer_variant(CountingSummarizer()) == ""
+    assert summary_cache_key(TEXT, "m", "1", "") == summary_cache_key(TEXT, "m", "1")
+
+def test_keys_differ_by_glossary_mode_and_compaction_budget():
+    variants = {
+        summarizer_variant(CountingSummarizer()),
+        summarizer_variant(CountingSummarizer(glossary=object())),
+        summarizer_variant(CountingSummarizer(compactor=PromptCompactor(token_budget=200))),
+        summarizer_variant(CountingSummarizer(compactor=PromptCompactor(token_budget=400))),
+    }
+    assert len(variants) == 4
+    assert len({summary_cache_key(TEXT, "m", "1", variant) for variant in variants}) == 4
+
+def test_cached_summarizer_does_not_share_entries_across_variants(tmp_path):
+    cache = SummaryCache(f"sqlite:///{tmp_path / 'cache.db'}")
+    plain = CachedSummarizer(CountingSummarizer(), cache)
+    with_glossary = CachedSummarizer(CountingSummarizer(glossary=object()), cache)
+
+    assert plain.summarize(TEXT).summary == "요약 1"
+    assert plain.summarize(TEXT).summary == "요약 1"
+    assert with_glossary.summarize(TEXT).summary == "요약 1"
+    assert with_glossary.summarizer.calls == 1
+    assert len(cache) == 2
+    cache.close()
+
+def test_pack_batches_uses_given_counter():
+    texts = ["가" * 10, "나" * 10, "다" * 10]
+    assert pack_batches(texts, token_budget=25, max_articles=10) == [[0, 1], [2]]
+    assert pack_batches(texts, token_budget=25, max_articles=10, count_tokens=lambda text: 1) == [[0, 1, 2]]
+
+def test_compactor_and_batcher_share_one_counter(monkeypatch):
+    seen = []
+
+    def fake_pack_batches(texts, token_budget, max_articles, count_tokens=None):
+        seen.append(count_tokens)
+        return []
+
+    monkeypatch.setattr(news_summarizer, "pack_batches", fake_pack_batches)
+    summarizer = GPTNewsSummarizer(api_key="test", compactor=PromptCompactor(model="gpt-3.5-turbo"))
+    summarizer.summarize_many([TEXT])
+    assert seen == [token_counter("gpt-3.5-turbo")]
+    assert summarizer.compactor.count_tokens is seen[0]
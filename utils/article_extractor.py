@@ -1,11 +1,299 @@
 # 📦 보조 기능: 기사 본문 추출 (BeautifulSoup + 정규표현식 필요할 수 있음)
 
-import requests
-from bs4 import BeautifulSoup
-
-def extract_article_text(url):
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-    soup = BeautifulSoup(response.text, "html.parser")
-    # 본문 위치는 뉴스마다 다름 (네이버 뉴스는 id="dic_area"인 경우가 많음)
-    article = soup.select_one("#dic_area")
-    return article.get_text(strip=True) if article else "본문 추출 실패"
+import codecs
+import time
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import List, Optional
+from config import settings
+from crawler.naver_ranking_crawler import HTTPClient
+from utils.html_parser import HTMLParserBackend, ParseScope, get_parser
+from utils.http_transport import get_default_http_client
+from utils.metrics import SIZE_BUCKETS, metrics
+
+# 본문 위치는 뉴스마다 다름 (네이버 뉴스는 id="dic_area"인 경우가 많음)
+ARTICLE_SELECTOR = "#dic_area"
+ARTICLE_SCOPE = ParseScope(attrs={"id": "dic_area"})
+
+def extract_article_text(
+    url,
+    http_client: Optional[HTTPClient] = None,
+    parser: Optional[HTMLParserBackend] = None
+):
+    # http_client를 주입하지 않으면 프로세스 전역의 풀링된 클라이언트를 재사용
+    http_client = http_client or get_default_http_client()
+    parser = parser or get_parser(settings.HTML_PARSER_BACKEND)
+    with metrics.span("extract.fetch"):
+        response = http_client.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    with metrics.span("extract.parse", parser=parser.name):
+        article = parser.select_one(response.text, ARTICLE_SELECTOR, scope=ARTICLE_SCOPE)
+    metrics.inc("extract_total", status=STATUS_OK if article else STATUS_NOT_FOUND)
+    return article.text if article else "본문 추출 실패"
+
+# 스트리밍 추출 결과 상태
+STATUS_OK = "ok"
+STATUS_NOT_FOUND = "not_found"
+STATUS_TOO_LARGE = "too_large"
+STATUS_TIMEOUT = "timeout"
+STATUS_HTTP_ERROR = "http_error"
+STATUS_ERROR = "error"
+
+@dataclass
+class ArticleExtraction:
+    url: str
+    status: str
+    text: str = ""
+    byline: Optional[str] = None
+    published_at: Optional[str] = None
+    bytes_read: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+_SKIP_TAGS = {"script", "style"}
+# 같은 태그가 다시 열리면 앞의 것이 암묵적으로 닫히는 태그 (<p>a<p>b)
+_AUTO_CLOSE_TAGS = {"p", "li"}
+
+class _NaverArticleParser(HTMLParser):
+    """
+    feed()로 조금씩 넣으면서 #dic_area 본문, 기자 정보, 입력 시각을 모으는 증분 파서
+    열린 태그를 스택으로 관리하고, 닫는 태그는 같은 이름의 가장 가까운 열린 태그까지 한 번에 닫음
+    (html5lib/BeautifulSoup처럼 </p>, </li>가 빠진 HTML에서도 본문 끝을 놓치지 않도록)
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.body_parts: List[str] = []
+        self.byline_parts: List[str] = []
+        self.published_at: Optional[str] = None
+        self.body_closed = False
+        self._stack: List[str] = []
+        # 본문/기자 정보/스크립트 영역을 연 태그의 스택 위치 (영역 밖이면 None)
+        self._body_at: Optional[int] = None
+        self._byline_at: Optional[int] = None
+        self._skip_at: Optional[int] = None
+
+    @property
+    def in_body(self) -> bool:
+        return self._body_at is not None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "span" and "media_end_head_info_datestamp_time" in classes and self.published_at is None:
+            self.published_at = attrs.get("data-date-time")
+        if tag in _VOID_TAGS:
+            return
+        if tag in _AUTO_CLOSE_TAGS and self._stack and self._stack[-1] == tag:
+            self._close_to(len(self._stack) - 1)
+        self._stack.append(tag)
+        at = len(self._stack) - 1
+        if tag in _SKIP_TAGS and self._skip_at is None:
+            self._skip_at = at
+        if self._body_at is None and attrs.get("id") == "dic_area" and not self.body_closed:
+            self._body_at = at
+        if self._byline_at is None and tag == "span" and "byline_s" in classes and not self.byline_parts:
+            self._byline_at = at
+
+    def handle_endtag(self, tag):
+        if tag in _VOID_TAGS:
+            return
+        for at in range(len(self._stack) - 1, -1, -1):
+            if self._stack[at] == tag:
+                self._close_to(at)
+                return
+        # 열린 적 없는 닫는 태그는 무시
+
+    def _close_to(self, at: int) -> None:
+        del self._stack[at:]
+        if self._skip_at is not None and self._skip_at >= at:
+            self._skip_at = None
+        if self._body_at is not None and self._body_at >= at:
+            self._body_at = None
+            self.body_closed = True
+        if self._byline_at is not None and self._byline_at >= at:
+            self._byline_at = None
+
+    def handle_data(self, data):
+        if self._skip_at is not None:
+            return
+        # BeautifulSoup get_text(strip=True)와 같은 규칙: 조각마다 strip 후 이어 붙임
+        piece = data.strip()
+        if not piece:
+            return
+        if self._body_at is not None:
+            self.body_parts.append(piece)
+        if self._byline_at is not None:
+            self.byline_parts.append(piece)
+
+    @property
+    def byline(self) -> Optional[str]:
+        return " ".join(self.byline_parts) or None
+
+def extract_article(
+    url: str,
+    http_client: Optional[HTTPClient] = None,
+    max_bytes: int = settings.EXTRACT_MAX_BYTES,
+    timeout_seconds: float = settings.EXTRACT_TIMEOUT_SECONDS,
+    tail_bytes: int = 16 * 1024,
+    chunk_size: int = 16 * 1024
+) -> ArticleExtraction:
+    """
+    응답을 chunk 단위로 읽으며 증분 파싱하고, 본문이 닫힌 뒤 기자 정보를 찾거나
+    tail_bytes를 더 읽으면 나머지 다운로드를 중단합니다.
+
+    Returns:
+        ArticleExtraction: 본문/기자/입력 시각과 추출 상태
+    """
+    with metrics.span("extract") as span:
+        result = _stream_article(url, http_client, max_bytes, timeout_seconds, tail_bytes, chunk_size)
+        span.set(status=result.status, bytes_read=result.bytes_read)
+    metrics.inc("extract_total", status=result.status)
+    if metrics.enabled:
+        metrics.inc("extract_bytes_total", result.bytes_read)
+        metrics.observe("extract_page_bytes", result.bytes_read, buckets=SIZE_BUCKETS)
+    return result
+
+def _stream_article(
+    url: str,
+    http_client: Optional[HTTPClient],
+    max_bytes: int,
+    timeout_seconds: float,
+    tail_bytes: int,
+    chunk_size: int
+) -> ArticleExtraction:
+    http_client = http_client or get_default_http_client()
+    deadline = time.monotonic() + timeout_seconds
+    bytes_read = 0
+    parser = _NaverArticleParser()
+    try:
+        # 스트리밍을 지원하지 않는 HTTPClient는 받은 본문을 chunk로 잘라 같은 경로로 처리
+        if hasattr(http_client, "stream"):
+            response = http_client.stream(url, headers={"User-Agent": "Mozilla/5.0"})
+            chunks = response.iter_content(chunk_size=chunk_size)
+        else:
+            response = http_client.get(url, headers={"User-Agent": "Mozilla/5.0"})
+            content = response.content
+            chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+        try:
+            if response.status_code != 200:
+                return ArticleExtraction(url=url, status=STATUS_HTTP_ERROR, error=f"HTTP {response.status_code}")
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            body_closed_at: Optional[int] = None
+            for chunk in chunks:
+                bytes_read += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.body_closed:
+                    body_closed_at = body_closed_at or bytes_read
+                    if parser.byline_parts or bytes_read - body_closed_at >= tail_bytes:
+                        break
+                if bytes_read >= max_bytes:
+                    return _partial(url, parser, STATUS_TOO_LARGE, bytes_read)
+                if time.monotonic() > deadline:
+                    return _partial(url, parser, STATUS_TIMEOUT, bytes_read)
+        finally:
+            close = getattr(response, "close", None)
+            if close:
+                close()
+    except Exception as e:
+        return ArticleExtraction(url=url, status=STATUS_ERROR, bytes_read=bytes_read, error=str(e))
+
+    if not parser.body_parts:
+        return _partial(url, parser, STATUS_NOT_FOUND, bytes_read)
+    return _partial(url, parser, STATUS_OK, bytes_read)
+
+@dataclass
+class RawArticlePage:
+    """
+    파싱 전 원본 HTML (프로세스 풀로 넘길 때 사용). status는 다운로드 결과 (ok / too_large / timeout / http_error / error)
+    """
+    url: str
+    content: bytes = b""
+    encoding: Optional[str] = None
+    status: str = STATUS_OK
+    error: Optional[str] = None
+
+def fetch_article_html(
+    url: str,
+    http_client: Optional[HTTPClient] = None,
+    max_bytes: int = settings.EXTRACT_MAX_BYTES,
+    timeout_seconds: float = settings.EXTRACT_TIMEOUT_SECONDS,
+    chunk_size: int = 16 * 1024
+) -> RawArticlePage:
+    """
+    파싱하지 않고 원본 바이트만 받습니다. (본문은 parse_article_html로 다른 프로세스에서 추출)
+    """
+    http_client = http_client or get_default_http_client()
+    deadline = time.monotonic() + timeout_seconds
+    chunks: List[bytes] = []
+    bytes_read = 0
+    with metrics.span("extract.fetch"):
+        try:
+            if hasattr(http_client, "stream"):
+                response = http_client.stream(url, headers={"User-Agent": "Mozilla/5.0"})
+                body = response.iter_content(chunk_size=chunk_size)
+            else:
+                response = http_client.get(url, headers={"User-Agent": "Mozilla/5.0"})
+                body = (response.content,)
+            try:
+                if response.status_code != 200:
+                    return RawArticlePage(url=url, status=STATUS_HTTP_ERROR, error=f"HTTP {response.status_code}")
+                status = STATUS_OK
+                for chunk in body:
+                    chunks.append(chunk)
+                    bytes_read += len(chunk)
+                    if bytes_read >= max_bytes:
+                        status = STATUS_TOO_LARGE
+                        break
+                    if time.monotonic() > deadline:
+                        status = STATUS_TIMEOUT
+                        break
+            finally:
+                close = getattr(response, "close", None)
+                if close:
+                    close()
+        except Exception as e:
+            return RawArticlePage(url=url, status=STATUS_ERROR, error=str(e))
+    content = b"".join(chunks)[:max_bytes]
+    return RawArticlePage(url=url, content=content, encoding=response.encoding, status=status)
+
+def parse_article_html(page: RawArticlePage, tail_bytes: int = 16 * 1024, chunk_size: int = 16 * 1024) -> ArticleExtraction:
+    """
+    받아 둔 원본 HTML에서 본문/기자/입력 시각을 추출합니다. (_stream_article과 같은 규칙, 네트워크 없음)
+    """
+    if page.status not in (STATUS_OK, STATUS_TOO_LARGE, STATUS_TIMEOUT):
+        return ArticleExtraction(url=page.url, status=page.status, error=page.error)
+    parser = _NaverArticleParser()
+    decoder = codecs.getincrementaldecoder(page.encoding or "utf-8")(errors="replace")
+    content = page.content
+    body_closed_at: Optional[int] = None
+    bytes_read = 0
+    for start in range(0, len(content), chunk_size):
+        chunk = content[start:start + chunk_size]
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.body_closed:
+            body_closed_at = body_closed_at or bytes_read
+            if parser.byline_parts or bytes_read - body_closed_at >= tail_bytes:
+                break
+    if page.status != STATUS_OK:
+        return _partial(page.url, parser, page.status, len(content))
+    if not parser.body_parts:
+        return _partial(page.url, parser, STATUS_NOT_FOUND, len(content))
+    return _partial(page.url, parser, STATUS_OK, len(content))
+
+def _partial(url: str, parser: _NaverArticleParser, status: str, bytes_read: int) -> ArticleExtraction:
+    # 한도 초과로 끊긴 경우에도 본문이 이미 닫혔다면 성공으로 처리
+    if status in (STATUS_TOO_LARGE, STATUS_TIMEOUT) and parser.body_closed:
+        status = STATUS_OK
+    return ArticleExtraction(
+        url=url,
+        status=status,
+        text="".join(parser.body_parts) if status == STATUS_OK else "",
+        byline=parser.byline,
+        published_at=parser.published_at,
+        bytes_read=bytes_read,
+        error=None if status == STATUS_OK else status
+    )
@@ -0,0 +1,216 @@
+# 📦 장기 보관용 모델: 일주일치 기사/요약/용어 설명을 메모리에 들고 있거나 워커 프로세스 사이로 넘길 때 사용
+# - frozen + slots 데이터클래스 (인스턴스마다 __dict__ 없음, 키워드 목록은 튜플, 빈 목록은 공유)
+# - 카테고리와 키워드 문자열은 sys.intern으로 한 객체를 공유
+# - pack()/unpack(): 문자열 표를 앞에 두고 레코드는 uint32 인덱스 배열로만 적는 바이너리 형식
+#   (같은 키워드·카테고리·설명은 한 번만 저장, JSON/pickle보다 작고 외부 패키지 불필요)
+
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from crawler.naver_ranking_crawler import NewsArticle
+from summaries.news_summarizer import KeywordDetail, SummaryResult
+
+def _intern_all(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+@dataclass(frozen=True, slots=True)
+class CompactArticle:
+    title: str
+    link: str
+    category: str = "일반"
+    summary: str = ""
+    keywords: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_article(cls, article: NewsArticle) -> "CompactArticle":
+        return cls(
+            title=article.title,
+            link=article.link,
+            category=sys.intern(article.category),
+            summary=article.summary,
+            keywords=_intern_all(article.keywords)
+        )
+
+    def to_article(self) -> NewsArticle:
+        return NewsArticle(
+            title=self.title,
+            link=self.link,
+            category=self.category,
+            summary=self.summary,
+            keywords=list(self.keywords)
+        )
+
+@dataclass(frozen=True, slots=True)
+class CompactSummary:
+    summary: str
+    keywords: Tuple[str, ...] = ()
+    # (키워드, 설명) 쌍 — dict보다 작고 키워드가 몇 개뿐이라 순차 탐색으로 충분
+    keyword_details: Tuple[Tuple[str, KeywordDetail], ...] = ()
+
+    @classmethod
+    def from_result(cls, result: SummaryResult) -> "CompactSummary":
+        return cls(
+            summary=result.summary,
+            keywords=_intern_all(result.keywords),
+            keyword_details=tuple(
+                (sys.intern(keyword), detail) for keyword, detail in result.keyword_details.items()
+            )
+        )
+
+    def detail(self, keyword: str) -> Optional[KeywordDetail]:
+        for key, detail in self.keyword_details:
+            if key == keyword:
+                return detail
+        return None
+
+    def to_result(self) -> SummaryResult:
+        return SummaryResult(
+            summary=self.summary,
+            keywords=list(self.keywords),
+            keyword_details=dict(self.keyword_details)
+        )
+
+Packable = Union[NewsArticle, SummaryResult, KeywordDetail, CompactArticle, CompactSummary]
+
+_MAGIC = b"NBC1"
+# 매직, 문자열 수, 인덱스 수, UTF-8 바이트 수
+_HEADER = struct.Struct("<4sIII")
+# 인덱스/글자 수는 항상 리틀 엔디언 4바이트로 저장
+_UINT32_SIZE = struct.calcsize("<I")
+# array의 "I"/"L" 크기는 플랫폼마다 다르므로(C unsigned int / long) 실제로 4바이트인 타입 코드를 고름
+# 둘 다 아니면 struct로 한 번에 변환 (느리지만 형식은 같음)
+_UINT32_CODE = next((code for code in ("I", "L") if array(code).itemsize == _UINT32_SIZE), None)
+_TAG_ARTICLE = 1
+_TAG_SUMMARY = 2
+_TAG_DETAIL = 3
+
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def ref(self, value: str) -> int:
+        position = self.index.get(value)
+        if position is None:
+            position = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return position
+
+def _uint32_array(values: Iterable[int] = ()) -> Union[array, List[int]]:
+    return array(_UINT32_CODE, values) if _UINT32_CODE else list(values)
+
+def _little_endian(values: Union[array, List[int]]) -> bytes:
+    if not isinstance(values, array):
+        return struct.pack(f"<{len(values)}I", *values)
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(data: bytes) -> Union[array, Tuple[int, ...]]:
+    if not _UINT32_CODE:
+        return struct.unpack(f"<{len(data) // _UINT32_SIZE}I", data)
+    values = array(_UINT32_CODE)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def pack(items: Iterable[Packable]) -> bytes:
+    """
+    기사/요약/용어 설명 목록을 한 덩어리 bytes로 직렬화합니다. unpack()은 Compact* 객체(KeywordDetail은 그대로)를 돌려줍니다.
+    """
+    table = _StringTable()
+    ref = table.ref
+    ints = _uint32_array()
+    append = ints.append
+    for item in items:
+        if isinstance(item, (NewsArticle, CompactArticle)):
+            ints.extend((_TAG_ARTICLE, ref(item.title), ref(item.link), ref(item.category), ref(item.summary), len(item.keywords)))
+            ints.extend(ref(keyword) for keyword in item.keywords)
+        elif isinstance(item, (SummaryResult, CompactSummary)):
+            details = item.keyword_details.items() if isinstance(item, SummaryResult) else item.keyword_details
+            ints.extend((_TAG_SUMMARY, ref(item.summary), len(item.keywords)))
+            ints.extend(ref(keyword) for keyword in item.keywords)
+            append(len(details))
+            for keyword, detail in details:
+                ints.extend((ref(keyword), ref(detail.explanation), ref(detail.example)))
+        elif isinstance(item, KeywordDetail):
+            ints.extend((_TAG_DETAIL, ref(item.explanation), ref(item.example)))
+        else:
+            raise TypeError(f"직렬화할 수 없는 타입입니다: {type(item).__name__}")
+
+    # 문자열은 글자 수만 적고 한 번에 인코딩/디코딩한 뒤 잘라 씀
+    lengths = _uint32_array(map(len, table.strings))
+    blob = "".join(table.strings).encode("utf-8")
+    return b"".join((
+        _HEADER.pack(_MAGIC, len(table.strings), len(ints), len(blob)),
+        _little_endian(lengths),
+        _little_endian(ints),
+        blob,
+    ))
+
+def unpack(data: bytes) -> List[Union[CompactArticle, CompactSummary, KeywordDetail]]:
+    magic, string_count, int_count, blob_size = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("알 수 없는 직렬화 형식입니다.")
+    offset = _HEADER.size
+    lengths = _from_little_endian(data[offset:offset + string_count * _UINT32_SIZE])
+    offset += string_count * _UINT32_SIZE
+    ints = _from_little_endian(data[offset:offset + int_count * _UINT32_SIZE])
+    offset += int_count * _UINT32_SIZE
+    text = data[offset:offset + blob_size].decode("utf-8")
+
+    strings: List[str] = []
+    position = 0
+    for length in lengths:
+        strings.append(text[position:position + length])
+        position += length
+    # 문자열 표의 항목은 여러 레코드가 공유하므로 한 번만 intern
+    strings = [sys.intern(value) if len(value) <= 64 else value for value in strings]
+
+    items: List[Union[CompactArticle, CompactSummary, KeywordDetail]] = []
+    details: Dict[Tuple[int, int], KeywordDetail] = {}
+    i = 0
+    while i < int_count:
+        tag = ints[i]
+        if tag == _TAG_ARTICLE:
+            keyword_count = ints[i + 5]
+            end = i + 6 + keyword_count
+            items.append(CompactArticle(
+                title=strings[ints[i + 1]],
+                link=strings[ints[i + 2]],
+                category=strings[ints[i + 3]],
+                summary=strings[ints[i + 4]],
+                keywords=tuple(strings[j] for j in ints[i + 6:end])
+            ))
+            i = end
+        elif tag == _TAG_SUMMARY:
+            summary = strings[ints[i + 1]]
+            keyword_count = ints[i + 2]
+            keywords = tuple(strings[j] for j in ints[i + 3:i + 3 + keyword_count])
+            i += 3 + keyword_count
+            detail_count = ints[i]
+            i += 1
+            pairs = []
+            for _ in range(detail_count):
+                key = (ints[i + 1], ints[i + 2])
+                detail = details.get(key)
+                if detail is None:
+                    detail = details[key] = KeywordDetail(explanation=strings[key[0]], example=strings[key[1]])
+                pairs.append((strings[ints[i]], detail))
+                i += 3
+            items.append(CompactSummary(summary=summary, keywords=keywords, keyword_details=tuple(pairs)))
+        elif tag == _TAG_DETAIL:
+            key = (ints[i + 1], ints[i + 2])
+            detail = details.get(key)
+            if detail is None:
+                detail = details[key] = KeywordDetail(explanation=strings[key[0]], example=strings[key[1]])
+            items.append(detail)
+            i += 3
+        else:
+            raise ValueError(f"알 수 없는 레코드 태그입니다: {tag}")
+    return items
@@ -0,0 +1,119 @@
+# 📦 보조 기능: 교체 가능한 HTML 파서 백엔드
+# - selectolax(lexbor) / lxml 이 설치되어 있으면 빠른 경로 사용
+# - BeautifulSoup은 SoupStrainer로 대상 하위 트리만 파싱 (기존 html.parser는 그대로 fallback)
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Protocol
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    import cssselect  # noqa: F401  (lxml의 .cssselect()에 필요)
+except ImportError:
+    lxml = None
+
+@dataclass
+class ParsedNode:
+    text: str
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+@dataclass
+class ParseScope:
+    """
+    셀렉터 결과가 들어 있는 하위 트리 힌트 (SoupStrainer 부분 파싱용, 빠른 백엔드는 무시)
+    """
+    name: Optional[str] = None
+    attrs: Dict[str, str] = field(default_factory=dict)
+
+class HTMLParserBackend(Protocol):
+    name: str
+
+    def select(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> List[ParsedNode]:
+        ...
+
+    def select_one(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> Optional[ParsedNode]:
+        ...
+
+class SoupParser:
+    def __init__(self, features: str = "html.parser", use_strainer: bool = True):
+        self.features = features
+        self.use_strainer = use_strainer
+        self.name = f"bs4-{features}" + ("+strainer" if use_strainer else "")
+
+    def _parse(self, html: str, scope: Optional[ParseScope]) -> BeautifulSoup:
+        if self.use_strainer and scope is not None:
+            strainer = SoupStrainer(scope.name, attrs=scope.attrs)
+            return BeautifulSoup(html, self.features, parse_only=strainer)
+        return BeautifulSoup(html, self.features)
+
+    def select(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> List[ParsedNode]:
+        soup = self._parse(html, scope)
+        return [_soup_node(tag) for tag in soup.select(selector)]
+
+    def select_one(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> Optional[ParsedNode]:
+        tag = self._parse(html, scope).select_one(selector)
+        return _soup_node(tag) if tag is not None else None
+
+def _soup_node(tag) -> ParsedNode:
+    attrs = {key: " ".join(value) if isinstance(value, list) else value for key, value in tag.attrs.items()}
+    return ParsedNode(text=tag.get_text(strip=True), attrs=attrs)
+
+class SelectolaxParser:
+    name = "selectolax"
+
+    def select(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> List[ParsedNode]:
+        tree = LexborHTMLParser(html)
+        return [_selectolax_node(node) for node in tree.css(selector)]
+
+    def select_one(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> Optional[ParsedNode]:
+        node = LexborHTMLParser(html).css_first(selector)
+        return _selectolax_node(node) if node is not None else None
+
+def _selectolax_node(node) -> ParsedNode:
+    attrs = {key: value or "" for key, value in node.attributes.items()}
+    return ParsedNode(text=node.text(strip=True), attrs=attrs)
+
+class LxmlParser:
+    name = "lxml"
+
+    def select(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> List[ParsedNode]:
+        root = lxml.html.document_fromstring(html)
+        return [_lxml_node(element) for element in root.cssselect(selector)]
+
+    def select_one(self, html: str, selector: str, scope: Optional[ParseScope] = None) -> Optional[ParsedNode]:
+        nodes = self.select(html, selector, scope)
+        return nodes[0] if nodes else None
+
+def _lxml_node(element) -> ParsedNode:
+    # BeautifulSoup get_text(strip=True)와 같은 규칙: 텍스트 조각을 각각 strip 후 이어 붙임
+    text = "".join(piece.strip() for piece in element.itertext())
+    return ParsedNode(text=text, attrs=dict(element.attrib))
+
+def available_parsers() -> List[HTMLParserBackend]:
+    parsers: List[HTMLParserBackend] = []
+    if LexborHTMLParser is not None:
+        parsers.append(SelectolaxParser())
+    if lxml is not None:
+        parsers.append(LxmlParser())
+    parsers.append(SoupParser())
+    parsers.append(SoupParser(use_strainer=False))
+    return parsers
+
+def get_parser(name: str = "auto") -> HTMLParserBackend:
+    """
+    name: "auto" | "selectolax" | "lxml" | "bs4" (SoupStrainer) | "bs4-full" (기존 방식)
+    설치되지 않은 백엔드를 고르면 BeautifulSoup으로 대체합니다.
+    """
+    if name in ("auto", "selectolax") and LexborHTMLParser is not None:
+        return SelectolaxParser()
+    if name in ("auto", "lxml") and lxml is not None:
+        return LxmlParser()
+    if name == "bs4-full":
+        return SoupParser(use_strainer=False)
+    return SoupParser()
@@ -0,0 +1,131 @@
+# 📦 보조 기능: 공유 HTTP 전송 계층
+# - 크롤러/본문 추출기(requests)와 카카오 발송기(aiohttp)가 연결을 재사용하도록 풀링
+# - 호스트별 연결 수 제한, keep-alive, 타임아웃, DNS 캐시
+# - 설정마다 적용되는 쪽이 다름: 전체 연결 수 상한과 DNS 캐시는 aiohttp에만 있음 (requests/urllib3에는 해당 기능이 없음)
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+@dataclass
+class HTTPTransportConfig:
+    # aiohttp 전용: 모든 호스트를 합친 동시 연결 수 상한 (requests에는 전체 상한이 없음)
+    total_connections: int = 32
+    # 공통: 호스트 하나당 연결 수 (requests는 호스트별 풀 크기 pool_maxsize, aiohttp는 limit_per_host)
+    connections_per_host: int = 8
+    # requests 전용: 호스트별 풀을 몇 개까지 캐시할지 (pool_connections, 넘으면 오래된 호스트 풀부터 닫음)
+    host_pools: int = 16
+    # 요청 하나의 기본 타임아웃 (requests는 읽기 타임아웃, aiohttp는 request_timeout()으로 요청마다 지정)
+    timeout_seconds: float = 10.0
+    connect_timeout_seconds: float = 3.0
+    keepalive_seconds: float = 30.0
+    # aiohttp 전용: DNS 조회 결과 캐시 시간 (requests는 keep-alive 연결 재사용으로만 DNS 조회를 줄임)
+    dns_cache_seconds: int = 300
+
+    @classmethod
+    def from_settings(cls, settings) -> "HTTPTransportConfig":
+        return cls(
+            total_connections=settings.HTTP_TOTAL_CONNECTIONS,
+            connections_per_host=settings.HTTP_CONNECTIONS_PER_HOST,
+            host_pools=settings.HTTP_HOST_POOLS,
+            timeout_seconds=settings.HTTP_TIMEOUT_SECONDS,
+            dns_cache_seconds=settings.HTTP_DNS_CACHE_SECONDS,
+        )
+
+class PooledHTTPClient:
+    """
+    requests.Session 기반 HTTPClient 구현 (호스트별 커넥션 풀 + keep-alive)
+    연결이 재사용되므로 같은 호스트에 대한 DNS 조회/TLS 핸드셰이크는 처음 한 번만 발생합니다.
+    """
+    def __init__(self, config: Optional[HTTPTransportConfig] = None):
+        self.config = config or HTTPTransportConfig()
+        self.session = requests.Session()
+        # pool_connections는 연결 수가 아니라 캐시할 호스트별 풀의 개수
+        adapter = HTTPAdapter(
+            pool_connections=self.config.host_pools,
+            pool_maxsize=self.config.connections_per_host
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def timeout(self) -> tuple:
+        return (self.config.connect_timeout_seconds, self.config.timeout_seconds)
+
+    def get(self, url: str, headers: dict) -> requests.Response:
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def stream(self, url: str, headers: dict) -> requests.Response:
+        # 본문을 미리 받지 않는 응답 (iter_content로 읽고 close()로 연결 반환)
+        return self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "PooledHTTPClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+@lru_cache()
+def get_default_http_client() -> PooledHTTPClient:
+    return PooledHTTPClient()
+
+class AsyncHTTPTransport:
+    """
+    aiohttp.ClientSession 하나를 공유하는 비동기 전송 계층
+    세션은 실행 중인 이벤트 루프 안에서 처음 사용할 때 만들어지고, close()로 정리합니다.
+    세션에는 연결 타임아웃만 두고, 전체 타임아웃은 요청마다 request_timeout()으로 지정합니다.
+    (카카오 발송과 OpenAI 요약이 같은 세션을 써도 각자의 타임아웃이 적용되도록)
+    """
+    def __init__(self, config: Optional[HTTPTransportConfig] = None):
+        self.config = config or HTTPTransportConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.total_connections,
+                limit_per_host=self.config.connections_per_host,
+                ttl_dns_cache=self.config.dns_cache_seconds,
+                keepalive_timeout=self.config.keepalive_seconds
+            )
+            timeout = aiohttp.ClientTimeout(total=None, connect=self.config.connect_timeout_seconds)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+def request_timeout(transport: Optional[AsyncHTTPTransport], total_seconds: Optional[float] = None) -> aiohttp.ClientTimeout:
+    """
+    session.post(..., timeout=...)에 넘길 요청별 타임아웃 (total_seconds를 비우면 transport 설정의 timeout_seconds)
+    """
+    config = transport.config if transport is not None else HTTPTransportConfig()
+    total = config.timeout_seconds if total_seconds is None else total_seconds
+    return aiohttp.ClientTimeout(total=total, connect=config.connect_timeout_seconds)
+
+@asynccontextmanager
+async def session_scope(transport: Optional[AsyncHTTPTransport]) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    공유 transport가 있으면 그 세션을 빌려주고, 없으면 일회용 세션을 열고 닫습니다.
+    """
+    if transport is not None:
+        yield await transport.session()
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
@@ -0,0 +1,316 @@
+# 📦 계측: 단계별 구간(span) 시간, 카운터, 히스토그램을 모아 Prometheus 텍스트와 JSON 실행 보고서로 내보냄
+# - METRICS_ENABLED=False(기본)이면 모든 기록 함수가 첫 줄에서 반환하고 span은 공유 no-op 객체를 돌려줌
+# - span의 부모 관계는 contextvars로 추적 (asyncio 태스크, asyncio.to_thread로 넘어가도 유지)
+
+import bisect
+import contextvars
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import settings
+
+# 초 단위 지연 시간용 기본 구간
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 바이트/토큰 수처럼 큰 값용 구간
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+_current_span: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("current_span", default=None)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(labels: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        f'{name}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+def _format_value(value: float) -> str:
+    # 정수는 정수 그대로, 실수는 유효 숫자를 잃지 않도록 repr (f"{value:g}"는 6자리에서 잘림)
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+@dataclass
+class Histogram:
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+    def __post_init__(self):
+        self.counts = self.counts or [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        # 구간 안에서 선형 보간한 근사값 (Prometheus histogram_quantile과 같은 방식)
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(value, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set(self, **attrs) -> None:
+        return None
+
+_NOOP_SPAN = _NoopSpan()
+
+class Span:
+    __slots__ = ("registry", "name", "attrs", "span_id", "parent_id", "started", "_token")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, attrs: Dict[str, object]):
+        self.registry = registry
+        self.name = name
+        self.attrs = attrs
+        self.span_id = next(registry._span_ids)
+        self.parent_id: Optional[int] = None
+        self.started = 0.0
+
+    def __enter__(self) -> "Span":
+        self.parent_id = _current_span.get()
+        self._token = _current_span.set(self.span_id)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self.started
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.registry._finish_span(self, duration)
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+class MetricsRegistry:
+    """
+    프로세스 전역 계측 저장소. 크롤링 스레드와 이벤트 루프에서 함께 쓰므로 기록은 잠금 안에서 합니다.
+    """
+    def __init__(self, enabled: bool = False, namespace: str = "newsbot", max_spans: int = 10000):
+        self.enabled = enabled
+        self.namespace = namespace
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._span_ids = count(1)
+        self.reset()
+
+    def reset(self) -> None:
+        self.started_at = time.time()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._spans: List[dict] = []
+        self.dropped_spans = 0
+
+    def span(self, name: str, **attrs):
+        """
+        with metrics.span("summarize", model="gpt-3.5-turbo"): ...
+        끝나면 {namespace}_stage_seconds{stage=name} 히스토그램에 걸린 시간을 기록합니다.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attrs)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(self._metric_name(name), {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS, **labels) -> None:
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(self._metric_name(name), {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(tuple(buckets))
+            histogram.observe(value)
+
+    def _metric_name(self, name: str) -> str:
+        return f"{self.namespace}_{name}"
+
+    def _finish_span(self, span: Span, duration: float) -> None:
+        self.observe("stage_seconds", duration, stage=span.name)
+        record = {
+            "id": span.span_id,
+            "parent": span.parent_id,
+            "name": span.name,
+            "start": round(span.started, 6),
+            "duration_ms": round(duration * 1000, 3),
+        }
+        if span.attrs:
+            record["attrs"] = {key: value if isinstance(value, (int, float, bool)) else str(value) for key, value in span.attrs.items()}
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(record)
+            else:
+                self.dropped_spans += 1
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for upper, bucket_count in zip(histogram.buckets, histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{_format_labels(labels, [('le', _format_value(upper))])} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def report(self) -> dict:
+        """
+        JSON 실행 보고서: 카운터, 히스토그램 요약(p50/p95), span 목록
+        """
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "duration_seconds": round(time.time() - self.started_at, 3),
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for name, series in sorted(self._counters.items())
+                    for labels, value in sorted(series.items())
+                ],
+                "histograms": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": round(histogram.sum, 6),
+                        "min": histogram.min,
+                        "max": histogram.max,
+                        "p50": round(histogram.quantile(0.5), 6),
+                        "p95": round(histogram.quantile(0.95), 6),
+                    }
+                    for name, series in sorted(self._histograms.items())
+                    for labels, histogram in sorted(series.items())
+                ],
+                "spans": list(self._spans),
+                "dropped_spans": self.dropped_spans,
+            }
+
+    def state(self) -> dict:
+        """
+        다른 프로세스로 넘길 수 있는(pickle 가능한) 기록 사본. 받는 쪽에서 merge()로 합칩니다.
+        """
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "counters": {name: dict(series) for name, series in self._counters.items()},
+                "histograms": {
+                    name: {
+                        labels: Histogram(h.buckets, list(h.counts), h.count, h.sum, h.min, h.max)
+                        for labels, h in series.items()
+                    }
+                    for name, series in self._histograms.items()
+                },
+                "spans": list(self._spans),
+                "dropped_spans": self.dropped_spans,
+            }
+
+    def merge(self, state: dict) -> None:
+        """
+        워커 프로세스의 state()를 더합니다. span에는 어느 프로세스의 것인지 process 필드를 붙입니다. (span ID는 프로세스마다 따로 매김)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, series in state["counters"].items():
+                merged = self._counters.setdefault(name, {})
+                for labels, value in series.items():
+                    merged[labels] = merged.get(labels, 0) + value
+            for name, series in state["histograms"].items():
+                merged_series = self._histograms.setdefault(name, {})
+                for labels, other in series.items():
+                    histogram = merged_series.get(labels)
+                    if histogram is None:
+                        merged_series[labels] = other
+                        continue
+                    if histogram.buckets != other.buckets:
+                        continue
+                    histogram.counts = [a + b for a, b in zip(histogram.counts, other.counts)]
+                    histogram.count += other.count
+                    histogram.sum += other.sum
+                    histogram.min = min(histogram.min, other.min)
+                    histogram.max = max(histogram.max, other.max)
+            room = max(0, self.max_spans - len(self._spans))
+            spans = state["spans"]
+            self._spans.extend(dict(span, process=state["pid"]) for span in spans[:room])
+            self.dropped_spans += state["dropped_spans"] + max(0, len(spans) - room)
+
+    def export(
+        self,
+        report_path: str = settings.METRICS_REPORT_PATH,
+        prometheus_path: str = settings.METRICS_PROMETHEUS_PATH
+    ) -> None:
+        """
+        실행 보고서와 Prometheus 텍스트를 한 번에 씀 (꺼져 있으면 아무것도 하지 않음)
+        스케줄러 서버는 프로세스가 계속 살아 있으므로 작업이 끝날 때마다 불러 누적값을 덮어씀
+        """
+        if not self.enabled:
+            return
+        self.write_report(report_path)
+        self.write_prometheus(prometheus_path)
+
+    def write_report(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        print(f"[계측] 실행 보고서 저장: {path}")
+
+    def write_prometheus(self, path: str) -> None:
+        # node_exporter textfile collector 등이 읽을 수 있도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+# 프로세스 전역 인스턴스 (각 모듈에서 from utils.metrics import metrics)
+metrics = MetricsRegistry(enabled=settings.METRICS_ENABLED, max_spans=settings.METRICS_MAX_SPANS)
@@ -0,0 +1,175 @@
+# 📦 파싱 전용 프로세스 풀: 순수 파이썬 HTML 파싱(CPU 작업)을 이벤트 루프/GIL 밖으로 옮김
+# - 다운로드는 지금처럼 스레드에서, 파싱은 원본 바이트만 워커 프로세스로 보내고 추출한 본문/메타데이터만 돌려받음
+# - 워커 프로세스는 한 번 띄워 계속 재사용 (시작할 때 파서 모듈을 미리 import)
+# - 작은 페이지는 여러 개를 한 작업으로 묶어 보내 IPC(피클링/파이프) 비용을 나눔
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Sequence, Set, Tuple
+
+from config import settings
+from crawler.naver_ranking_crawler import RANKING_SCOPE, RANKING_SELECTOR
+from utils.article_extractor import ArticleExtraction, RawArticlePage, parse_article_html
+from utils.html_parser import get_parser
+from utils.metrics import metrics
+
+# 워커 프로세스 안에서 재사용하는 랭킹 파서 (initializer에서 생성)
+_ranking_parser = None
+
+def _warm_up(parser_backend: str) -> None:
+    global _ranking_parser
+    _ranking_parser = get_parser(parser_backend)
+
+def _parse_article_batch(pages: List[RawArticlePage]) -> List[ArticleExtraction]:
+    return [parse_article_html(page) for page in pages]
+
+def _parse_ranking_batch(pages: List[str]) -> List[List[Tuple[str, str]]]:
+    parser = _ranking_parser or get_parser(settings.HTML_PARSER_BACKEND)
+    return [
+        [(node.text, node.attrs.get("href", "")) for node in parser.select(html, RANKING_SELECTOR, scope=RANKING_SCOPE)]
+        for html in pages
+    ]
+
+def make_batches(sizes: Sequence[int], batch_size: int, batch_bytes: int) -> List[List[int]]:
+    """
+    페이지 크기 목록을 순서대로 묶은 인덱스 묶음. 묶음 하나는 batch_size개 또는 batch_bytes 이하 (큰 페이지는 혼자)
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_bytes = 0
+    for index, size in enumerate(sizes):
+        if current and (len(current) >= batch_size or current_bytes + size > batch_bytes):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(index)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+class ParseExecutor:
+    """
+    max_workers=0이면 프로세스 없이 호출한 스레드에서 바로 파싱 (프로세스를 띄울 수 없는 환경/디버깅용)
+    """
+    def __init__(
+        self,
+        max_workers: Optional[int] = settings.PARSE_WORKERS,
+        batch_size: int = settings.PARSE_BATCH_SIZE,
+        batch_bytes: int = settings.PARSE_BATCH_BYTES,
+        linger_seconds: float = settings.PARSE_BATCH_LINGER_SECONDS,
+        parser_backend: str = settings.HTML_PARSER_BACKEND
+    ):
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.linger_seconds = linger_seconds
+        self.parser_backend = parser_backend
+        self._pool: Optional[Executor] = None
+        self._pending: List[Tuple[RawArticlePage, asyncio.Future]] = []
+        self._pending_bytes = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 실행 중인 배치 태스크 (참조를 잡아 두지 않으면 GC될 수 있음)
+        self._dispatching: Set[asyncio.Task] = set()
+
+    @property
+    def pool(self) -> Optional[Executor]:
+        # 처음 쓸 때 한 번만 생성. 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+        if self._pool is None and self.max_workers > 0:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up,
+                initargs=(self.parser_backend,)
+            )
+        return self._pool
+
+    def start(self) -> "ParseExecutor":
+        """
+        워커 프로세스를 미리 띄움 (첫 배치가 프로세스 시작 시간을 기다리지 않도록)
+        """
+        if self.pool is not None:
+            list(self.pool.map(_warm_up, [self.parser_backend] * self.max_workers))
+        return self
+
+    def parse_articles(self, pages: Sequence[RawArticlePage]) -> List[ArticleExtraction]:
+        batches = make_batches([len(page.content) for page in pages], self.batch_size, self.batch_bytes)
+        groups = [[pages[i] for i in batch] for batch in batches]
+        with metrics.span("extract.parse", parser="process-pool", pages=len(pages), batches=len(groups)):
+            if self.pool is None:
+                parsed = map(_parse_article_batch, groups)
+            else:
+                parsed = self.pool.map(_parse_article_batch, groups)
+            return [result for group in parsed for result in group]
+
+    def parse_rankings(self, pages: Sequence[str]) -> List[List[Tuple[str, str]]]:
+        """
+        랭킹 페이지마다 (제목, 링크) 목록
+        """
+        batches = make_batches([len(html) for html in pages], self.batch_size, self.batch_bytes)
+        groups = [[pages[i] for i in batch] for batch in batches]
+        if self.pool is None:
+            parsed = map(_parse_ranking_batch, groups)
+        else:
+            parsed = self.pool.map(_parse_ranking_batch, groups)
+        return [result for group in parsed for result in group]
+
+    async def parse_article(self, page: RawArticlePage) -> ArticleExtraction:
+        """
+        이벤트 루프용: 요청을 linger_seconds 동안 모았다가(또는 묶음이 차면) 한 작업으로 워커에 보냄
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((page, future))
+        self._pending_bytes += len(page.content)
+        if len(self._pending) >= self.batch_size or self._pending_bytes >= self.batch_bytes:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.linger_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch: List[Tuple[RawArticlePage, asyncio.Future]]) -> None:
+        pages = [page for page, _ in batch]
+        metrics.observe("parse_batch_pages", len(pages), buckets=(1, 2, 4, 8, 16, 32, 64))
+        try:
+            with metrics.span("extract.parse", parser="process-pool", pages=len(pages)):
+                results = await asyncio.get_running_loop().run_in_executor(self.pool, _parse_article_batch, pages)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> "ParseExecutor":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# 사용 예시
+if __name__ == "__main__":
+    from benchmarks.fixtures import article_page
+
+    pages = [RawArticlePage(url=f"https://n.news.naver.com/article/052/{i}", content=article_page(seed=i).encode("utf-8")) for i in range(8)]
+    with ParseExecutor(max_workers=2) as executor:
+        for result in executor.parse_articles(pages):
+            print(result.status, result.byline, result.text[:40])
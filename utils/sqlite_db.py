@@ -0,0 +1,25 @@
+# 📦 보조 기능: DATABASE_URL(sqlite:///...)로 sqlite3 연결 열기
+
+import sqlite3
+from typing import Optional
+
+from config import settings
+
+def sqlite_path_from_url(url: str) -> str:
+    """
+    "sqlite:///./news_bot.db" → "./news_bot.db", "sqlite://" / "sqlite:///:memory:" → ":memory:"
+    """
+    if not url.startswith("sqlite:"):
+        raise ValueError(f"sqlite URL만 지원합니다: {url}")
+    # SQLAlchemy와 같은 규칙: sqlite:///상대경로, sqlite:////절대경로
+    path = url[len("sqlite:///"):] if url.startswith("sqlite:///") else ""
+    return path or ":memory:"
+
+def connect(url: Optional[str] = None) -> sqlite3.Connection:
+    # 파이프라인이 여러 스레드에서 같은 연결을 쓰므로 check_same_thread=False (호출 측에서 Lock으로 보호)
+    path = sqlite_path_from_url(url or settings.DATABASE_URL)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    if path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn